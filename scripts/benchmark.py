@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the markdown pipeline.
+
+Times each stage of the markdown -> HTML pipeline (markdown_to_blocks,
+block_to_block_type, lex_block, text_to_textnodes,
+split_nodes_delimiter, split_nodes_image/_link, extract_markdown_*,
+markdown_to_html_node, HTMLNode.to_html, markdown_to_html) on representative and adversarial
+inputs, using timeit with a warmup and several repeats. The best repeat is
+kept: on a shared machine, noise only ever makes a run slower.
+
+Results are compared against scripts/benchmark_baseline.json. Raw seconds
+do not travel between machines, so every run also times a fixed
+pure-Python calibration loop and the comparison is made on the ratio to
+it, not on absolute time.
+
+    python3 scripts/benchmark.py                  # print timings vs baseline
+    python3 scripts/benchmark.py --save-baseline  # record a new baseline
+    python3 scripts/benchmark.py --check          # exit 1 on a regression
+    python3 scripts/run_tests.py --bench          # tests, then the same gate
+"""
+import argparse
+import json
+import math
+import platform
+import sys
+import timeit
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).resolve().parent / "benchmark_baseline.json"
+BASELINE_VERSION = 1
+
+# A stage may be this much slower than its baseline (relative to the
+# calibration loop) before --check calls it a regression.
+DEFAULT_TOLERANCE = 0.50
+WARMUP_CALLS = 3
+REPEATS = 5
+# Each repeat runs the case enough times to take at least this long, so
+# timer resolution and call overhead stay in the noise.
+MIN_REPEAT_SECONDS = 0.02
+
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from block_to_html import inline_cache, inline_html_cache, markdown_to_html, markdown_to_html_node  # noqa: E402
+from block_types import block_to_block_type, lex_block  # noqa: E402
+from extract_markdown import extract_markdown_images, extract_markdown_links  # noqa: E402
+from markdown_to_blocks import markdown_to_blocks  # noqa: E402
+from split_images_and_links import split_nodes_image, split_nodes_link  # noqa: E402
+from split_nodes import split_nodes_delimiter  # noqa: E402
+from text_to_textnodes import text_to_textnodes  # noqa: E402
+from textnode import TextNode, TextType  # noqa: E402
+
+
+# --- inputs ---------------------------------------------------------------
+
+def _sentence(i):
+    return (
+        f"Sentence {i} has **bold text**, some _italic words_, a `code_span()` "
+        f"and a [link {i}](https://example.com/posts/{i}_{i}) in it."
+    )
+
+
+def _long_paragraph(sentences=400):
+    return " ".join(_sentence(i) for i in range(sentences))
+
+
+def _link_heavy(links=500):
+    parts = []
+    for i in range(links):
+        parts.append(f"see [docs {i}](https://example.com/a_{i}/b?c={i})")
+        if i % 5 == 0:
+            parts.append(f"![shot {i}](./images/shot_{i}.png)")
+    return " and ".join(parts)
+
+
+def _snake_case_prose(words=2000):
+    # Adversarial for the _ and * passes: underscores everywhere, no emphasis.
+    return " ".join(f"call_{i}_func(arg_{i}) * 2" for i in range(words // 4))
+
+
+def _nested_list(depth=12, breadth=40):
+    lines = []
+    for i in range(breadth):
+        for level in range(depth):
+            lines.append(f"{'  ' * level}- item {i}.{level} with **bold** and `code`")
+    return "\n".join(lines)
+
+
+def _code_block(lines=5000):
+    body = "\n".join(f"    value_{i} = compute(**kwargs)  # [not](a link) *or* _emphasis_" for i in range(lines))
+    return f"```python\n{body}\n```"
+
+
+def _blog_post():
+    # A typical diary post: headings, prose, a list, a quote and some code.
+    sections = []
+    for s in range(8):
+        sections.append(f"## Section {s}\n")
+        sections.append(" ".join(_sentence(s * 10 + i) for i in range(6)) + "\n")
+        sections.append("\n".join(f"- point {i} about `thing_{i}`" for i in range(5)) + "\n")
+        sections.append(f"> A quote with *emphasis* number {s}\n")
+        sections.append("```bash\nls -la\necho done\n```\n")
+    return "# A Blog Post\n\n" + "\n".join(sections)
+
+
+def _document(paragraph):
+    return f"# Title\n\n{paragraph}\n"
+
+
+INPUTS = {
+    "blog_post": _blog_post(),
+    "long_paragraph": _long_paragraph(),
+    "link_heavy": _link_heavy(),
+    "snake_case": _snake_case_prose(),
+    "nested_list": _nested_list(),
+    "code_block": _code_block(),
+}
+
+
+# --- cases ----------------------------------------------------------------
+
+def text_to_textnodes_multipass(text):
+    """The seven-pass pipeline text_to_textnodes() replaced, kept as the
+    reference it is tested and benchmarked against. Raises ValueError for
+    an unbalanced `, ** or __."""
+    nodes = [TextNode(text, TextType.PLAIN_TEXT)]
+    # CODE FIRST - to protect content like Req_bot from delimiter processing
+    nodes = split_nodes_delimiter(nodes, "`", TextType.CODE_TEXT)
+    # images and links NEXT (before delimiters, to avoid processing underscores in URLs)
+    nodes = split_nodes_image(nodes)
+    nodes = split_nodes_link(nodes)
+    # bold next (both ** and __)
+    nodes = split_nodes_delimiter(nodes, "**", TextType.BOLD_TEXT)
+    nodes = split_nodes_delimiter(nodes, "__", TextType.BOLD_TEXT)
+    # italic last (both * and _)
+    nodes = split_nodes_delimiter(nodes, "*", TextType.ITALIC_TEXT)
+    nodes = split_nodes_delimiter(nodes, "_", TextType.ITALIC_TEXT)
+    return nodes
+
+
+def _plain(text):
+    return [TextNode(text, TextType.PLAIN_TEXT)]
+
+
+def _cases():
+    """{case name: zero-argument callable}. Inputs are prepared up front so
+    only the stage itself is timed."""
+    cases = {}
+    docs = {
+        "blog_post": INPUTS["blog_post"],
+        "long_paragraph": _document(INPUTS["long_paragraph"]),
+        "link_heavy": _document(INPUTS["link_heavy"]),
+        "nested_list": _document(INPUTS["nested_list"]),
+        "code_block": _document(INPUTS["code_block"]),
+    }
+    for name, doc in docs.items():
+        cases[f"markdown_to_blocks/{name}"] = lambda doc=doc: markdown_to_blocks(doc)
+        cases[f"markdown_to_html_node/{name}"] = lambda doc=doc: markdown_to_html_node(doc)
+        tree = markdown_to_html_node(doc)
+        # The direct path, against markdown_to_html_node + to_html
+        cases[f"markdown_to_html/{name}"] = lambda doc=doc: markdown_to_html(doc)
+        cases[f"to_html/{name}"] = tree.to_html
+
+    for name in ("long_paragraph", "link_heavy", "snake_case"):
+        text = INPUTS[name]
+        cases[f"text_to_textnodes/{name}"] = lambda text=text: text_to_textnodes(text)
+        # The seven-pass pipeline it replaced, for comparison
+        cases[f"text_to_textnodes_multipass/{name}"] = lambda text=text: text_to_textnodes_multipass(text)
+        cases[f"split_nodes_delimiter/{name}"] = (
+            lambda text=text: split_nodes_delimiter(_plain(text), "_", TextType.ITALIC_TEXT)
+        )
+
+    # Per-line regex work: many small calls, where per-call overhead shows.
+    for name in ("blog_post", "nested_list"):
+        blocks = markdown_to_blocks(docs[name])
+        cases[f"block_to_block_type/{name}"] = lambda blocks=blocks: [block_to_block_type(b) for b in blocks]
+        cases[f"lex_block/{name}"] = lambda blocks=blocks: [lex_block(b) for b in blocks]
+
+    for name in ("long_paragraph", "link_heavy"):
+        text = INPUTS[name]
+        cases[f"extract_markdown/{name}"] = (
+            lambda text=text: extract_markdown_images(text) + extract_markdown_links(text)
+        )
+        nodes = _plain(text)
+        cases[f"split_nodes_image/{name}"] = lambda nodes=nodes: split_nodes_image(nodes)
+        cases[f"split_nodes_link/{name}"] = lambda nodes=nodes: split_nodes_link(nodes)
+
+    # The same regex work on 2000 one-line inputs: mostly per-call overhead.
+    lines = [f"item_{i} _here_ see [l](u_{i})" for i in range(2000)]
+    short_nodes = [TextNode(line, TextType.PLAIN_TEXT) for line in lines]
+    cases["split_nodes_delimiter/short_nodes"] = (
+        lambda: split_nodes_delimiter(short_nodes, "_", TextType.ITALIC_TEXT)
+    )
+    cases["extract_markdown/short_lines"] = (
+        lambda: [extract_markdown_images(line) + extract_markdown_links(line) for line in lines]
+    )
+    return dict(sorted(cases.items()))
+
+
+def _calibration():
+    # Fixed pure-Python work in the same style as the pipeline: string
+    # slicing, dict and list churn.
+    out = []
+    for i in range(2000):
+        s = f"word_{i} **x** [y](z)"
+        out.append({"text": s[5:], "n": len(s.split(" "))})
+    return out
+
+
+# --- measuring ------------------------------------------------------------
+
+def _timer(func):
+    """A timeit.Timer for func() and how many calls make one repeat."""
+    timer = timeit.Timer(func)
+    once = max(timer.timeit(1), 1e-7)
+    return timer, max(1, math.ceil(MIN_REPEAT_SECONDS / once))
+
+
+def measure(func, repeats=REPEATS, warmup=WARMUP_CALLS):
+    """(best seconds per call of func(), best seconds per calibration loop).
+
+    The calibration loop is timed in the repeat right next to each repeat
+    of func(), so a burst of machine load inflates both minimums alike
+    instead of skewing the ratio between them.
+    """
+    for _ in range(warmup):
+        func()
+    timer, number = _timer(func)
+    cal_timer, cal_number = _timer(_calibration)
+    best = cal_best = float("inf")
+    for _ in range(repeats):
+        cal_best = min(cal_best, cal_timer.timeit(cal_number) / cal_number)
+        best = min(best, timer.timeit(number) / number)
+    return best, cal_best
+
+
+def run(pattern=None, repeats=REPEATS):
+    """Time every case whose name contains `pattern` (all by default).
+
+    Returns {"results": {case: seconds}, "relative": {case: seconds /
+    calibration seconds}}; the gate compares "relative".
+    """
+    results = {}
+    relative = {}
+    # Every repeat renders the same document, so with the inline caches on
+    # the rendering cases would time nothing but cache hits.
+    cache_size = inline_cache.maxsize
+    inline_cache.resize(0)
+    inline_html_cache.resize(0)
+    try:
+        for name, func in _cases().items():
+            if pattern and pattern not in name:
+                continue
+            seconds, calibration = measure(func, repeats)
+            results[name] = seconds
+            relative[name] = seconds / calibration
+    finally:
+        inline_cache.resize(cache_size)
+        inline_html_cache.resize(cache_size)
+    return {"results": results, "relative": relative}
+
+
+def compare(current, baseline, tolerance=DEFAULT_TOLERANCE):
+    """[(case, ratio)] for every case slower than baseline * (1 + tolerance),
+    comparing calibration-relative times. Cases missing from either side
+    are ignored."""
+    regressions = []
+    for name, ratio in _ratios(current, baseline).items():
+        if ratio > 1 + tolerance:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def _ratios(current, baseline):
+    old = baseline.get("relative", {})
+    return {name: rel / old[name] for name, rel in current["relative"].items() if old.get(name)}
+
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+    except FileNotFoundError:
+        return None
+    if data.get("version") != BASELINE_VERSION:
+        return None
+    return data
+
+
+def save_baseline(current, path=BASELINE_PATH):
+    data = {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        **current,
+    }
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=1, sort_keys=True)
+        handle.write("\n")
+
+
+def format_table(current, baseline=None):
+    ratios = _ratios(current, baseline) if baseline else {}
+    lines = [f"{'case':<44} {'time':>11} {'vs baseline':>12}"]
+    for name, seconds in current["results"].items():
+        change = f"{(ratios[name] - 1) * 100:+.1f}%" if name in ratios else ""
+        lines.append(f"{name:<44} {seconds * 1e6:>8.1f} us {change:>12}")
+    return "\n".join(lines)
+
+
+def check(tolerance=DEFAULT_TOLERANCE, repeats=REPEATS):
+    """Run everything and gate on the baseline. Returns True when no case
+    regressed beyond `tolerance` (or when there is no baseline yet)."""
+    baseline = load_baseline()
+    current = run(repeats=repeats)
+    print(format_table(current, baseline))
+    if baseline is None:
+        print(f"No baseline at {BASELINE_PATH}; run with --save-baseline to record one")
+        return True
+    regressions = compare(current, baseline, tolerance)
+    for name, ratio in regressions:
+        print(f"REGRESSION: {name} is {(ratio - 1) * 100:.0f}% slower than baseline "
+              f"(tolerance {tolerance * 100:.0f}%)")
+    return not regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the markdown pipeline.")
+    parser.add_argument("--filter", metavar="TEXT", help="only run cases whose name contains TEXT")
+    parser.add_argument("--repeats", type=int, default=REPEATS, help=f"timed repeats per case (default {REPEATS})")
+    parser.add_argument("--save-baseline", action="store_true", help=f"write results to {BASELINE_PATH.name}")
+    parser.add_argument("--check", action="store_true", help="exit 1 if any case regressed beyond --tolerance")
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE,
+        help=f"allowed slowdown as a fraction (default {DEFAULT_TOLERANCE})",
+    )
+    args = parser.parse_args(argv)
+
+    if args.check:
+        return 0 if check(args.tolerance, args.repeats) else 1
+
+    current = run(args.filter, args.repeats)
+    if args.save_baseline:
+        if args.filter:
+            parser.error("--save-baseline records every case; drop --filter")
+        save_baseline(current)
+        print(format_table(current))
+        print(f"Baseline written to {BASELINE_PATH}")
+        return 0
+    print(format_table(current, load_baseline()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Cold-start import budget for the build CLI.
+
+Runs two commands under `python -X importtime` in a fresh interpreter and
+checks what they import:
+
+  help     `src/main.py --help`
+  landing  a landing-page-only build (targets={"landing"}) of a small
+           synthetic site
+
+Each command has a list of modules it must never load -- the markdown
+pipeline and multiprocessing have no business in `--help` -- and a budget
+for the total import time in milliseconds. The module lists are exact and
+are checked by the test suite; the millisecond budgets depend on the
+machine and are checked here (and by `run_tests.py --bench`).
+
+    python3 scripts/import_budget.py            # report
+    python3 scripts/import_budget.py --check    # exit 1 if over budget
+"""
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from synthetic_site import generate
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SRC = REPO_ROOT / "src"
+
+# Measured 2026-10-17 (Python 3.12, one shared core): help ~30 ms and 59
+# modules, down from ~120 ms and 154 modules when main.py imported the
+# whole build up front; landing ~50 ms. Budgets leave headroom for noise.
+BUDGET_MS = {"help": 80, "landing": 150}
+
+FORBIDDEN = {
+    "help": (
+        "Gen_Content.build", "Gen_Content.watch", "block_to_html",
+        "multiprocessing", "concurrent.futures", "cProfile",
+    ),
+    "landing": (
+        "Gen_Content.parallel_render", "Gen_Content.generate_page", "Gen_Content.generate_blog_index",
+        "block_to_html", "multiprocessing", "concurrent.futures.process", "cProfile",
+    ),
+}
+
+_LANDING_BUILD = """
+import contextlib, os, sys
+sys.path.insert(0, {src!r})
+from Gen_Content.build import copy_static_to_docs
+with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+    ok = copy_static_to_docs(incremental=True, targets={{"landing"}}, quiet=True, workspace_root={root!r})
+sys.exit(0 if ok else 1)
+"""
+
+
+def parse_importtime(stderr):
+    """{module: cumulative microseconds} from -X importtime output, plus
+    the total over top-level imports under the key None."""
+    modules = {}
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        us = int(cumulative)
+        if not name.startswith("  "):  # one space after "|" marks top level
+            total += us
+        modules[name.strip()] = us
+    modules[None] = total
+    return modules
+
+
+def _run(args):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True, text=True, cwd=REPO_ROOT,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{args} exited {proc.returncode}:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def measure(command, workdir=None):
+    """Import profile of one command ("help" or "landing")."""
+    if command == "help":
+        return _run([str(SRC / "main.py"), "--help"])
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(workdir or tmp) / "site"
+        generate(root, posts=20)
+        return _run(["-c", _LANDING_BUILD.format(src=str(SRC), root=str(root))])
+
+
+def violations(command, modules):
+    """Forbidden modules `command` loaded (a module or any submodule)."""
+    found = []
+    for name in FORBIDDEN[command]:
+        if any(m == name or m.startswith(name + ".") for m in modules if m):
+            found.append(name)
+    return found
+
+
+def check(verbose=True):
+    ok = True
+    for command, budget in BUDGET_MS.items():
+        modules = measure(command)
+        total_ms = modules[None] / 1000
+        bad = violations(command, modules)
+        over = total_ms > budget
+        if verbose:
+            print(f"{command:<8} {total_ms:7.1f} ms imports (budget {budget} ms), {len(modules) - 1} modules")
+            slowest = sorted(((us, m) for m, us in modules.items() if m), reverse=True)[:5]
+            for us, name in slowest:
+                print(f"           {us / 1000:7.1f} ms  {name}")
+        for name in bad:
+            print(f"FAIL: {command} imported {name}")
+        if over:
+            print(f"FAIL: {command} spent {total_ms:.1f} ms importing (budget {budget} ms)")
+        ok = ok and not bad and not over
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check cold-start import time of the build CLI.")
+    parser.add_argument("--check", action="store_true", help="exit 1 if a command is over budget")
+    args = parser.parse_args(argv)
+    ok = check()
+    return 0 if ok or not args.check else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Adversarial-input stress test for the markdown parser.
+
+Every pattern the parser runs on user text (md_patterns.py) is meant to
+be linear: each negated character class excludes the delimiter that
+starts its pattern, so a match attempt scans at most to the next
+delimiter and no two attempts scan the same stretch. This harness holds
+the parser to that on the inputs a backtracking regex would choke on --
+runs of unmatched `*`, `[`, `(`, `_`, half-open links and the like:
+
+  throughput  each case, 4 * SIZE characters long, must parse at
+              MIN_MB_PER_S or better
+  scaling     time per byte at 4 * SIZE over time per byte at SIZE must
+              stay under MAX_SCALING; a quadratic pattern shows up as ~4
+  fuzz        random mixes of markup fragments must parse without
+              raising: the parser has no input it rejects
+
+Each case is timed in a child interpreter with a STALL_SECONDS timeout,
+so a pattern that does go exponential fails the check instead of hanging
+it. The inline caches are off while timing. The case list and the fuzz
+run are checked by the test suite; the throughput and scaling limits
+depend on the machine and are checked here (and by `run_tests.py
+--bench`).
+
+Measured 2026-10-17 (Python 3.12, one shared core, SIZE 20000): every
+case scales at 0.7-1.4x per byte. Slowest are markdown_to_html on `*`
+in code spans, ~1.2 MB/s, and on `**a` runs, ~1.7 MB/s -- a node per
+three characters -- against 10-30 MB/s for runs of `[`, `(` and text.
+MIN_MB_PER_S leaves room for a loaded machine; a quadratic pattern at
+4 * SIZE would fall far below it.
+
+    python3 scripts/inline_stress.py            # report
+    python3 scripts/inline_stress.py --check    # exit 1 on a slow or stalled case
+"""
+import argparse
+import json
+import random
+import subprocess
+import sys
+import timeit
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SRC = REPO_ROOT / "src"
+SCRIPTS = Path(__file__).resolve().parent
+
+SIZE = 20000
+MIN_MB_PER_S = 0.5
+MAX_SCALING = 2.0
+STALL_SECONDS = 60
+REPEATS = 3
+# as in benchmark.py: each repeat runs the case at least this long
+MIN_REPEAT_SECONDS = 0.02
+
+# name -> builder of an input about n characters long
+CASES = {
+    "stars": lambda n: "*" * n,
+    "star_words": lambda n: "*a " * (n // 3),
+    "word_stars": lambda n: "a*b " * (n // 4),
+    "double_stars": lambda n: "**a" * (n // 3),
+    "odd_double_stars": lambda n: "**" * (n // 2) + "*",
+    "underscores": lambda n: "_" * n,
+    "double_underscores": lambda n: "__a " * (n // 4),
+    "snake_case": lambda n: "a_" * (n // 2),
+    "brackets": lambda n: "[" * n,
+    "closed_brackets": lambda n: "[a]" * (n // 3),
+    "parens": lambda n: "(" * n,
+    "bang_brackets": lambda n: "![" * (n // 2),
+    "open_links": lambda n: "[a](" * (n // 4),
+    "open_link_tail": lambda n: "[a](" + "x" * (n - 4),
+    "close_open": lambda n: "](" * (n // 2),
+    "code_spans": lambda n: "`*`" * (n // 3),
+    "backticks": lambda n: "`" * (n | 1),  # odd: the last one never closes
+    "headings": lambda n: "#" * n,
+    "list_markers": lambda n: "- " * (n // 2),
+    "line_breaks": lambda n: "a\n" * (n // 2),
+    "mixed": lambda n: "*_[(!" * (n // 5),
+}
+
+# name -> "module:function" run on each case; the module is imported in
+# the child, so the parent never loads the pipeline
+TARGETS = {
+    "text_to_textnodes": "text_to_textnodes:text_to_textnodes",
+    "markdown_to_html": "block_to_html:markdown_to_html",
+    "extract_links": "extract_markdown:extract_markdown_links",
+    "extract_images": "extract_markdown:extract_markdown_images",
+}
+
+# Markup fragments fuzz() strings together: short, so that every pair of
+# delimiters meets, and long runs, so that scans have something to cross.
+FRAGMENTS = (
+    "*", "**", "_", "__", "[", "]", "(", ")", "![", "](", "`", " ", "a", "x_y", "\n",
+    "[l](u_1)", "*" * 50, "_" * 50, "[" * 50, "(" * 50,
+)
+
+_CHILD = """
+import json, sys
+sys.path.insert(0, {src!r})
+sys.path.insert(0, {scripts!r})
+from inline_stress import time_case
+print(json.dumps(time_case(sys.argv[1], sys.argv[2], [int(n) for n in sys.argv[3:]])))
+"""
+
+
+def _target(name):
+    module, function = TARGETS[name].split(":")
+    return getattr(__import__(module), function)
+
+
+def time_case(case, target, sizes):
+    """Best seconds per call of `target` on `case` at each size. Runs in
+    the child interpreter."""
+    from block_to_html import inline_cache, inline_html_cache
+
+    inline_cache.resize(0)
+    inline_html_cache.resize(0)
+    func = _target(target)
+    times = []
+    for n in sizes:
+        text = CASES[case](n)
+        timer = timeit.Timer(lambda: func(text))
+        once = timer.timeit(1)
+        number = max(1, int(MIN_REPEAT_SECONDS / max(once, 1e-9)))
+        times.append(min(timer.repeat(REPEATS, number)) / number)
+    return times
+
+
+def measure(case, target, size=SIZE, timeout=STALL_SECONDS):
+    """{"case", "target", "bytes", "mb_per_s", "scaling"} for one case
+    timed at size and 4 * size, or with "stalled": True if the child ran
+    past `timeout` seconds."""
+    sizes = (size, 4 * size)
+    row = {"case": case, "target": target, "bytes": len(CASES[case](sizes[1]).encode())}
+    code = _CHILD.format(src=str(SRC), scripts=str(SCRIPTS))
+    try:
+        proc = subprocess.run(
+            [sys.executable, "-c", code, case, target, *map(str, sizes)],
+            capture_output=True, text=True, timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return {**row, "stalled": True}
+    if proc.returncode != 0:
+        raise RuntimeError(f"{case}/{target} exited {proc.returncode}:\n{proc.stderr[-2000:]}")
+    small, large = json.loads(proc.stdout.strip().splitlines()[-1])
+    small_bytes = len(CASES[case](sizes[0]).encode())
+    return {
+        **row,
+        "stalled": False,
+        "mb_per_s": row["bytes"] / large / 1e6,
+        "scaling": (large / row["bytes"]) / (small / small_bytes),
+    }
+
+
+def problems(row, min_mb_per_s=MIN_MB_PER_S, max_scaling=MAX_SCALING):
+    """What is wrong with one measure() row, as messages."""
+    name = f"{row['target']}/{row['case']}"
+    if row["stalled"]:
+        return [f"{name} stalled"]
+    found = []
+    if row["mb_per_s"] < min_mb_per_s:
+        found.append(f"{name} parsed {row['mb_per_s']:.2f} MB/s (floor {min_mb_per_s} MB/s)")
+    if row["scaling"] > max_scaling:
+        found.append(f"{name} took {row['scaling']:.2f}x as long per byte at 4x the size (max {max_scaling}x)")
+    return found
+
+
+def fuzz(seed=0, count=200, length=400):
+    """Parse `count` random fragment mixes with every target; returns the
+    (target, text, exception) of each that raised."""
+    rng = random.Random(seed)
+    targets = {name: _target(name) for name in TARGETS}
+    failures = []
+    for _ in range(count):
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, length)))
+        for name, func in targets.items():
+            try:
+                func(text)
+            except Exception as e:  # noqa: BLE001 -- any exception is a failure
+                failures.append((name, text, e))
+    return failures
+
+
+def check(size=SIZE, verbose=True):
+    ok = True
+    for target in TARGETS:
+        for case in CASES:
+            row = measure(case, target, size)
+            found = problems(row)
+            if verbose and not row["stalled"]:
+                print(f"{target + '/' + case:<40} {row['mb_per_s']:8.2f} MB/s  {row['scaling']:5.2f}x")
+            for message in found:
+                print(f"FAIL: {message}")
+            ok = ok and not found
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the markdown parser on adversarial inputs.")
+    parser.add_argument("--check", action="store_true", help="exit 1 if a case is slow, scales badly or stalls")
+    parser.add_argument("--size", type=int, default=SIZE, help="smaller input size in characters (default %(default)s)")
+    parser.add_argument("--fuzz", type=int, default=200, metavar="N", help="random inputs to parse (default %(default)s)")
+    args = parser.parse_args(argv)
+    sys.path.insert(0, str(SRC))
+    failures = fuzz(count=args.fuzz)
+    for name, text, e in failures:
+        print(f"FAIL: {name} raised {e!r} on {text[:80]!r}...")
+    ok = check(args.size) and not failures
+    return 0 if ok or not args.check else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Memory used by the markdown pipeline's node objects.
+
+Parses a large document -- benchmark.py's inputs stitched together and
+repeated -- under tracemalloc and reports:
+
+  textnode  bytes per TextNode from text_to_textnodes(), text included
+  htmlnode  bytes per node of the tree markdown_to_html_node() returns
+  peak      tracemalloc peak of markdown_to_html_node() plus to_html()
+
+The inline render cache is off while measuring: it shares TextNodes between
+repeated texts and would hide what a node costs.
+
+Measured 2026-10-17 (Python 3.12, --repeat 4): with a __dict__ per node and
+an empty list and dict in every HTMLNode, 165 bytes per TextNode, 337 per
+HTMLNode and a 14.5 MiB peak; with __slots__ and shared empty sentinels,
+133, 200 and 10.1 MiB.
+
+    python3 scripts/memory_benchmark.py
+    python3 scripts/memory_benchmark.py --repeat 10
+"""
+import argparse
+import sys
+import tracemalloc
+
+from benchmark import INPUTS
+
+from block_to_html import inline_cache, markdown_to_html_node
+from text_to_textnodes import text_to_textnodes
+
+PARAGRAPHS = ("long_paragraph", "link_heavy", "snake_case")
+
+
+def document(repeat=4):
+    """Every benchmark input as one markdown document, `repeat` times over."""
+    return "\n\n".join(INPUTS[name] for name in INPUTS for _ in range(repeat))
+
+
+def count_nodes(root):
+    count = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.children)
+    return count
+
+
+def measure(repeat=4):
+    """{"textnodes", "textnode_bytes", "htmlnodes", "htmlnode_bytes",
+    "peak_bytes"} for a document of the given size."""
+    markdown = document(repeat)
+    paragraphs = [INPUTS[name] for name in PARAGRAPHS for _ in range(repeat)]
+    cache_size = inline_cache.maxsize
+    inline_cache.resize(0)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        text_nodes = [text_to_textnodes(text) for text in paragraphs]
+        textnode_bytes = tracemalloc.get_traced_memory()[0] - before
+        textnodes = sum(len(nodes) for nodes in text_nodes)
+        del text_nodes
+
+        before = tracemalloc.get_traced_memory()[0]
+        root = markdown_to_html_node(markdown)
+        htmlnode_bytes = tracemalloc.get_traced_memory()[0] - before
+        htmlnodes = count_nodes(root)
+        del root
+
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        markdown_to_html_node(markdown).to_html()
+        peak_bytes = tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+        inline_cache.resize(cache_size)
+    return {
+        "textnodes": textnodes,
+        "textnode_bytes": textnode_bytes / textnodes,
+        "htmlnodes": htmlnodes,
+        "htmlnode_bytes": htmlnode_bytes / htmlnodes,
+        "peak_bytes": peak_bytes,
+    }
+
+
+def format_report(result):
+    return "\n".join([
+        f"textnode {result['textnode_bytes']:8.1f} bytes/node  ({result['textnodes']} nodes)",
+        f"htmlnode {result['htmlnode_bytes']:8.1f} bytes/node  ({result['htmlnodes']} nodes)",
+        f"peak     {result['peak_bytes'] / (1 << 20):8.1f} MiB",
+    ])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report memory per markdown node and peak render memory.")
+    parser.add_argument("--repeat", type=int, default=4, help="copies of each input in the document (default 4)")
+    args = parser.parse_args(argv)
+    print(format_report(measure(args.repeat)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
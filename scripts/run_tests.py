@@ -11,6 +11,15 @@ separate cleanup. This runner therefore enforces two independent rules:
 New work always goes in STRICT. Only the stale legacy tests get baseline
 forgiveness.
 
+With --bench, the markdown-pipeline micro-benchmarks (scripts/benchmark.py)
+run after the tests, and any stage more than BENCH_TOLERANCE slower than
+scripts/benchmark_baseline.json fails the run, as does a CLI command over
+its cold-start import budget (scripts/import_budget.py) or an adversarial
+input the parser handles too slowly (scripts/inline_stress.py). It is
+opt-in because timings depend on the machine and its load; record a fresh
+baseline with `python3 scripts/benchmark.py --save-baseline` after an
+intended change.
+
 MUTATION TESTING WARNING
 ------------------------
 Clear __pycache__ (or use `python3 -B`) between mutants. CPython invalidates
@@ -32,6 +41,10 @@ TESTS_DIR = REPO_ROOT / "src" / "tests"
 BASELINE_FAILURES = 11
 BASELINE_ERRORS = 9
 
+# Allowed slowdown per benchmark case under --bench, as a fraction of its
+# baseline time (both measured relative to a calibration loop).
+BENCH_TOLERANCE = 0.50
+
 # Floor for "discovery clearly worked." Not a suite-size target -- that's
 # what BASELINE_FAILURES/ERRORS and STRICT track. This exists only to catch
 # _discover() silently returning zero (or near-zero) tests without raising
@@ -49,6 +62,27 @@ STRICT: tuple[str, ...] = (
     "test_check_token_age",
     "test_render_listening",
     "test_fetch_listening",
+    "test_build_manifest",
+    "test_parallel_render",
+    "test_static_sync",
+    "test_build_log",
+    "test_watch",
+    "test_content_index",
+    "test_output_writer",
+    "test_build_profile",
+    "test_benchmark",
+    "test_synthetic_site",
+    "test_page_dates",
+    "test_import_budget",
+    "test_build_targets",
+    "test_text_to_textnodes",
+    "test_block_lexer",
+    "test_inline_cache",
+    "test_block_cache",
+    "test_node_slots",
+    "test_serializer",
+    "test_markdown_to_html",
+    "test_inline_stress",
 )
 
 
@@ -60,7 +94,8 @@ def _discover(pattern="test*.py"):
     )
 
 
-def main():
+def main(argv=None):
+    bench = "--bench" in (sys.argv[1:] if argv is None else argv)
     # repo root so `from src.xxx import yyy` resolves (most test files use
     # this form); src/ for Gen_Content.* and bare-module imports (e.g.
     # `from markdown_to_blocks import ...`); scripts/ for the fetch and
@@ -102,7 +137,30 @@ def main():
     if not strict_ok:
         print("FAIL: strict modules must be fully green")
 
-    return 1 if (regressed or not strict_ok or not discovery_ok) else 0
+    bench_ok = True
+    if bench:
+        import benchmark
+
+        print()
+        bench_ok = benchmark.check(BENCH_TOLERANCE)
+        if not bench_ok:
+            print("FAIL: benchmark regressed beyond BENCH_TOLERANCE")
+
+        import import_budget
+
+        print()
+        if not import_budget.check():
+            bench_ok = False
+            print("FAIL: import budget exceeded")
+
+        import inline_stress
+
+        print()
+        if not inline_stress.check():
+            bench_ok = False
+            print("FAIL: parser too slow on adversarial input")
+
+    return 1 if (regressed or not strict_ok or not discovery_ok or not bench_ok) else 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""End-to-end build benchmark over synthetic corpora of increasing size.
+
+For each corpus size, generates a site with scripts/synthetic_site.py and
+runs the whole copy_static_to_docs() pipeline on it in a fresh
+interpreter, so each size gets its own peak-RSS reading and no warm
+caches carry over. Reports wall time, peak RSS, output files per second
+and time per post relative to the smallest corpus: a flat last column
+means the build scales linearly, a climbing one points at something
+super-linear (blog-index pagination, say, or the parser). A no-op
+incremental rebuild is timed too.
+
+    python3 scripts/scale_benchmark.py                       # 1k..10k posts
+    python3 scripts/scale_benchmark.py --sizes 1000,100000 --jobs 0
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from synthetic_site import generate
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SIZES = (1000, 2000, 5000, 10000)
+
+# Runs in the child interpreter: one build, then a JSON line on stdout.
+_CHILD = """
+import contextlib, json, os, resource, sys, time
+sys.path.insert(0, {src!r})
+from Gen_Content.build import copy_static_to_docs
+root, incremental, jobs = sys.argv[1], sys.argv[2] == "1", int(sys.argv[3])
+with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+    start = time.perf_counter()
+    ok = copy_static_to_docs(incremental=incremental, jobs=jobs, quiet=True, workspace_root=root)
+    wall = time.perf_counter() - start
+kib = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+          resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+if sys.platform == "darwin":
+    kib //= 1024  # macOS reports bytes
+print(json.dumps({{"ok": ok, "wall": wall, "peak_rss_kib": kib}}))
+"""
+
+
+def _count_files(root):
+    return sum(len(files) for _, _, files in os.walk(root))
+
+
+def build(root, incremental=False, jobs=1):
+    """Build the site at `root` in a child interpreter; returns its report."""
+    code = _CHILD.format(src=str(REPO_ROOT / "src"))
+    proc = subprocess.run(
+        [sys.executable, "-c", code, str(root), "1" if incremental else "0", str(jobs)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def measure(posts, workdir, jobs=1, pages=3):
+    """Generate a `posts`-post site under workdir, build it twice (full,
+    then a no-op incremental) and return one result row."""
+    root = Path(workdir) / f"site-{posts}"
+    generate(root, posts=posts, pages=pages)
+    full = build(root, jobs=jobs)
+    noop = build(root, incremental=True, jobs=jobs)
+    files = _count_files(root / "docs")
+    return {
+        "posts": posts,
+        "files": files,
+        "ok": full["ok"] and noop["ok"],
+        "wall_s": full["wall"],
+        "noop_s": noop["wall"],
+        "peak_rss_mib": full["peak_rss_kib"] / 1024,
+        "files_per_s": files / full["wall"],
+    }
+
+
+def format_table(rows):
+    lines = [
+        f"{'posts':>8} {'files':>8} {'wall s':>9} {'no-op s':>8} {'peak MiB':>9} "
+        f"{'files/s':>9} {'us/post':>9} {'scaling':>8}"
+    ]
+    base = rows[0]["wall_s"] / rows[0]["posts"] if rows else 0
+    for row in rows:
+        per_post = row["wall_s"] / row["posts"]
+        flag = "" if row["ok"] else "  BUILD FAILED"
+        lines.append(
+            f"{row['posts']:>8} {row['files']:>8} {row['wall_s']:>9.2f} {row['noop_s']:>8.2f} "
+            f"{row['peak_rss_mib']:>9.1f} {row['files_per_s']:>9.0f} {per_post * 1e6:>9.0f} "
+            f"{per_post / base:>7.2f}x{flag}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark full builds of synthetic sites.")
+    parser.add_argument(
+        "--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+        help="comma-separated post counts (default %(default)s)",
+    )
+    parser.add_argument("--jobs", type=int, default=1, help="--jobs for the build (0 = one per CPU)")
+    parser.add_argument("--pages", type=int, default=3, help="top-level pages per site (default 3)")
+    parser.add_argument("--keep", metavar="DIR", help="build under DIR and keep the sites")
+    parser.add_argument("--json", metavar="FILE", help="also write the result rows to FILE")
+    args = parser.parse_args(argv)
+    sizes = sorted(int(s) for s in args.sizes.split(",") if s.strip())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = args.keep or tmp
+        os.makedirs(workdir, exist_ok=True)
+        rows = []
+        for posts in sizes:
+            rows.append(measure(posts, workdir, jobs=args.jobs, pages=args.pages))
+            print(format_table(rows).splitlines()[-1] if len(rows) > 1 else format_table(rows), flush=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(rows, handle, indent=1)
+    return 0 if all(row["ok"] for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Generate a synthetic site tree for scale testing.
+
+Writes a workspace shaped like this repo -- content/ with top-level pages
+and content/dev_diary/ posts, plus the real static/ directory and
+templates copied from this checkout -- so `copy_static_to_docs` can build
+it unchanged. Posts carry page-date comments, dated filenames, headings,
+paragraphs with inline formatting, links, images, nested lists and fenced
+code, in roughly the proportions of the real diary. Output is
+deterministic for a given --seed.
+
+    python3 scripts/synthetic_site.py /tmp/site --posts 10000
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TEMPLATES = ("template.html", "dev_diary_template.html", "titlepage.html")
+FIRST_POST = date(2025, 11, 11)
+
+WORDS = (
+    "server neovim config build script deploy linux shell python loop "
+    "advent puzzle parser token cache template blog static page output "
+    "kernel socket thread process memory profile benchmark regex node"
+).split()
+
+
+def _words(rng, n):
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def _paragraph(rng, sentences):
+    parts = []
+    for _ in range(sentences):
+        sentence = _words(rng, rng.randint(6, 16)).capitalize()
+        roll = rng.random()
+        if roll < 0.25:
+            sentence += f" with **{_words(rng, 2)}**"
+        elif roll < 0.45:
+            sentence += f" and _{_words(rng, 2)}_"
+        elif roll < 0.6:
+            sentence += f" via `{rng.choice(WORDS)}_{rng.choice(WORDS)}()`"
+        elif roll < 0.75:
+            sentence += f" (see [{_words(rng, 2)}](https://example.com/{rng.choice(WORDS)}_{rng.randint(1, 999)}))"
+        parts.append(sentence + ".")
+    return " ".join(parts)
+
+
+def _list(rng, items, ordered=False):
+    lines = []
+    for i in range(items):
+        marker = f"{i + 1}." if ordered else "-"
+        lines.append(f"{marker} {_words(rng, rng.randint(3, 9))}")
+        if rng.random() < 0.3:
+            lines.append(f"  - {_words(rng, rng.randint(3, 6))} `{rng.choice(WORDS)}`")
+    return "\n".join(lines)
+
+
+def _code(rng, lines):
+    lang = rng.choice(("python", "bash", "lua"))
+    body = "\n".join(f"{rng.choice(WORDS)}_{i} = {rng.choice(WORDS)}({i})" for i in range(lines))
+    return f"```{lang}\n{body}\n```"
+
+
+def _document(rng, title, page_date, sections):
+    out = [f"<!-- page-date: {page_date} -->", f"# {title}", "", _paragraph(rng, rng.randint(2, 5)), ""]
+    for s in range(sections):
+        out += [f"## {_words(rng, 3).title()}", "", _paragraph(rng, rng.randint(3, 8)), ""]
+        roll = rng.random()
+        if roll < 0.35:
+            out += [_list(rng, rng.randint(3, 8), ordered=rng.random() < 0.3), ""]
+        elif roll < 0.6:
+            out += [_code(rng, rng.randint(3, 25)), ""]
+        elif roll < 0.7:
+            out += [f"![{_words(rng, 2)}](./images/{rng.choice(WORDS)}_{s}.png)", ""]
+        elif roll < 0.8:
+            out += [f"> {_paragraph(rng, 2)}", ""]
+    return "\n".join(out)
+
+
+def generate(root, posts=1000, pages=3, page_sections=12, seed=0):
+    """Write a synthetic workspace at `root` (which must not exist).
+
+    posts: diary posts in content/dev_diary/, a few per day from
+        FIRST_POST on; page_sections: size of each top-level page.
+    Returns the number of markdown files written.
+    """
+    root = Path(root)
+    rng = random.Random(seed)
+    content = root / "content"
+    diary = content / "dev_diary"
+    diary.mkdir(parents=True)
+    shutil.copytree(REPO_ROOT / "static", root / "static")
+    for name in TEMPLATES:
+        shutil.copy2(REPO_ROOT / name, root / name)
+
+    for i in range(pages):
+        title = _words(rng, 2).title()
+        text = _document(rng, title, FIRST_POST.isoformat(), page_sections)
+        (content / f"page{i:03d}.md").write_text(f"<!-- landing-title: {title} -->\n{text}\n", encoding="utf-8")
+
+    for i in range(posts):
+        day = FIRST_POST + timedelta(days=i // 3)
+        slug = "-".join(rng.choice(WORDS) for _ in range(3))
+        text = _document(rng, _words(rng, 4).title(), day.isoformat(), rng.randint(2, 6))
+        (diary / f"{day.isoformat()}-{i:06d}-{slug}.md").write_text(text + "\n", encoding="utf-8")
+    return pages + posts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic site for scale testing.")
+    parser.add_argument("root", help="directory to create")
+    parser.add_argument("--posts", type=int, default=1000, help="diary posts (default 1000)")
+    parser.add_argument("--pages", type=int, default=3, help="top-level pages (default 3)")
+    parser.add_argument("--page-sections", type=int, default=12, help="sections per top-level page (default 12)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    if os.path.exists(args.root):
+        parser.error(f"{args.root} already exists")
+    count = generate(args.root, args.posts, args.pages, args.page_sections, args.seed)
+    print(f"Wrote {count} markdown file(s) to {args.root}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""On-disk cache of rendered markdown blocks.
+
+A page is rendered block by block (markdown_to_blocks), and each block's
+HTML depends on nothing but its own text and the parser. BlockCache keeps
+that HTML keyed by a hash of the block, so fixing a typo in one paragraph
+of a long post re-parses only that paragraph: every other block is
+served from the cache (see markdown_to_html_node's `cache`).
+
+Each key covers the parser's version as well as the block -- a digest of
+the markdown modules' own source -- so changing the parser invalidates
+every entry without anyone having to remember to bump a number. The file
+is JSON in least-recently-used-first order. The cache holds at most
+`maxsize` entries, in memory as well as on disk: adding one past that
+drops the least recently used.
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
+
+from Gen_Content.output_writer import atomic_write_json
+from inline_cache import CacheStats
+
+BLOCK_CACHE_VERSION = 1
+DEFAULT_SIZE = 10000
+
+# The markdown pipeline is every top-level module in src/ but the CLI.
+_PARSER_DIR = Path(__file__).resolve().parent.parent
+_parser_version = None
+
+
+def parser_version():
+    """Digest of the markdown modules' source, computed once per process."""
+    global _parser_version
+    if _parser_version is None:
+        digest = hashlib.sha256(f"{BLOCK_CACHE_VERSION}\n".encode())
+        for path in sorted(_PARSER_DIR.glob("*.py")):
+            if path.name != "main.py":
+                digest.update(path.name.encode() + b"\0" + path.read_bytes())
+        _parser_version = digest.hexdigest()
+    return _parser_version
+
+
+class BlockCache:
+    def __init__(self, path, maxsize=DEFAULT_SIZE, version=None):
+        self.path = path
+        self.maxsize = maxsize
+        self.version = version or parser_version()
+        self.entries = OrderedDict()  # key -> html, least recently used first
+        self.added = {}    # entries new since take_added()
+        self.hits = self.misses = self.evictions = 0
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path, maxsize=DEFAULT_SIZE, version=None):
+        """Read the cache at `path`, or start empty if it is missing,
+        unreadable or was written by another parser version."""
+        cache = cls(path, maxsize, version)
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return cache
+        if isinstance(data, dict) and data.get("version") == cache.version:
+            entries = data.get("entries")
+            if isinstance(entries, dict):
+                cache.entries = OrderedDict((k, v) for k, v in entries.items() if isinstance(v, str))
+                cache._trim()
+        return cache
+
+    def key(self, block):
+        return hashlib.sha256(f"{self.version}\0{block}".encode()).hexdigest()
+
+    def get(self, block):
+        """The cached HTML of `block` (possibly ""), or None."""
+        key = self.key(block)
+        html = self.entries.get(key)
+        if html is None:
+            self.misses += 1
+            return None
+        # Now the most recently used. A hit alone does not make the cache
+        # worth rewriting: the order is saved with the next change.
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return html
+
+    def put(self, block, html):
+        key = self.key(block)
+        self.entries[key] = self.added[key] = html
+        self.entries.move_to_end(key)
+        self._dirty = True
+        self._trim()
+
+    def update(self, entries):
+        """Add entries another process rendered (see take_added())."""
+        for key, html in entries.items():
+            self.entries[key] = html
+            self.entries.move_to_end(key)
+        if entries:
+            self._dirty = True
+            self._trim()
+
+    def _trim(self):
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+            self._dirty = True
+
+    def take_added(self):
+        """Entries put since the last call, keyed as stored."""
+        added, self.added = self.added, {}
+        return added
+
+    def stats(self):
+        return CacheStats(self.hits, self.misses, self.evictions)
+
+    def save(self):
+        """Write the cache atomically, if entries were added or dropped."""
+        if not self._dirty:
+            return
+        atomic_write_json(self.path, {"version": self.version, "entries": self.entries}, separators=(",", ":"))
+        self._dirty = False
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,518 @@
+"""The site build: static sync, page rendering, blog index, landing page.
+
+copy_static_to_docs() is what `src/main.py` runs. The stage modules that
+pull in heavy dependencies -- the markdown pipeline and multiprocessing
+behind page rendering, the blog index and landing page generators, the
+profiler -- are imported by the stage that first needs them, once per
+build, so a build that only touches the landing page never loads the
+markdown parser or a process pool.
+"""
+import contextlib
+import datetime
+import glob
+import os
+import shutil
+import traceback
+
+from Gen_Content.build_log import BuildLog
+from Gen_Content.build_manifest import BuildManifest
+from Gen_Content.content_index import ContentIndex
+from Gen_Content.output_writer import OutputWriter, remove_unlisted
+from Gen_Content.page_dates import PageDates
+from Gen_Content.static_sync import StaticSync
+
+WORKSPACE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Relative to the workspace root being built.
+MANIFEST_FILE = os.path.join(".cache", "build_manifest.json")
+TRACE_FILE = os.path.join(".cache", "build_trace.json")
+BLOCK_CACHE_FILE = os.path.join(".cache", "block_cache.json")
+# Committed next to content/: page dates assigned in read-only source mode.
+PAGE_DATES_FILE = "page_dates.json"
+
+# --only groups; anything else must be a markdown file under content/.
+ONLY_GROUPS = ("landing", "pages", "blog", "static")
+
+
+def _markdown_names(directory):
+    if not os.path.isdir(directory):
+        return []
+    return sorted(f for f in os.listdir(directory) if f.lower().endswith(".md"))
+
+
+def select_targets(selectors, workspace_root=WORKSPACE_ROOT):
+    """Manifest target names for `--only` selectors.
+
+    landing   the landing page (docs/index.html)
+    pages     every top-level page in content/
+    blog      every post in content/dev_diary/ and the blog index
+    static    every file in static/ and the CNAME copy
+    <path>    one markdown file in content/ or content/dev_diary/,
+              relative to the current directory or the workspace root
+
+    Raises ValueError for a selector that names none of these.
+    """
+    content_path = os.path.join(workspace_root, "content")
+    blog_dir = os.path.join(content_path, "dev_diary")
+    targets = set()
+    for selector in selectors:
+        if selector == "landing":
+            targets.add("landing")
+        elif selector == "pages":
+            targets.update(f"page:{m}" for m in _markdown_names(content_path))
+        elif selector == "blog":
+            targets.update(f"post:{m}" for m in _markdown_names(blog_dir))
+            targets.add("blog-index")
+        elif selector == "static":
+            static_path = os.path.join(workspace_root, "static")
+            for dirpath, _, files in os.walk(static_path):
+                for name in files:
+                    rel = os.path.relpath(os.path.join(dirpath, name), static_path)
+                    targets.add("static:" + rel.replace(os.sep, "/"))
+            targets.add("cname")
+        else:
+            path = selector if os.path.exists(selector) else os.path.join(workspace_root, selector)
+            path = os.path.abspath(path)
+            parent, name = os.path.split(path)
+            if not (os.path.isfile(path) and name.lower().endswith(".md")):
+                raise ValueError(f"{selector!r} is not one of {', '.join(ONLY_GROUPS)} or a markdown file in content/")
+            if parent == os.path.abspath(content_path):
+                targets.add(f"page:{name}")
+            elif parent == os.path.abspath(blog_dir):
+                targets.add(f"post:{name}")
+            else:
+                raise ValueError(f"{selector!r} is not in content/ or content/dev_diary/")
+    return targets
+
+
+def copy_static_to_docs(
+    incremental=False, jobs=1, link_static=False, quiet=False, log_json=False, targets=None,
+    profile=False, profile_stats=None, workspace_root=WORKSPACE_ROOT, read_only_sources=False,
+    inline_cache_size=None, block_cache_size=None,
+):
+    """
+    Copies all contents from static directory to docs directory.
+    Rebuilds docs/ in place and deletes whatever the build did not produce.
+    Logs all operations to log.txt in the workspace root.
+    Also renders all .md files in content/ to docs/*.html and sets index.html.
+
+    With incremental=True, docs/ is kept and .cache/build_manifest.json
+    decides what to do: only targets whose inputs (source, template, static
+    file, generator code) changed are re-rendered, and outputs whose source
+    disappeared are deleted. A full build still writes the manifest so the
+    next incremental build has something to compare against.
+
+    jobs > 1 renders pages on that many processes (0 means one per CPU);
+    small corpora stay serial because the pool would cost more than it saves.
+
+    Static files are only copied when their docs/ copy differs, using
+    reflinks or in-kernel copies where available; link_static=True
+    hardlinks them instead.
+
+    log.txt is written through one buffered handle. log_json=True also
+    writes log.jsonl with stage, page and elapsed time per line; quiet=True
+    prints only errors, warnings and a summary per stage.
+
+    targets limits the build to those manifest target names (e.g.
+    {"post:x.md", "blog-index"}, see select_targets()); every other file in
+    docs/ is left alone and nothing is pruned. Watch mode passes them with
+    incremental=True to rebuild just what a file change feeds; without
+    incremental the named targets are rebuilt even if they look current.
+
+    profile=True times every stage and page, prints the totals and the
+    slowest pages, and writes a Chrome trace to .cache/build_trace.json.
+    profile_stats names a file for a cProfile dump of the build (the main
+    process only; pages rendered by --jobs workers show up in the trace).
+
+    workspace_root defaults to this checkout; the scale benchmark points
+    it at a synthetic site instead.
+
+    read_only_sources=True never writes under content/: a page without a
+    page-date comment gets its date from page_dates.json (assigning and
+    recording one the first time) instead of having the comment injected.
+
+    inline_cache_size bounds the cache of rendered inline markdown (see
+    src/inline_cache.py; 0 disables it, None keeps its default). Its hit
+    rate is part of the build summary.
+
+    Rendered blocks are kept in .cache/block_cache.json (see
+    Gen_Content/block_cache.py), so re-rendering a page only parses the
+    blocks that changed. block_cache_size caps it in blocks (0 disables
+    it, None means the default).
+    """
+    log_path = os.path.join(workspace_root, "log.txt")
+    json_path = os.path.join(workspace_root, "log.jsonl") if log_json else None
+    log = BuildLog(log_path, json_path=json_path, quiet=quiet)
+    # Quiet mode files the generators' own chatter in log.txt instead of
+    # printing it.
+    capture = contextlib.redirect_stdout(log.capture()) if quiet else contextlib.nullcontext()
+    profiler = None
+    if profile or profile_stats:
+        from Gen_Content.build_profile import BuildProfiler
+
+        profiler = BuildProfiler(profile_stats)
+    with log, capture, profiler or contextlib.nullcontext():
+        ok = _build_site(
+            workspace_root, log, incremental, jobs, link_static, targets, profiler, read_only_sources,
+            inline_cache_size, block_cache_size,
+        )
+    if profiler:
+        profiler.write_trace(os.path.join(workspace_root, TRACE_FILE))
+        print(profiler.report())
+        print(f"Trace written to {TRACE_FILE}")
+        if profile_stats:
+            print(f"cProfile stats written to {profile_stats}")
+    return ok
+
+
+def _build_site(
+    workspace_root, log, incremental, jobs, link_static, targets=None, profiler=None, read_only_sources=False,
+    inline_cache_size=None, block_cache_size=None,
+):
+    """Body of copy_static_to_docs(); returns True on a clean build."""
+    static_path = os.path.join(workspace_root, "static")
+    content_path = os.path.join(workspace_root, "content")
+    template_path = os.path.join(workspace_root, "template.html")
+    docs_path = os.path.join(workspace_root, "docs")
+
+    def rel(path):
+        return os.path.relpath(path, workspace_root).replace(os.sep, "/")
+
+    def wanted(name):
+        return targets is None or name in targets
+
+    def stage(name):
+        log.stage(name)
+        if profiler:
+            profiler.stage(name)
+
+    stage("setup")
+    try:
+        if not os.path.exists(static_path):
+            log.error(f"ERROR: Static directory does not exist at {static_path}")
+            return False
+        if not os.path.exists(content_path):
+            log.error(f"ERROR: Content directory does not exist at {content_path}")
+            return False
+        if not os.path.exists(template_path):
+            log.error(f"ERROR: Template not found at {template_path}")
+            return False
+        
+        log.info(f"Starting build from {static_path} to {docs_path}")
+
+        manifest = BuildManifest.load(
+            os.path.join(workspace_root, MANIFEST_FILE), workspace_root,
+            keep_targets=incremental or targets is not None,
+        )
+        # --only without --incremental rebuilds its targets even when the
+        # manifest says they are current.
+        forced = targets is not None and not incremental
+        incremental = incremental or targets is not None
+
+        def is_current(name, inputs, params=None):
+            return not forced and manifest.is_current(name, inputs, params)
+        # Any change to the generator code can change any output, so it is
+        # an input of every rendered target.
+        code_files = glob.glob(os.path.join(workspace_root, "src", "**", "*.py"), recursive=True)
+        code_files = [p for p in code_files if os.sep + "tests" + os.sep not in p]
+        code_params = {"code": manifest.fingerprint(code_files)}
+        page_dates = None
+        if read_only_sources:
+            page_dates = PageDates.load(os.path.join(workspace_root, PAGE_DATES_FILE), workspace_root)
+            log.info(f"Read-only sources: page dates come from {PAGE_DATES_FILE}")
+
+        def page_params(src_md):
+            # A sidecar date is an input of its page just like the source.
+            if page_dates is None:
+                return code_params
+            return dict(code_params, page_date=page_dates.lookup(src_md))
+        up_to_date = 0
+
+        # docs/ is never wiped: a full build regenerates every target into
+        # it and then removes whatever it did not produce, so pages that
+        # come out byte-identical keep their mtimes.
+        os.makedirs(docs_path, exist_ok=True)
+        if incremental:
+            log.info("Incremental build: keeping existing docs directory")
+        else:
+            log.info("Full build: regenerating every target into docs directory")
+        output = OutputWriter()
+        
+        stage("static")
+        # Copy static files, skipping any whose docs/ copy is already identical
+        static_sync = StaticSync(hardlink=link_static)
+        if targets is None:
+            static_results = static_sync.sync_tree(static_path, docs_path)
+        else:
+            static_results = []
+            for name in sorted(t for t in targets if t.startswith("static:")):
+                rel_item = name.removeprefix("static:")
+                src_item = os.path.join(static_path, *rel_item.split("/"))
+                dest_item = os.path.join(docs_path, *rel_item.split("/"))
+                if os.path.exists(src_item):
+                    os.makedirs(os.path.dirname(dest_item), exist_ok=True)
+                    static_results.append(static_sync.sync_file(src_item, dest_item, rel_item))
+        for result in static_results:
+            if result.action == "mkdir":
+                log.detail(f"Created directory: {result.rel}")
+                continue
+            if result.action == "copied":
+                log.detail(f"Copied file: {result.rel} ({result.size} bytes, {result.method})", page=f"static/{result.rel}")
+            # Recorded only so a file deleted from static/ is pruned from docs/.
+            src_item = os.path.join(static_path, *result.rel.split("/"))
+            target = f"static:{result.rel}"
+            if not manifest.is_current(target, [src_item]):
+                manifest.record(target, [src_item], [os.path.join(docs_path, *result.rel.split("/"))])
+        log.info(static_sync.summary())
+
+        # Preserve repository-level CNAME if present (avoid wiping custom domain on rebuild)
+        repo_cname = os.path.join(workspace_root, "CNAME")
+        docs_cname = os.path.join(docs_path, "CNAME")
+        if os.path.exists(repo_cname) and wanted("cname"):
+            if static_sync.sync_file(repo_cname, docs_cname).action == "copied":
+                log.info("Copied repository CNAME to docs/CNAME")
+            if not manifest.is_current("cname", [repo_cname]):
+                manifest.record("cname", [repo_cname], [docs_cname])
+        
+        stage("pages")
+        # Render all markdown files in content/ -> docs/*.html, then every
+        # post in content/dev_diary/ -> docs/dev_diary/*.html. Both go out as
+        # one batch so --jobs can spread the whole corpus across cores.
+        md_files = [f for f in os.listdir(content_path) if f.lower().endswith(".md")]
+        if not md_files:
+            log.info("WARNING: No markdown files found in content/")
+        had_errors = False
+        stale_pages = []  # PageJob fields of every page that needs rendering
+        for md_name in sorted(md_files):
+            src_md = os.path.join(content_path, md_name)
+            out_html = os.path.join(docs_path, f"{os.path.splitext(md_name)[0]}.html")
+            name = f"page:{md_name}"
+            if not wanted(name):
+                continue
+            if is_current(name, [src_md, template_path], page_params(src_md)):
+                up_to_date += 1
+            else:
+                stale_pages.append((name, md_name, src_md, template_path, out_html, False))
+
+        blog_dir = os.path.join(content_path, "dev_diary")
+        blog_posts_out = os.path.join(docs_path, "dev_diary")
+        blog_md_files = []
+        if os.path.exists(blog_dir):
+            os.makedirs(blog_posts_out, exist_ok=True)
+            blog_md_files = [f for f in os.listdir(blog_dir) if f.lower().endswith(".md")]
+            for md_name in sorted(blog_md_files):
+                src_md = os.path.join(blog_dir, md_name)
+                out_html = os.path.join(blog_posts_out, f"{os.path.splitext(md_name)[0]}.html")
+                name = f"post:{md_name}"
+                if not wanted(name):
+                    continue
+                if is_current(name, [src_md, template_path], page_params(src_md)):
+                    up_to_date += 1
+                else:
+                    stale_pages.append((name, md_name, src_md, template_path, out_html, True))
+
+        # Each source is read and scanned once; the page, the blog index
+        # and the landing page all draw on the same entry.
+        content_index = ContentIndex(dates=page_dates)
+
+        def with_entry(job):
+            try:
+                return job._replace(entry=content_index.get(job.src_md))
+            except (OSError, UnicodeDecodeError):
+                return job  # render_page() rescans it and reports the failure
+
+        page_jobs = []
+        inline_stats = []  # per rendered page
+        block_stats = []
+        block_cache = None
+        if stale_pages:
+            # The markdown pipeline and the process pool load only when
+            # there is something to render.
+            from Gen_Content.block_cache import DEFAULT_SIZE, BlockCache
+            from Gen_Content.parallel_render import PageJob, render_pages
+
+            page_jobs = [with_entry(PageJob(*fields)) for fields in stale_pages]
+            if block_cache_size != 0:
+                block_cache = BlockCache.load(
+                    os.path.join(workspace_root, BLOCK_CACHE_FILE),
+                    DEFAULT_SIZE if block_cache_size is None else block_cache_size,
+                )
+        blog_announced = False
+
+        def announce_blog():
+            nonlocal blog_announced
+            if not blog_announced:
+                log.info("Generating blog posts from content/dev_diary/...")
+                blog_announced = True
+
+        def log_page_start(job):
+            if job.is_blog_post:
+                announce_blog()
+                log.detail(f"  Generating blog post: {job.md_name}", page=rel(job.src_md))
+            else:
+                log.detail(f"Generating page: {job.md_name} -> {os.path.basename(job.out_html)}", page=rel(job.src_md))
+
+        # render_pages() is the fault-isolation boundary between one page's
+        # markdown and the rest of the build: a page that raises comes back
+        # as a failed result carrying its message and full traceback. The
+        # broad catches below are the same boundary for the other stages;
+        # every one logs the message and full traceback, so nothing is lost.
+        rendered = (
+            render_pages(
+                page_jobs, workers=jobs, on_start=log_page_start,
+                inline_cache_size=inline_cache_size, block_cache=block_cache,
+            )
+            if page_jobs else ()
+        )
+        for result in rendered:
+            job = result.job
+            inline_stats.append(result.inline_cache)
+            block_stats.append(result.block_cache)
+            if profiler:
+                profiler.page(job.name, result.started, result.finished, result.worker)
+            if result.error is None:
+                output.tally(result.changed)
+                manifest.record(job.name, [job.src_md, job.template_path], [job.out_html], page_params(job.src_md))
+                continue
+            had_errors = True
+            manifest.forget(job.name)
+            if job.is_blog_post:
+                log.error(f"  ERROR building blog post {job.md_name}: {result.error}", page=rel(job.src_md))
+            else:
+                log.error(f"ERROR building {job.md_name}: {result.error}", page=rel(job.src_md))
+            log.error(result.traceback, page=rel(job.src_md))
+        if block_cache is not None:
+            block_cache.save()
+
+        if page_dates is not None:
+            # Before the blog index, which lists these dates and so reads
+            # the sidecar as one of its inputs.
+            page_dates.save()
+
+        # Generate blog index page from content/dev_diary/
+        stage("blog-index")
+        if not os.path.exists(blog_dir):
+            log.info("No dev_diary subdirectory found, skipping blog generation")
+        elif wanted("blog-index"):
+            announce_blog()
+            dev_diary_template = os.path.join(workspace_root, "dev_diary_template.html")
+            dev_diary_index = os.path.join(docs_path, "dev_diary.html")
+            index_inputs = [os.path.join(blog_dir, m) for m in sorted(blog_md_files)]
+            index_inputs.append(dev_diary_template)
+            if page_dates is not None:
+                index_inputs.append(page_dates.path)
+            if not os.path.exists(dev_diary_template):
+                log.info("WARNING: dev_diary_template.html not found")
+            elif is_current("blog-index", index_inputs, code_params):
+                up_to_date += 1
+            else:
+                log.info("Generating blog index page...")
+                try:
+                    from Gen_Content.generate_blog_index import generate_blog_index
+
+                    written = generate_blog_index(
+                        content_path, dev_diary_template, dev_diary_index, index=content_index, writer=output
+                    )
+                    manifest.record("blog-index", index_inputs, written, code_params)
+                except Exception as e:  # noqa: BLE001 -- see fault-isolation note above
+                    had_errors = True
+                    manifest.forget("blog-index")
+                    log.error(f"ERROR generating blog index: {e}")
+                    log.error(traceback.format_exc())
+        
+        # Generate landing page as index.html
+        stage("landing")
+        titlepage_template = os.path.join(workspace_root, "titlepage.html")
+        index_html = os.path.join(docs_path, "index.html")
+        
+        if wanted("landing"):
+            # The landing page lists every top-level page by title, shows the
+            # listening block and stamps the current year.
+            landing_inputs = [os.path.join(content_path, m) for m in sorted(md_files)]
+            landing_inputs += [titlepage_template, os.path.join(content_path, "listening.json")]
+            landing_params = dict(
+                code_params,
+                year=datetime.datetime.now(datetime.UTC).year,
+                dev_diary=os.path.isdir(blog_dir),
+            )
+            if os.path.exists(titlepage_template) and is_current("landing", landing_inputs, landing_params):
+                up_to_date += 1
+            elif os.path.exists(titlepage_template):
+                log.info("Generating landing page...")
+                try:
+                    from Gen_Content.generate_landing_page import generate_landing_page
+
+                    site_config = {
+                        "title": "Home - Portfolio",
+                        "site_title": "Bret Zanotelli",
+                        "site_description": "IT consultant. Linux daily driver. I make things talk to each other properly.",
+                        "site_author": "Bret Zanotelli",
+                        "description": "Personal portfolio featuring development projects, resume, and creative pursuits"
+                    }
+                    generate_landing_page(
+                        content_path, titlepage_template, index_html, site_config, index=content_index, writer=output
+                    )
+                    log.info("Landing page generated successfully as index.html")
+                    manifest.record("landing", landing_inputs, [index_html], landing_params)
+                except Exception as e:  # noqa: BLE001 -- see fault-isolation note above
+                    had_errors = True
+                    manifest.forget("landing")
+                    log.error(f"ERROR generating landing page: {e}")
+                    log.error(traceback.format_exc())
+            else:
+                log.info(f"WARNING: titlepage.html template not found at {titlepage_template}")
+                # Fallback to old behavior
+                resume_html = os.path.join(docs_path, "resume.html")
+                if os.path.exists(resume_html):
+                    shutil.copy2(resume_html, index_html)
+                    log.info("Set homepage: index.html copied from resume.html (fallback)")
+                    manifest.record("landing", [resume_html], [index_html])
+                else:
+                    generated = [os.path.join(docs_path, f"{os.path.splitext(m)[0]}.html") for m in md_files]
+                    generated = [p for p in generated if os.path.exists(p)]
+                    if generated:
+                        shutil.copy2(generated[0], index_html)
+                        log.info(f"Set homepage: index.html copied from {os.path.basename(generated[0])} (fallback)")
+                        manifest.record("landing", [generated[0]], [index_html])
+                    else:
+                        log.info("WARNING: No pages generated to set as index.html")
+
+        stage("finish")
+        # A targeted build never saw most targets, so it must not prune them.
+        if targets is None:
+            for removed in manifest.prune():
+                log.detail(f"Removed stale output: {removed}")
+        if not incremental:
+            # Everything this build produced is recorded in the manifest.
+            produced = {o for record in manifest.targets.values() for o in record["outputs"]}
+            docs_rel = rel(docs_path)
+            keep = {o.removeprefix(docs_rel + "/") for o in produced}
+            for removed in remove_unlisted(docs_path, keep):
+                log.detail(f"Removed stale output: docs/{removed}")
+        manifest.save()
+        if page_dates is not None:
+            page_dates.save()
+        log.info(output.summary())
+        if inline_stats:
+            from inline_cache import CacheStats
+
+            block_total = CacheStats.total(block_stats)
+            if block_cache is not None:
+                # Workers evict from their own copies; what the build's
+                # cache dropped is counted on it.
+                block_total = block_total._replace(evictions=block_cache.evictions)
+            for name, cache in (("Inline cache", CacheStats.total(inline_stats)), ("Block cache", block_total)):
+                if cache.hits or cache.misses:
+                    log.info(cache.summary(name))
+        if incremental:
+            log.info(f"Skipped {up_to_date} up-to-date target(s)")
+
+        if had_errors:
+            log.info("Build completed with errors (see above).")
+            return False
+        log.info("Build completed successfully!")
+        return True
+        
+    except Exception as e:  # noqa: BLE001 -- last-resort boundary for the whole build
+        log.error(f"ERROR: {e}")
+        log.error(traceback.format_exc())
+        return False
@@ -0,0 +1,132 @@
+"""Buffered build log.
+
+Opens log.txt once for the whole build instead of once per line, and only
+forces it to disk on an error or when the build ends. Optionally mirrors
+every line to a JSON Lines file with the stage, the page being worked on
+and the elapsed build time, for tooling that wants more than grep.
+
+Quiet mode keeps every line in the log files but prints only errors,
+warnings and a one-line summary per stage to the console.
+"""
+import datetime
+import io
+import json
+import sys
+import time
+
+_BUFFER_SIZE = 1 << 16
+
+
+class BuildLog:
+    def __init__(self, path, json_path=None, quiet=False, stream=None):
+        self.quiet = quiet
+        # Captured now: quiet mode redirects sys.stdout during the build,
+        # and summaries must still reach the real console.
+        self.stream = stream or sys.stdout
+        self._start = time.perf_counter()
+        self._file = open(path, "w", encoding="utf-8", buffering=_BUFFER_SIZE)
+        self._json = open(json_path, "w", encoding="utf-8", buffering=_BUFFER_SIZE) if json_path else None
+        self._stage = None
+        self._stage_start = self._start
+        self._stage_lines = 0
+        self._stage_errors = 0
+        self._file.write(f"Build Operation - {datetime.datetime.now(datetime.UTC)}\n")
+        self._file.write("=" * 50 + "\n\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _elapsed_ms(self, since=None):
+        return round((time.perf_counter() - (since or self._start)) * 1000, 3)
+
+    def _write(self, level, message, page, echo):
+        now = datetime.datetime.now(datetime.UTC)
+        self._file.write(f"{now.strftime('%H:%M:%S')} - {message}\n")
+        if self._json:
+            record = {
+                "time": now.isoformat(timespec="milliseconds"),
+                "elapsed_ms": self._elapsed_ms(),
+                "level": level,
+                "stage": self._stage,
+                "page": page,
+                "message": message,
+            }
+            self._json.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._stage_lines += 1
+        if echo:
+            print(message, file=self.stream)
+
+    def stage(self, name):
+        """Start a named stage (static, pages, blog-index, ...)."""
+        self._end_stage()
+        self._stage = name
+        self._stage_start = time.perf_counter()
+
+    def _end_stage(self):
+        if self.quiet and self._stage and self._stage_lines:
+            errors = f", {self._stage_errors} error(s)" if self._stage_errors else ""
+            print(
+                f"{self._stage}: {self._stage_lines} line(s){errors} "
+                f"in {self._elapsed_ms(self._stage_start):.1f} ms",
+                file=self.stream,
+            )
+        self._stage_lines = 0
+        self._stage_errors = 0
+
+    def info(self, message, page=None):
+        """A stage-level step. Quiet mode still prints warnings."""
+        loud = message.lstrip().startswith("WARNING")
+        self._write("warning" if loud else "info", message, page, echo=loud or not self.quiet)
+
+    def detail(self, message, page=None):
+        """A per-file line: one per copied asset or rendered page."""
+        self._write("detail", message, page, echo=not self.quiet)
+
+    def error(self, message, page=None):
+        """Always printed, and pushed to disk at once in case the build dies."""
+        self._stage_errors += 1
+        self._write("error", message, page, echo=True)
+        self.flush()
+
+    def capture(self):
+        """A text stream for contextlib.redirect_stdout that files whatever
+        the generators print as detail lines of the current stage."""
+        return _LineCapture(self)
+
+    def flush(self):
+        self._file.flush()
+        if self._json:
+            self._json.flush()
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._end_stage()
+        self._file.close()
+        if self._json:
+            self._json.close()
+
+
+class _LineCapture(io.TextIOBase):
+    def __init__(self, log):
+        self._log = log
+        self._partial = ""
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            if line.strip():
+                self._log.detail(line)
+        return len(text)
+
+    def flush(self):
+        if self._partial.strip():
+            self._log.detail(self._partial)
+        self._partial = ""
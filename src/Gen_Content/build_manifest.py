@@ -0,0 +1,216 @@
+"""Content-hash manifest behind incremental builds.
+
+Records, for every build target, a digest of each input it was rendered
+from and the outputs it produced. An incremental build asks the manifest
+whether a target is still current, re-renders only the ones that are not,
+and deletes outputs whose target has disappeared (e.g. a deleted post).
+
+File digests are cached against (size, mtime_ns), so a no-op rebuild only
+has to stat its inputs rather than read them.
+"""
+import hashlib
+import json
+import os
+import time
+
+from Gen_Content.output_writer import atomic_write_json
+
+MANIFEST_VERSION = 1
+
+# Filesystems with coarse timestamps can record a second write inside the
+# same mtime tick as the first. A file hashed that soon after it was last
+# modified is re-hashed next time instead of trusting its stat (the same
+# "racy clean" guard git uses for its index).
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def rel_path(path, root):
+    """`path` relative to `root`, with forward slashes on every platform."""
+    return os.path.relpath(path, root).replace(os.sep, "/")
+
+
+def sha256_file(path):
+    """Hex sha256 of a file's bytes, read in 64 KiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """Input digests and produced outputs for each named build target.
+
+    Paths are stored relative to `root` with forward slashes, so a manifest
+    written on one checkout stays valid in another.
+    """
+
+    def __init__(self, path, root):
+        self.path = path
+        self.root = root
+        self.files = {}    # rel path -> [size, mtime_ns, sha256]
+        self.targets = {}  # name -> {"inputs": {...}, "outputs": [...]}
+        self._seen = set()
+        self._hashed = set()
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path, root, keep_targets=True):
+        """Read the manifest at `path`, or start empty.
+
+        A missing, corrupt or older-version manifest is not an error: it
+        just means nothing is known to be current, so everything rebuilds.
+        With keep_targets=False only the file-digest cache is kept, which is
+        what a full (non-incremental) build wants.
+        """
+        manifest = cls(path, root)
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return manifest
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return manifest
+        files = data.get("files")
+        targets = data.get("targets")
+        if isinstance(files, dict):
+            manifest.files = files
+        if keep_targets and isinstance(targets, dict):
+            manifest.targets = targets
+        return manifest
+
+    def _rel(self, path):
+        return rel_path(path, self.root)
+
+    def _abs(self, rel):
+        return os.path.join(self.root, *rel.split("/"))
+
+    def file_hash(self, path):
+        """sha256 of a file's bytes, or None if it does not exist."""
+        rel = self._rel(path)
+        self._hashed.add(rel)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        cached = self.files.get(rel)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+        digest = sha256_file(path)
+        racy = time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS
+        self.files[rel] = [st.st_size, -1 if racy else st.st_mtime_ns, digest]
+        self._dirty = True
+        return digest
+
+    def fingerprint(self, paths):
+        """One digest covering every file in `paths` (e.g. generator code)."""
+        digest = hashlib.sha256()
+        for path in sorted(paths):
+            digest.update(f"{self._rel(path)}\0{self.file_hash(path)}\n".encode())
+        return digest.hexdigest()
+
+    def signature(self, inputs, params=None):
+        """Map each input file (and each non-file parameter) to its digest."""
+        sig = {self._rel(p): self.file_hash(p) for p in inputs}
+        for key, value in (params or {}).items():
+            sig[f"param:{key}"] = str(value)
+        return sig
+
+    def is_current(self, name, inputs, params=None):
+        """True when `name` was last built from exactly these inputs and
+        every output it produced still exists. Marks `name` as part of this
+        build so prune() keeps it."""
+        self._seen.add(name)
+        record = self.targets.get(name)
+        if not record or record.get("inputs") != self.signature(inputs, params):
+            return False
+        return all(os.path.exists(self._abs(o)) for o in record.get("outputs", []))
+
+    def record(self, name, inputs, outputs, params=None):
+        """Remember a successful build of `name`.
+
+        Inputs are re-digested here rather than reusing the pre-build
+        signature, because a generator may rewrite its own source (page-date
+        injection). Outputs the target produced last time but not this time
+        (e.g. a blog index that lost a page) are deleted.
+        """
+        self._seen.add(name)
+        new_outputs = [self._rel(o) for o in outputs]
+        previous = self.targets.get(name, {}).get("outputs", [])
+        for rel in set(previous) - set(new_outputs):
+            self._remove_output(rel)
+        self.targets[name] = {
+            "inputs": self.signature(inputs, params),
+            "outputs": new_outputs,
+        }
+        self._dirty = True
+
+    def dependents(self, paths):
+        """Names of recorded targets that read any of `paths`.
+
+        This is the input -> target edge of the dependency graph; paths
+        no target reads (a brand-new post, say) map to nothing, and callers
+        should fall back to a whole incremental build for those.
+        """
+        wanted = {self._rel(p) for p in paths}
+        return {
+            name for name, record in self.targets.items()
+            if wanted.intersection(record.get("inputs", {}))
+        }
+
+    def forget(self, name):
+        """Drop a target's record (its build failed) so it retries next time."""
+        self._seen.add(name)
+        if self.targets.pop(name, None) is not None:
+            self._dirty = True
+
+    def _remove_output(self, rel):
+        path = self._abs(rel)
+        # Only ever delete inside the root, whatever a hand-edited or
+        # corrupted manifest claims.
+        root = os.path.abspath(self.root)
+        if os.path.commonpath([root, os.path.abspath(path)]) != root:
+            return None
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return None
+        return rel
+
+    def prune(self):
+        """Delete outputs of targets this build never mentioned.
+
+        Returns the relative paths actually removed. Outputs still claimed
+        by a live target are left alone.
+        """
+        stale = [name for name in self.targets if name not in self._seen]
+        if not stale:
+            return []
+        live = {o for name in self._seen for o in self.targets.get(name, {}).get("outputs", [])}
+        removed = []
+        for name in stale:
+            for rel in self.targets.pop(name).get("outputs", []):
+                if rel not in live and self._remove_output(rel):
+                    removed.append(rel)
+        self._dirty = True
+        return removed
+
+    def save(self):
+        """Write the manifest atomically, and only if something changed."""
+        if not self._dirty:
+            return
+        # Digests of files no target reads any more (deleted sources,
+        # renamed posts) would otherwise accumulate forever. Inputs of
+        # targets this build skipped (--only, a watch rebuild) are kept,
+        # or the next build would have to read them all again.
+        keep = set(self._hashed)
+        for record in self.targets.values():
+            keep.update(record.get("inputs", {}))
+        self.files = {rel: entry for rel, entry in self.files.items() if rel in keep}
+        atomic_write_json(
+            self.path,
+            {"version": MANIFEST_VERSION, "files": self.files, "targets": self.targets},
+            indent=1,
+            sort_keys=True,
+        )
+        self._dirty = False
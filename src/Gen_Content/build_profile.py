@@ -0,0 +1,97 @@
+"""Build profiler behind `main.py --profile`.
+
+Times every stage and every rendered page, prints the stage totals and the
+slowest pages, and writes a Chrome trace-event file (open it in
+chrome://tracing or https://ui.perfetto.dev) with the stages on one lane
+and one lane per render worker. Optionally runs the build under cProfile
+and dumps pstats data for `python -m pstats` or snakeviz.
+
+Page timings are taken inside the worker with time.perf_counter(), which
+is the system-wide monotonic clock on Linux and macOS, so worker spans
+line up with the main process's stage spans on the timeline.
+"""
+import cProfile
+import json
+import os
+import time
+
+SLOWEST_PAGES = 10
+
+
+class BuildProfiler:
+    def __init__(self, stats_path=None):
+        self.stats_path = stats_path
+        self.pid = os.getpid()
+        self.origin = time.perf_counter()
+        self.stages = []  # (name, start, end)
+        self.pages = []   # (name, start, end, worker pid)
+        self._stage = None
+        self._cprofile = cProfile.Profile() if stats_path else None
+
+    def __enter__(self):
+        if self._cprofile:
+            self._cprofile.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stage(None)
+        if self._cprofile:
+            self._cprofile.disable()
+            os.makedirs(os.path.dirname(os.path.abspath(self.stats_path)), exist_ok=True)
+            self._cprofile.dump_stats(self.stats_path)
+
+    def stage(self, name):
+        """Close the running stage and, unless name is None, open another."""
+        now = time.perf_counter()
+        if self._stage:
+            self.stages.append((self._stage[0], self._stage[1], now))
+        self._stage = (name, now) if name else None
+
+    def page(self, name, start, end, worker):
+        self.pages.append((name, start, end, worker))
+
+    def report(self, top=SLOWEST_PAGES):
+        """Stage totals in build order, then the `top` slowest pages."""
+        lines = ["Stage timings:"]
+        for name, start, end in self.stages:
+            lines.append(f"  {name:<12} {(end - start) * 1000:9.1f} ms")
+        if self.pages:
+            slowest = sorted(self.pages, key=lambda p: p[2] - p[1], reverse=True)[:top]
+            lines.append(f"Slowest pages ({len(slowest)} of {len(self.pages)}):")
+            for name, start, end, worker in slowest:
+                where = "" if worker == self.pid else f"  [worker {worker}]"
+                lines.append(f"  {(end - start) * 1000:9.1f} ms  {name}{where}")
+        return "\n".join(lines)
+
+    def _us(self, seconds):
+        return round((seconds - self.origin) * 1_000_000, 1)
+
+    def trace_events(self):
+        """Chrome trace-event records: complete ("X") events per stage and
+        page, plus lane names. Pages rendered in the main process share the
+        stage lane, nested under the pages stage."""
+        events = [
+            {"ph": "M", "name": "process_name", "pid": self.pid, "tid": 0, "args": {"name": "site build"}},
+            {"ph": "M", "name": "thread_name", "pid": self.pid, "tid": self.pid, "args": {"name": "main"}},
+        ]
+        for name, start, end in self.stages:
+            events.append({
+                "ph": "X", "cat": "stage", "name": name, "pid": self.pid, "tid": self.pid,
+                "ts": self._us(start), "dur": self._us(end) - self._us(start),
+            })
+        for worker in sorted({p[3] for p in self.pages} - {self.pid}):
+            events.append({
+                "ph": "M", "name": "thread_name", "pid": self.pid, "tid": worker,
+                "args": {"name": f"worker {worker}"},
+            })
+        for name, start, end, worker in self.pages:
+            events.append({
+                "ph": "X", "cat": "page", "name": name, "pid": self.pid, "tid": worker,
+                "ts": self._us(start), "dur": self._us(end) - self._us(start),
+            })
+        return events
+
+    def write_trace(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, handle)
@@ -0,0 +1,190 @@
+"""One-pass scan of the markdown sources.
+
+Every generator needs a few facts about a markdown file -- its title, its
+page date, a first-paragraph excerpt -- and each used to read and regex the
+file on its own, so a diary post was opened and scanned once for its page
+and again for the blog index. ContentIndex reads and scans each file once
+per build, the first time anything asks for it, and hands the same
+ContentEntry to generate_page(), generate_blog_index() and
+generate_landing_page().
+
+A file without a page date only has one fixed (written into it, or into
+the PageDates sidecar) when its own page is rendered. The blog index and
+landing page merely list pages, so they look entries up with peek(),
+which never writes: a landing-only build leaves content/ untouched.
+"""
+import os
+import re
+from datetime import UTC, datetime
+from typing import NamedTuple
+
+from Gen_Content.extract_title_markdown import extract_title
+
+_PAGE_DATE = re.compile(r'<!--\s*page-date:\s*(\d{4}-\d{2}-\d{2})\s*-->')
+_HTML_COMMENT = re.compile(r'<!--.*?-->', re.DOTALL)
+_FILENAME_DATE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_WHITESPACE = re.compile(r"\s+")
+_LANDING_TITLE = '<!-- landing-title:'
+
+DESCRIPTION_LEN = 180
+EXCERPT_LEN = 200
+DEFAULT_DESCRIPTION = "Professional resume and portfolio"
+DEFAULT_EXCERPT = "Read more..."
+
+
+class ContentEntry(NamedTuple):
+    path: str
+    markdown: str               # HTML comments stripped, ready to render
+    title: str | None           # first "# " heading, None if there is none
+    date: str                   # YYYY-MM-DD
+    description: str            # meta description (first paragraph)
+    excerpt: str                # blog-index excerpt (first paragraph)
+    landing_title: str | None   # <!-- landing-title: ... --> override
+    dated: bool                 # date is fixed in the file or the sidecar
+
+
+def _inject_page_date(markdown: str, date_str: str) -> str:
+    """
+    Inject page-date comment at the top of the markdown file (after any existing comments)
+    """
+    comment = f'<!-- page-date: {date_str} -->\n'
+
+    # If file already starts with HTML comments, add after them
+    # Otherwise, add at the very top
+    lines = markdown.split('\n')
+    insert_pos = 0
+
+    for i, line in enumerate(lines):
+        if line.strip().startswith('<!--'):
+            # Find the end of this comment block
+            if '-->' in line:
+                insert_pos = i + 1
+            else:
+                # Multi-line comment, find closing
+                for j in range(i + 1, len(lines)):
+                    if '-->' in lines[j]:
+                        insert_pos = j + 1
+                        break
+        elif line.strip() and not line.strip().startswith('#'):
+            # Hit actual content, stop looking
+            break
+
+    lines.insert(insert_pos, comment.rstrip())
+    return '\n'.join(lines)
+
+
+def _first_paragraph(markdown: str) -> str | None:
+    """First line of plain prose, whitespace collapsed"""
+    for line in markdown.splitlines():
+        s = line.strip()
+        if not s:
+            continue
+        # Skip headings, images, lists, blockquotes, links, and HTML tags
+        if s.startswith(("#", "!", "-", "*", ">", "[", "<")):
+            continue
+        return _WHITESPACE.sub(" ", s)
+    return None
+
+
+def _truncate(text: str | None, max_len: int, default: str) -> str:
+    if text is None:
+        return default
+    return (text[:max_len] + "…") if len(text) > max_len else text
+
+
+def _landing_title(markdown: str) -> str | None:
+    # Only the first few lines count: <!-- landing-title: Resume -->
+    for line in markdown.splitlines()[:5]:
+        if line.strip().startswith(_LANDING_TITLE):
+            return line.strip()[len(_LANDING_TITLE):].strip().removesuffix('-->').strip()
+    return None
+
+
+def stamp_page_date(path, page_date, dates=None):
+    """Fix `page_date` as the date of `path`, which has none yet: recorded
+    in `dates` (a PageDates sidecar) when given, otherwise written into the
+    file as a comment."""
+    if dates is not None:
+        dates.assign(path, page_date)
+        print(f"  → Recorded page-date: {page_date} for {os.path.basename(path)}")
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        markdown = f.read()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(_inject_page_date(markdown, page_date))
+    print(f"  → Added page-date: {page_date} to {os.path.basename(path)}")
+
+
+def scan_markdown(path, dates=None, stamp=True) -> ContentEntry:
+    """Read one markdown file and pull out everything the generators need.
+
+    A file without a page-date comment is given a date that then stays
+    fixed on later builds: the date in its filename (YYYY-MM-DD-title.md)
+    when there is one, otherwise today. With `stamp`, it is fixed now (see
+    stamp_page_date); without, nothing is written and the entry comes back
+    with `dated` False.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        markdown = f.read()
+
+    match = _PAGE_DATE.search(markdown)
+    dated = True
+    if match:
+        page_date = match.group(1)
+    elif dates is not None and dates.lookup(path):
+        page_date = dates.lookup(path)
+    else:
+        filename_date = _FILENAME_DATE.match(os.path.basename(path))
+        page_date = filename_date.group(1) if filename_date else datetime.now(UTC).strftime('%Y-%m-%d')
+        dated = False
+        if stamp:
+            stamp_page_date(path, page_date, dates)
+            dated = True
+
+    markdown_clean = _HTML_COMMENT.sub('', markdown)
+    try:
+        title = extract_title(markdown_clean)
+    except ValueError:
+        title = None
+    paragraph = _first_paragraph(markdown_clean)
+    return ContentEntry(
+        path=str(path),
+        markdown=markdown_clean,
+        title=title,
+        date=page_date,
+        description=_truncate(paragraph, DESCRIPTION_LEN, DEFAULT_DESCRIPTION),
+        excerpt=_truncate(paragraph, EXCERPT_LEN, DEFAULT_EXCERPT),
+        landing_title=_landing_title(markdown),
+        dated=dated,
+    )
+
+
+class ContentIndex:
+    """ContentEntry per markdown file, scanned on first request and then
+    shared for the rest of the build. With a PageDates sidecar, scanning
+    never writes to the sources (read-only source mode)."""
+
+    def __init__(self, dates=None):
+        self.dates = dates
+        self._entries = {}
+
+    def get(self, path) -> ContentEntry:
+        """The entry of a page about to be rendered; an undated file has
+        its date fixed now."""
+        entry = self.peek(path)
+        if not entry.dated:
+            stamp_page_date(path, entry.date, self.dates)
+            entry = self._entries[os.path.abspath(path)] = entry._replace(dated=True)
+        return entry
+
+    def peek(self, path) -> ContentEntry:
+        """The entry of a page that is only listed (title, date, excerpt);
+        never writes anything."""
+        key = os.path.abspath(path)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = scan_markdown(path, self.dates, stamp=False)
+        return entry
+
+    def __len__(self):
+        return len(self._entries)
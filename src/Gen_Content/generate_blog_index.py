@@ -1,54 +1,10 @@
 import os
-import re
-from datetime import UTC, datetime
 from math import ceil
 from pathlib import Path
 
+from Gen_Content.content_index import ContentIndex
+from Gen_Content.output_writer import OutputWriter
 
-def _extract_page_date(markdown: str) -> tuple[str, bool]:
-    """Extract page date from HTML comment or filename"""
-    pattern = r'<!--\s*page-date:\s*(\d{4}-\d{2}-\d{2})\s*-->'
-    match = re.search(pattern, markdown)
-    if match:
-        return match.group(1), True
-    return datetime.now(UTC).strftime('%Y-%m-%d'), False
-
-def _inject_page_date(markdown: str, date_str: str) -> str:
-    """Inject page-date comment at the top of the markdown file"""
-    comment = f'<!-- page-date: {date_str} -->\n'
-    lines = markdown.split('\n')
-    insert_pos = 0
-    
-    for i, line in enumerate(lines):
-        if line.strip().startswith('<!--'):
-            if '-->' in line:
-                insert_pos = i + 1
-            else:
-                for j in range(i + 1, len(lines)):
-                    if '-->' in lines[j]:
-                        insert_pos = j + 1
-                        break
-        elif line.strip() and not line.strip().startswith('#'):
-            break
-    
-    lines.insert(insert_pos, comment.rstrip())
-    return '\n'.join(lines)
-
-def _extract_excerpt(markdown: str, max_len: int = 200) -> str:
-    """Extract first paragraph as excerpt"""
-    # Strip HTML comments
-    markdown = re.sub(r'<!--.*?-->', '', markdown, flags=re.DOTALL)
-    
-    for line in markdown.splitlines():
-        s = line.strip()
-        if not s:
-            continue
-        # Skip headings, images, lists, blockquotes, links, HTML tags
-        if s.startswith(("#", "!", "-", "*", ">", "[", "<")):
-            continue
-        s = re.sub(r"\s+", " ", s)
-        return (s[:max_len] + "…") if len(s) > max_len else s
-    return "Read more..."
 
 def _extract_title_from_filename(filename: str) -> str:
     """Extract title from blog post filename: YYYY-MM-DD-title-here.md"""
@@ -101,7 +57,7 @@ def _build_pagination_nav(current_page: int, total_pages: int, base_name: str, s
     return "\n".join(nav_parts) + "\n"
 
 
-def generate_blog_index(content_dir: str, template_path: str, dest_path: str, subdocs_dir: str = "dev_diary", posts_per_page: int = 5, site_base_url: str | None = None):
+def generate_blog_index(content_dir: str, template_path: str, dest_path: str, subdocs_dir: str = "dev_diary", posts_per_page: int = 5, site_base_url: str | None = None, index: ContentIndex | None = None, writer: OutputWriter | None = None):
     """
     Generate a blog index page listing all posts in content/dev_diary/
     
@@ -110,55 +66,35 @@ def generate_blog_index(content_dir: str, template_path: str, dest_path: str, su
         template_path: Path to dev_diary_template.html
         dest_path: Output path for dev_diary.html
         subdocs_dir: Subdirectory name containing blog posts (default: dev_diary)
+        index: ContentIndex shared with the rest of the build, so posts
+            already scanned for their own pages are not read again
+        writer: OutputWriter that tallies written/unchanged pages
+
+    Returns:
+        List of index page paths written (dest_path plus any -page-N pages)
     """
     print(f"Generating blog index from {content_dir}/{subdocs_dir}")
     
     blog_dir = Path(content_dir) / subdocs_dir
     if not blog_dir.exists():
         print(f"  ⚠ Blog directory not found: {blog_dir}")
-        return
+        return []
     
     # Get all .md files in dev_diary/
     posts = []
+    if index is None:
+        index = ContentIndex()
     for md_file in sorted(blog_dir.glob("*.md"), reverse=True):
-        with open(md_file, 'r', encoding='utf-8') as f:
-            markdown = f.read()
-        
-        # Extract or inject date
-        page_date, date_found = _extract_page_date(markdown)
-        if not date_found:
-            # Try to extract from filename (YYYY-MM-DD-title.md)
-            filename_date_match = re.match(r'(\d{4}-\d{2}-\d{2})', md_file.name)
-            if filename_date_match:
-                page_date = filename_date_match.group(1)
-            
-            # Inject the date into the file
-            markdown = _inject_page_date(markdown, page_date)
-            with open(md_file, 'w', encoding='utf-8') as f:
-                f.write(markdown)
-            print(f"  → Added page-date: {page_date} to {md_file.name}")
-        
-        # Extract title from file content
-        import sys
-        sys.path.insert(0, os.path.dirname(__file__))
-        from extract_title_markdown import extract_title
-        
-        markdown_clean = re.sub(r'<!--.*?-->', '', markdown, flags=re.DOTALL)
-        try:
-            title = extract_title(markdown_clean)
-        except ValueError:
-            # Fallback to filename-based title
-            title = _extract_title_from_filename(md_file.name)
-        
-        excerpt = _extract_excerpt(markdown_clean)
+        entry = index.peek(md_file)
         
         # Generate HTML filename
         html_filename = md_file.stem + ".html"
         
         posts.append({
-            'title': title,
-            'date': page_date,
-            'excerpt': excerpt,
+            # Fallback to filename-based title
+            'title': entry.title or _extract_title_from_filename(md_file.name),
+            'date': entry.date,
+            'excerpt': entry.excerpt,
             'url': f"{subdocs_dir}/{html_filename}",
             'filename': md_file.name
         })
@@ -176,6 +112,9 @@ def generate_blog_index(content_dir: str, template_path: str, dest_path: str, su
     with open(template_path, 'r', encoding='utf-8') as f:
         template = f.read()
 
+    if writer is None:
+        writer = OutputWriter()
+    written = []
     for page_num in range(1, total_pages + 1):
         start_idx = (page_num - 1) * posts_per_page
         page_posts = posts[start_idx:start_idx + posts_per_page]
@@ -203,10 +142,11 @@ def generate_blog_index(content_dir: str, template_path: str, dest_path: str, su
             page_html = page_html.replace(posts_html, posts_html + pagination_nav)
 
         page_dest = base_path if page_num == 1 else base_path.with_name(f"{base_name}-page-{page_num}{suffix}")
-        os.makedirs(page_dest.parent, exist_ok=True)
-        with open(page_dest, 'w', encoding='utf-8') as f:
-            f.write(page_html)
-
-        print(f"Blog index written to {page_dest}")
+        written.append(str(page_dest))
+        if writer.write(str(page_dest), page_html):
+            print(f"Blog index written to {page_dest}")
+        else:
+            print(f"Blog index unchanged: {page_dest}")
 
     print(f"Found {len(posts)} post(s) across {total_pages} page(s): {[p['title'] for p in posts]}")
+    return written
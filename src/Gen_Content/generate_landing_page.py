@@ -1,10 +1,12 @@
 import datetime
 import os
 
+from Gen_Content.content_index import ContentIndex
+from Gen_Content.output_writer import OutputWriter
 from Gen_Content.render_listening import load_listening, render_listening
 
 
-def generate_landing_page(content_path, template_path, dest_path, site_config=None):
+def generate_landing_page(content_path, template_path, dest_path, site_config=None, index=None, writer=None):
     """
     Generate a landing page that lists all available content pages.
     
@@ -13,6 +15,9 @@ def generate_landing_page(content_path, template_path, dest_path, site_config=No
         template_path: Path to titlepage.html template
         dest_path: Destination path for generated index.html
         site_config: Optional dict with site metadata (title, description, author)
+        index: ContentIndex shared with the rest of the build, so pages
+            already scanned for their own HTML are not read again
+        writer: OutputWriter that tallies written/unchanged pages
     """
     # Default configuration
     config = {
@@ -29,47 +34,21 @@ def generate_landing_page(content_path, template_path, dest_path, site_config=No
     
     # Scan content directory for markdown files
     md_files = []
+    if index is None:
+        index = ContentIndex()
     if os.path.exists(content_path):
         for filename in sorted(os.listdir(content_path)):
             if filename.lower().endswith('.md'):
                 md_path = os.path.join(content_path, filename)
                 html_name = f"{os.path.splitext(filename)[0]}.html"
                 
-                # Try to extract title from the markdown file
+                # Title: landing-title override, then the page's own
+                # heading, then the filename
                 try:
-                    with open(md_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Check for landing page title override comment
-                    page_title = None
-                    for line in content.splitlines()[:5]:  # Check first 5 lines
-                        if line.strip().startswith('<!-- landing-title:'):
-                            # Extract title from comment: <!-- landing-title: Resume -->
-                            page_title = line.strip()[19:].strip().removesuffix('-->').strip()
-                            break
-                    
-                    # If no override, use extract_title function
+                    entry = index.peek(md_path)
+                    page_title = entry.landing_title or entry.title
                     if not page_title:
-                        try:
-                            import sys
-                            sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-                            from Gen_Content.extract_title_markdown import extract_title
-                            page_title = extract_title(content)
-                        # Broad on purpose: this is one link in a best-effort
-                        # title-extraction chain (import/parse -> heading ->
-                        # filename), so any failure here should fall through
-                        # rather than be caught by type.
-                        except Exception as exc:  # noqa: BLE001
-                            print(f"  Note: extract_title failed for {filename}, "
-                                  f"falling back to heading/filename: {exc}")
-                            # Fallback: look for first # heading
-                            for line in content.splitlines():
-                                if line.strip().startswith('# '):
-                                    page_title = line.strip()[2:].strip()
-                                    break
-                            else:
-                                # Use filename as title
-                                page_title = os.path.splitext(filename)[0].replace('_', ' ').replace('-', ' ').title()
+                        page_title = os.path.splitext(filename)[0].replace('_', ' ').replace('-', ' ').title()
                     
                     md_files.append({
                         'filename': filename,
@@ -143,10 +122,9 @@ def generate_landing_page(content_path, template_path, dest_path, site_config=No
         .replace("{{ ListeningStamp }}", listening_stamp)
     )
     
-    # Write output
-    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-    with open(dest_path, 'w', encoding='utf-8') as f:
-        f.write(landing_html)
-    
-    print(f"Landing page written to {dest_path}")
+    # Write output, unless it is already byte-for-byte this page
+    if (writer or OutputWriter()).write(dest_path, landing_html):
+        print(f"Landing page written to {dest_path}")
+    else:
+        print(f"Landing page unchanged: {dest_path}")
     print(f"Found {len(md_files)} page(s): {[p['title'] for p in md_files]}")
@@ -1,27 +1,10 @@
-import os
-import re
 from datetime import UTC, datetime
 from pathlib import Path
 
+from block_to_html import iter_markdown_html
+from Gen_Content.content_index import scan_markdown
+from Gen_Content.output_writer import OutputWriter
 
-def _strip_html_comments(markdown: str) -> str:
-    """Remove HTML comments from markdown"""
-    return re.sub(r'<!--.*?-->', '', markdown, flags=re.DOTALL)
-
-def _first_paragraph(markdown: str, max_len: int = 180) -> str:
-    """Extract first non-heading paragraph for meta description"""
-    # Strip HTML comments first
-    markdown = _strip_html_comments(markdown)
-    for line in markdown.splitlines():
-        s = line.strip()
-        if not s:
-            continue
-        # Skip headings, images, lists, blockquotes, links, and HTML tags
-        if s.startswith(("#", "!", "-", "*", ">", "[", "<")):
-            continue
-        s = re.sub(r"\s+", " ", s)
-        return (s[:max_len] + "…") if len(s) > max_len else s
-    return "Professional resume and portfolio"
 
 def _to_canonical(base_url: str, dest_path: str) -> str:
     """Generate canonical URL from destination path"""
@@ -40,102 +23,53 @@ def _to_canonical(base_url: str, dest_path: str) -> str:
         base_url += "/"
     return (base_url.rstrip("/") + url_path).replace("//", "/")
 
-def _extract_page_date(markdown: str) -> tuple[str, bool]:
-    """
-    Extract page date from HTML comment: <!-- page-date: YYYY-MM-DD -->
-    Returns (date_string, found_in_file)
-    If not found, returns (today's date, False)
-    """
-    pattern = r'<!--\s*page-date:\s*(\d{4}-\d{2}-\d{2})\s*-->'
-    match = re.search(pattern, markdown)
-    if match:
-        return match.group(1), True
-    else:
-        # Return today's date in YYYY-MM-DD format
-        return datetime.now(UTC).strftime('%Y-%m-%d'), False
-
-def _inject_page_date(markdown: str, date_str: str) -> str:
-    """
-    Inject page-date comment at the top of the markdown file (after any existing comments)
-    """
-    comment = f'<!-- page-date: {date_str} -->\n'
-    
-    # If file already starts with HTML comments, add after them
-    # Otherwise, add at the very top
-    lines = markdown.split('\n')
-    insert_pos = 0
-    
-    for i, line in enumerate(lines):
-        if line.strip().startswith('<!--'):
-            # Find the end of this comment block
-            if '-->' in line:
-                insert_pos = i + 1
-            else:
-                # Multi-line comment, find closing
-                for j in range(i + 1, len(lines)):
-                    if '-->' in lines[j]:
-                        insert_pos = j + 1
-                        break
-        elif line.strip() and not line.strip().startswith('#'):
-            # Hit actual content, stop looking
-            break
-    
-    lines.insert(insert_pos, comment.rstrip())
-    return '\n'.join(lines)
-
-def _render_markdown(markdown: str, page_date: str | None = None, is_blog_post: bool = False) -> str:
-    """Convert markdown to HTML using existing pipeline"""
-    import sys
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-    from block_to_html import markdown_to_html_node
-
-    html = markdown_to_html_node(markdown).to_html()
-
-    if is_blog_post and page_date:
+def _post_date_stamp(page_date: str) -> str | None:
+    """The readable date line a blog post gets after its title"""
+    try:
         # Parse ISO date to readable format
-        try:
-            date_obj = datetime.strptime(page_date, '%Y-%m-%d').replace(tzinfo=UTC)
-            readable_date = date_obj.strftime('%B %d, %Y')
+        date_obj = datetime.strptime(page_date, '%Y-%m-%d').replace(tzinfo=UTC)
+    except ValueError as exc:
+        # page_date didn't match YYYY-MM-DD -- skip the date stamp
+        # rather than fail the whole page build over it.
+        print(f"  Warning: could not parse page_date {page_date!r}: {exc}")
+        return None
+    return f'<p class="post-date">{date_obj.strftime("%B %d, %Y")}</p>'
+
+def _content_fragments(body, date_stamp: str | None = None):
+    """The page body (HTML, one block per fragment), date-stamped"""
+    stamped = date_stamp is None
+    for fragment in body:
+        if not stamped and '</h1>' in fragment:
             # Inject date after h1 title
-            html = html.replace('</h1>', f'</h1><p class="post-date">{readable_date}</p>', 1)
-        except ValueError as exc:
-            # page_date didn't match YYYY-MM-DD -- skip the date stamp
-            # rather than fail the whole page build over it.
-            print(f"  Warning: could not parse page_date {page_date!r}: {exc}")
-
-    return html
-
-def generate_page(from_path, template_path, dest_path, is_blog_post=False):
-    """Generate a single HTML page from markdown"""
+            fragment = fragment.replace('</h1>', f'</h1>{date_stamp}', 1)
+            stamped = True
+        yield fragment
+
+def generate_page(
+    from_path, template_path, dest_path, is_blog_post=False, entry=None, writer=None, block_cache=None,
+):
+    """Generate a single HTML page from markdown.
+
+    entry is the file's ContentEntry when the caller already scanned it
+    (see content_index); otherwise the file is scanned here. block_cache
+    (a BlockCache) lets unchanged blocks skip parsing. Returns True if
+    dest_path was written, False if it already held this exact page.
+    """
     print(f"Generating page from {from_path} to {dest_path}")
-    
-    with open(from_path, "r", encoding="utf-8") as f:
-        markdown = f.read()
 
-    import sys
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-    from Gen_Content.extract_title_markdown import extract_title
-    
-    # Extract page date (before stripping comments)
-    page_date, date_found = _extract_page_date(markdown)
-    
-    # If no date was found, inject it into the source file
-    if not date_found:
-        markdown = _inject_page_date(markdown, page_date)
-        # Write back to source file to preserve the date
-        with open(from_path, "w", encoding="utf-8") as f:
-            f.write(markdown)
-        print(f"  → Added page-date: {page_date}")
-    
-    # Strip HTML comments before processing
-    markdown_clean = _strip_html_comments(markdown)
-    
-    title = extract_title(markdown_clean)
-    description = _first_paragraph(markdown_clean)
+    if entry is None:
+        entry = scan_markdown(from_path)
+    if entry.title is None:
+        raise ValueError("No title found in markdown")
+
+    markdown_clean = entry.markdown
+    page_date = entry.date
+    title = entry.title
+    description = entry.description
     base_url = "/"
     canonical = _to_canonical(base_url, dest_path)
 
-    content_html = _render_markdown(markdown_clean, page_date, is_blog_post)
+    date_stamp = _post_date_stamp(page_date) if is_blog_post and page_date else None
 
     with open(template_path, "r", encoding="utf-8") as f:
         template = f.read()
@@ -158,23 +92,41 @@ def generate_page(from_path, template_path, dest_path, is_blog_post=False):
         # dest_path isn't under a 'docs' directory -- fall back to current dir
         path_prefix = './'
     
-    page_html = (
-        template
-        .replace("{{ Title }}", title)
-        .replace("{{ Content }}", content_html)
-        .replace("{{ Description }}", description)
-        .replace("{{ Canonical }}", canonical)
-        .replace("{{ BaseUrl }}", base_url)
-        .replace("{{ PageDate }}", page_date)
-    )
-    
+    # The page is written straight to disk a block at a time instead of
+    # being assembled as one string. These substitutions used to run over
+    # the assembled page, body included, so they still run over every
+    # piece; none of the patterns can straddle two pieces.
+    replacements = [
+        ("{{ Description }}", description),
+        ("{{ Canonical }}", canonical),
+        ("{{ BaseUrl }}", base_url),
+        ("{{ PageDate }}", page_date),
+    ]
     # Fix CSS/asset paths for subdirectories
     if path_prefix != './':
-        page_html = page_html.replace('href="./', f'href="{path_prefix}')
-        page_html = page_html.replace('src="./', f'src="{path_prefix}')
-
-    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-    with open(dest_path, "w", encoding="utf-8") as f:
-        f.write(page_html)
-    
-    print(f"Page written to {dest_path}")
\ No newline at end of file
+        replacements += [('href="./', f'href="{path_prefix}'), ('src="./', f'src="{path_prefix}')]
+
+    def fill(text):
+        for old, new in replacements:
+            text = text.replace(old, new)
+        return text
+
+    pieces = template.replace("{{ Title }}", title).split("{{ Content }}")
+
+    # The body is rendered as it is written, straight to HTML, one block at
+    # a time (the build never looks at the nodes). A parse error part way
+    # through leaves dest_path as it was: the writer drops its temp file.
+    def render(write):
+        write(fill(pieces[0]))
+        for piece in pieces[1:]:
+            body = iter_markdown_html(markdown_clean, cache=block_cache)
+            for fragment in _content_fragments(body, date_stamp):
+                write(fill(fragment))
+            write(fill(piece))
+
+    changed = (writer or OutputWriter()).stream(dest_path, render)
+    if changed:
+        print(f"Page written to {dest_path}")
+    else:
+        print(f"Page unchanged: {dest_path}")
+    return changed
@@ -0,0 +1,162 @@
+"""Write-if-changed output files.
+
+A generated page whose bytes did not change is left alone, mtime and all,
+so `git status -- docs/` and anything else that trusts mtimes only ever
+looks at pages that really changed. Pages that did change are written to
+a temp file and renamed into place, so a reader (or a crashed build) never
+sees half a page.
+
+stream_if_changed() does the same for output produced in pieces: the
+pieces go through a buffered handle into the temp file, which is then
+compared with the old file a chunk at a time, so neither side is ever
+held in memory whole.
+
+atomic_write_json() is the same rename-into-place for the build's own
+state files (manifest, page dates, block cache), which are rewritten
+whenever they change rather than compared first.
+"""
+import json
+import os
+import tempfile
+
+_COMPARE_CHUNK = 64 * 1024
+
+
+def write_if_changed(path, text):
+    """Write `text` (UTF-8) to `path` unless it already holds exactly that.
+
+    Compares sizes first and only reads the old file when they match.
+    Returns True if the file was written, False if it was left untouched.
+    """
+    data = text.encode("utf-8") if isinstance(text, str) else text
+    try:
+        if os.stat(path).st_size == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return False
+    except FileNotFoundError:
+        pass
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp-{os.getpid()}"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    finally:
+        if os.path.lexists(tmp):
+            os.remove(tmp)
+    return True
+
+
+def _same_bytes(a, b):
+    try:
+        if os.stat(a).st_size != os.stat(b).st_size:
+            return False
+    except FileNotFoundError:
+        return False
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        while True:
+            chunk = fa.read(_COMPARE_CHUNK)
+            if chunk != fb.read(_COMPARE_CHUNK):
+                return False
+            if not chunk:
+                return True
+
+
+def stream_if_changed(path, render):
+    """Like write_if_changed(), for text produced piece by piece.
+
+    render(write) is called with the write method of a buffered UTF-8
+    handle on a temp file next to `path`. The temp file replaces `path`
+    only if its bytes differ. Returns True if `path` was written.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp-{os.getpid()}"
+    try:
+        with open(tmp, "w", encoding="utf-8", newline="") as f:
+            render(f.write)
+        if _same_bytes(tmp, path):
+            return False
+        os.replace(tmp, path)
+    finally:
+        if os.path.lexists(tmp):
+            os.remove(tmp)
+    return True
+
+
+def atomic_write_json(path, data, **options):
+    """Write `data` to `path` as JSON (json.dump `options`) plus a newline.
+
+    The temp file is uniquely named in the same directory, so two builds
+    saving the same file at once never write into each other's temp file;
+    the last rename wins, whole.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    handle = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp", delete=False,
+    )
+    try:
+        with handle:
+            json.dump(data, handle, **options)
+            handle.write("\n")
+        # NamedTemporaryFile creates the file 0600; keep the usual mode
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(handle.name, mode)
+        os.replace(handle.name, path)
+    finally:
+        if os.path.lexists(handle.name):
+            os.remove(handle.name)
+
+
+def remove_unlisted(root, keep):
+    """Delete every file under `root` whose root-relative path (forward
+    slashes) is not in `keep`, then any directories left empty.
+
+    A full build uses this in place of wiping docs/ up front, so files it
+    regenerates byte-for-byte keep their mtimes. Returns the removed paths.
+    """
+    removed = []
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            rel = os.path.relpath(path, root).replace(os.sep, "/")
+            if rel not in keep:
+                os.remove(path)
+                removed.append(rel)
+        if dirpath != root and not os.listdir(dirpath):
+            os.rmdir(dirpath)
+    return sorted(removed)
+
+
+class OutputWriter:
+    """write_if_changed() and stream_if_changed() plus written/skipped totals
+    for the build summary."""
+
+    def __init__(self):
+        self.written = 0
+        self.skipped = 0
+
+    def write(self, path, text):
+        changed = write_if_changed(path, text)
+        self.tally(changed)
+        return changed
+
+    def stream(self, path, render):
+        changed = stream_if_changed(path, render)
+        self.tally(changed)
+        return changed
+
+    def tally(self, changed):
+        """Count a write made elsewhere (e.g. by a render worker process)."""
+        if changed:
+            self.written += 1
+        else:
+            self.skipped += 1
+
+    def summary(self):
+        return f"Output: wrote {self.written} file(s), skipped {self.skipped} unchanged file(s)"
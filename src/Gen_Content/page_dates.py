@@ -0,0 +1,55 @@
+"""Sidecar store for page dates in read-only source mode.
+
+A post without a `<!-- page-date: -->` comment is normally given one by
+rewriting the markdown file. In read-only source mode the build never
+writes under content/; the date it assigns is kept here instead, keyed by
+the file's path relative to the workspace root, and found again on every
+later build with a single dict lookup.
+
+The file is small, sorted JSON, meant to be committed next to content/ so
+a fresh clone renders the same dates.
+"""
+import json
+
+from Gen_Content.build_manifest import rel_path
+from Gen_Content.output_writer import atomic_write_json
+
+
+class PageDates:
+    def __init__(self, path, root):
+        self.path = path
+        self.root = root
+        self.dates = {}  # rel path -> YYYY-MM-DD
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path, root):
+        # Missing or unreadable: every undated page is simply dated again
+        store = cls(path, root)
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return store
+        if isinstance(data, dict):
+            store.dates = {k: v for k, v in data.items() if isinstance(v, str)}
+        return store
+
+    def _rel(self, path):
+        return rel_path(path, self.root)
+
+    def lookup(self, path):
+        """The date recorded for `path`, or None."""
+        return self.dates.get(self._rel(path))
+
+    def assign(self, path, date):
+        rel = self._rel(path)
+        if self.dates.get(rel) != date:
+            self.dates[rel] = date
+            self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        atomic_write_json(self.path, self.dates, indent=1, sort_keys=True)
+        self._dirty = False
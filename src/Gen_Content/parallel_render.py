@@ -0,0 +1,168 @@
+"""Render markdown pages on a process pool.
+
+Parsing and rendering a page is pure CPU work, so a large diary corpus can
+use every core. Each page still gets its own fault-isolation boundary: a
+page that raises is reported as a failed PageResult, never as a crashed
+build. Results always come back in job order, and whatever a page printed
+while rendering is replayed with its result, so the log reads the same as
+a serial build no matter which worker finished first.
+"""
+import contextlib
+import io
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple
+
+from block_to_html import inline_cache, inline_html_cache
+from Gen_Content.content_index import ContentEntry
+from Gen_Content.generate_page import generate_page
+from inline_cache import CacheStats
+
+# Below this many pages per worker, forking the pool and shipping results
+# back costs more than it saves (a page renders in a few ms; a pool takes
+# tens of ms to start), so the build stays serial.
+MIN_PAGES_PER_WORKER = 16
+
+# The build's BlockCache in this process (see render_pages())
+_block_cache = None
+_INLINE_CACHES = (inline_cache, inline_html_cache)
+
+
+def _inline_stats():
+    return CacheStats.total(cache.stats() for cache in _INLINE_CACHES)
+
+
+def _resize_inline_caches(maxsize):
+    for cache in _INLINE_CACHES:
+        cache.resize(maxsize)
+
+
+class PageJob(NamedTuple):
+    name: str            # build-manifest target name
+    md_name: str
+    src_md: str
+    template_path: str
+    out_html: str
+    is_blog_post: bool = False
+    entry: ContentEntry | None = None  # pre-scanned source, shipped to the worker
+
+
+class PageResult(NamedTuple):
+    job: PageJob
+    error: str | None = None      # str(exception), None on success
+    traceback: str | None = None
+    output: str = ""              # what the page printed, when captured
+    changed: bool = False         # False when the output was already identical
+    started: float = 0.0          # time.perf_counter() around the render,
+    finished: float = 0.0         # taken in whichever process ran it
+    worker: int = 0               # pid of that process
+    inline_cache: CacheStats = CacheStats()  # lookups this page made
+    block_cache: CacheStats = CacheStats()
+    blocks: dict | None = None    # blocks a worker rendered, for the build's cache
+
+
+def render_page(job, capture=False):
+    """Render one page and report how it went instead of raising."""
+    buffer = io.StringIO()
+    redirect = contextlib.redirect_stdout(buffer) if capture else contextlib.nullcontext()
+    block_cache = _block_cache
+    inline_before = _inline_stats()
+    blocks_before = block_cache.stats() if block_cache is not None else CacheStats()
+
+    def result(**fields):
+        # Drained every page, so the cache never keeps a second copy of
+        # what it rendered; only a worker has anyone to send it to.
+        added = block_cache.take_added() if block_cache is not None else None
+        return PageResult(
+            job, output=buffer.getvalue(), finished=time.perf_counter(), worker=os.getpid(),
+            inline_cache=_inline_stats().since(inline_before),
+            block_cache=block_cache.stats().since(blocks_before) if block_cache is not None else CacheStats(),
+            blocks=added if capture else None,
+            **fields,
+        )
+
+    started = time.perf_counter()
+    with redirect:
+        try:
+            changed = generate_page(
+                job.src_md, job.template_path, job.out_html, is_blog_post=job.is_blog_post, entry=job.entry,
+                block_cache=block_cache,
+            )
+        # Broad on purpose: this is the per-page fault-isolation boundary,
+        # the same one the serial loop in main.py has always had.
+        except Exception as e:  # noqa: BLE001
+            return result(error=str(e), traceback=traceback.format_exc(), started=started)
+    return result(changed=changed, started=started)
+
+
+def _render_captured(job):
+    return render_page(job, capture=True)
+
+
+def _init_worker(inline_cache_size, block_cache_path, block_cache_size):
+    global _block_cache
+    _resize_inline_caches(inline_cache_size)
+    if block_cache_path is not None:
+        from Gen_Content.block_cache import BlockCache
+
+        _block_cache = BlockCache.load(block_cache_path, block_cache_size)
+
+
+def effective_workers(requested, job_count):
+    """How many processes to actually use for `job_count` pages.
+
+    requested=0 means one per CPU. Returns 1 (serial) whenever the corpus
+    is too small to keep more than one worker busy.
+    """
+    if requested == 0:
+        requested = os.cpu_count() or 1
+    return max(1, min(requested, job_count // MIN_PAGES_PER_WORKER))
+
+
+def render_pages(jobs, workers=1, on_start=None, inline_cache_size=None, block_cache=None):
+    """Yield a PageResult for every job, in job order.
+
+    on_start(job) is called right before each job's result (and, in serial
+    mode, before its live output), so callers can log a heading per page.
+    If the pool itself dies (a worker killed by the OS, say) the remaining
+    pages are finished serially rather than failing the build.
+
+    inline_cache_size, when given, resizes the inline render caches in this
+    process and in every worker (0 disables it). block_cache (a
+    BlockCache) is used by every page; workers load their own copy from
+    its file and send back the blocks they render, which are merged into
+    it here. Saving it is up to the caller.
+    """
+    global _block_cache
+    jobs = list(jobs)
+    workers = effective_workers(workers, len(jobs))
+    if inline_cache_size is not None:
+        _resize_inline_caches(inline_cache_size)
+    _block_cache = block_cache
+    done = 0
+    if workers > 1:
+        chunksize = max(1, len(jobs) // (workers * 4))
+        try:
+            if block_cache is not None:
+                init = (inline_cache.maxsize, block_cache.path, block_cache.maxsize)
+            else:
+                init = (inline_cache.maxsize, None, 0)
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init) as pool:
+                for result in pool.map(_render_captured, jobs, chunksize=chunksize):
+                    if block_cache is not None and result.blocks:
+                        block_cache.update(result.blocks)
+                    if on_start:
+                        on_start(result.job)
+                    if result.output:
+                        print(result.output, end="")
+                    done += 1
+                    yield result
+        except BrokenProcessPool as exc:
+            print(f"WARNING: render pool failed ({exc}); finishing {len(jobs) - done} page(s) serially")
+    for job in jobs[done:]:
+        if on_start:
+            on_start(job)
+        yield render_page(job)
@@ -0,0 +1,206 @@
+"""Change-aware sync of static/ into docs/.
+
+A file is copied only when its destination is missing or different:
+same size and mtime is taken as unchanged without reading anything, and
+same size with a different mtime (a fresh checkout, a `touch`) falls back
+to comparing content hashes before deciding. Copies go through the
+cheapest mechanism the filesystem offers -- a reflink clone, then
+os.copy_file_range, then os.sendfile, then a plain buffered copy -- or a
+hardlink when asked for. Files are copied on a thread pool, since the work
+is syscall-bound and releases the GIL.
+
+Every write lands in a temp file that is renamed over the destination, so
+a hardlinked docs/ file is replaced rather than written through (which
+would scribble over the file in static/).
+"""
+import errno
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+from Gen_Content.build_manifest import sha256_file
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# linux/fs.h: _IOW(0x94, 9, int). Clones the whole file as copy-on-write
+# extents on btrfs, XFS and friends; everywhere else the ioctl just fails.
+FICLONE = 0x40049409
+
+# errnos meaning "this mechanism is not available here", as opposed to a
+# real I/O failure that should surface.
+_UNSUPPORTED = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EPERM, errno.EBADF,
+    errno.ENOTTY, getattr(errno, "EOPNOTSUPP", errno.EINVAL),
+    getattr(errno, "ENOTSUP", errno.EINVAL),
+}
+
+# Below this many files to copy, starting threads costs more than it saves.
+MIN_FILES_FOR_POOL = 8
+
+
+class SyncResult(NamedTuple):
+    rel: str        # path relative to the synced root, forward slashes
+    size: int
+    action: str     # "mkdir", "copied" or "skipped"
+    method: str = ""  # how a copied file was written (reflink, hardlink, ...)
+
+
+def is_unchanged(src, dest, src_stat=None):
+    """True when `dest` already holds exactly the bytes of `src`.
+
+    A hash match under a different mtime re-stamps `dest` with the source
+    mtime, so the next check takes the stat-only fast path.
+    """
+    src_stat = src_stat or os.stat(src)
+    try:
+        dest_stat = os.stat(dest)
+    except FileNotFoundError:
+        return False
+    if src_stat.st_size != dest_stat.st_size:
+        return False
+    if (src_stat.st_dev, src_stat.st_ino) == (dest_stat.st_dev, dest_stat.st_ino):
+        return True  # hardlinked to the source
+    if src_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+        return True
+    if sha256_file(src) != sha256_file(dest):
+        return False
+    os.utime(dest, ns=(dest_stat.st_atime_ns, src_stat.st_mtime_ns))
+    return True
+
+
+class StaticSync:
+    """Mirror a directory tree, copying only what changed.
+
+    Remembers which zero-copy mechanisms failed as unsupported, so a
+    filesystem without reflinks pays for the failed ioctl once, not once
+    per file.
+    """
+
+    def __init__(self, hardlink=False, workers=None):
+        self.hardlink = hardlink
+        self.workers = workers or min(8, (os.cpu_count() or 1) + 4)
+        self._unsupported = set()
+        self._lock = threading.Lock()  # sync_file() runs on the pool
+        self.copied_files = 0
+        self.copied_bytes = 0
+        self.skipped_files = 0
+        self.skipped_bytes = 0
+
+    def _try(self, method, func):
+        """Run one copy mechanism; False if it is unsupported here."""
+        if method in self._unsupported:
+            return False
+        try:
+            func()
+        except OSError as exc:
+            if exc.errno not in _UNSUPPORTED:
+                raise
+            self._unsupported.add(method)
+            return False
+        return True
+
+    def _write_contents(self, src, tmp, size):
+        with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+            in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+
+            def copy_range():
+                copied = 0
+                while copied < size:
+                    n = os.copy_file_range(in_fd, out_fd, size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+
+            def sendfile():
+                copied = 0
+                while copied < size:
+                    n = os.sendfile(out_fd, in_fd, copied, size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+
+            if fcntl is not None and self._try("reflink", lambda: fcntl.ioctl(out_fd, FICLONE, in_fd)):
+                return "reflink"
+            if hasattr(os, "copy_file_range") and self._try("copy_file_range", copy_range):
+                return "copy_file_range"
+            # A mechanism that failed part-way may have left bytes behind.
+            os.ftruncate(out_fd, 0)
+            os.lseek(out_fd, 0, os.SEEK_SET)
+            os.lseek(in_fd, 0, os.SEEK_SET)
+            if hasattr(os, "sendfile") and self._try("sendfile", sendfile):
+                return "sendfile"
+            os.ftruncate(out_fd, 0)
+            os.lseek(out_fd, 0, os.SEEK_SET)
+            shutil.copyfileobj(fsrc, fdst, 1 << 20)
+            return "copy"
+
+    def _tally(self, result):
+        with self._lock:
+            if result.action == "copied":
+                self.copied_files += 1
+                self.copied_bytes += result.size
+            else:
+                self.skipped_files += 1
+                self.skipped_bytes += result.size
+        return result
+
+    def sync_file(self, src, dest, rel=None):
+        """Bring one file up to date. Returns its SyncResult, which counts
+        toward the copied/skipped totals."""
+        rel = rel or os.path.basename(src)
+        src_stat = os.stat(src)
+        if is_unchanged(src, dest, src_stat):
+            return self._tally(SyncResult(rel, src_stat.st_size, "skipped"))
+
+        tmp = f"{dest}.tmp-{os.getpid()}"
+        try:
+            if self.hardlink and self._try("hardlink", lambda: os.link(src, tmp)):
+                method = "hardlink"
+            else:
+                method = self._write_contents(src, tmp, src_stat.st_size)
+                shutil.copystat(src, tmp)
+            os.replace(tmp, dest)
+        finally:
+            if os.path.lexists(tmp):
+                os.remove(tmp)
+        return self._tally(SyncResult(rel, src_stat.st_size, "copied", method))
+
+    def sync_tree(self, src_root, dest_root):
+        """Mirror every file under src_root into dest_root.
+
+        Returns SyncResults in a stable order: one "mkdir" per directory
+        that had to be created, then one entry per file in walk order.
+        Stale files in dest_root are left alone (the build manifest prunes
+        those).
+        """
+        results = []
+        files = []
+        for dirpath, dirnames, filenames in os.walk(src_root):
+            dirnames.sort()
+            rel_dir = os.path.relpath(dirpath, src_root)
+            rel_dir = "" if rel_dir == "." else rel_dir.replace(os.sep, "/")
+            dest_dir = os.path.join(dest_root, *rel_dir.split("/")) if rel_dir else dest_root
+            if not os.path.isdir(dest_dir):
+                os.makedirs(dest_dir)
+                results.append(SyncResult(rel_dir, 0, "mkdir"))
+            for name in sorted(filenames):
+                rel = f"{rel_dir}/{name}" if rel_dir else name
+                files.append((os.path.join(dirpath, name), os.path.join(dest_dir, name), rel))
+
+        if len(files) >= MIN_FILES_FOR_POOL and self.workers > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                file_results = list(pool.map(lambda f: self.sync_file(*f), files))
+        else:
+            file_results = [self.sync_file(*f) for f in files]
+        return results + file_results
+
+    def summary(self):
+        return (
+            f"Static sync: copied {self.copied_files} file(s) ({self.copied_bytes} bytes), "
+            f"skipped {self.skipped_files} unchanged file(s) ({self.skipped_bytes} bytes)"
+        )
@@ -0,0 +1,107 @@
+"""Stat-polling watch mode.
+
+Polls the build inputs every POLL_INTERVAL seconds by comparing
+(mtime_ns, size) snapshots -- no third-party file-event library, and it
+behaves the same on every OS. When something changes, the build manifest's
+input -> target graph says which outputs it feeds, and only those targets
+are rebuilt, in-process, so the edit-to-refresh path never pays for
+interpreter start-up. Files the graph has never seen (a new post, a
+deleted one, a page whose last build failed) can create or orphan targets,
+so they trigger a whole incremental build instead, which is still cheap.
+"""
+import os
+import stat
+import time
+
+POLL_INTERVAL = 0.05
+# Editors often save in two writes (truncate, then fill); give a change this
+# long to settle before rebuilding from it.
+SETTLE_DELAY = 0.02
+# Manifest targets that render a markdown source into its own page.
+PAGE_TARGETS = ("page:", "post:")
+
+
+def snapshot(paths):
+    """{file path: (mtime_ns, size)} for every file at or under `paths`."""
+    state = {}
+    pending = list(paths)
+    while pending:
+        path = pending.pop()
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            continue
+        if stat.S_ISDIR(st.st_mode):
+            try:
+                pending.extend(os.path.join(path, name) for name in os.listdir(path))
+            except FileNotFoundError:
+                continue
+        else:
+            state[path] = (st.st_mtime_ns, st.st_size)
+    return state
+
+
+def diff(before, after):
+    """(changed, added, removed) path sets between two snapshots."""
+    changed = {p for p in before.keys() & after.keys() if before[p] != after[p]}
+    return changed, after.keys() - before.keys(), before.keys() - after.keys()
+
+
+def affected_targets(manifest, changed, added, removed):
+    """Target names to rebuild for a change, or None for "rebuild whatever
+    is stale" when the graph cannot answer."""
+    if added or removed:
+        return None
+    targets = set()
+    for path in changed:
+        dependents = manifest.dependents([path])
+        if not dependents:
+            return None
+        # A page whose last build failed has no record of its own, though
+        # the landing page or blog index may still list it.
+        if path.lower().endswith(".md") and not any(name.startswith(PAGE_TARGETS) for name in dependents):
+            return None
+        targets |= dependents
+    return targets
+
+
+def watch(paths, build, load_manifest, root, interval=POLL_INTERVAL):
+    """Build once, then rebuild on every change until interrupted.
+
+    build(targets) runs one build (targets=None means a whole incremental
+    build) and returns True on success; load_manifest() returns the
+    manifest that build just saved.
+    """
+    def rel(path):
+        return os.path.relpath(path, root).replace(os.sep, "/")
+
+    build(None)
+    before = snapshot(paths)
+    print(f"Watching {', '.join(sorted(rel(p) for p in paths))} (Ctrl-C to stop)")
+    while True:
+        time.sleep(interval)
+        after = snapshot(paths)
+        if after == before:
+            continue
+        time.sleep(SETTLE_DELAY)
+        after = snapshot(paths)
+        changed, added, removed = diff(before, after)
+        if not (changed or added or removed):
+            continue
+
+        started = time.perf_counter()
+        for label, group in (("Changed", changed), ("Added", added), ("Removed", removed)):
+            for path in sorted(group):
+                print(f"{label}: {rel(path)}")
+        targets = affected_targets(load_manifest(), changed, added, removed)
+        if targets is None:
+            print("Rebuilding everything that is stale")
+        else:
+            print(f"Rebuilding: {', '.join(sorted(targets))}")
+        ok = build(targets)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"{'Rebuilt' if ok else 'Rebuild FAILED'} in {elapsed_ms:.0f} ms")
+        # Baseline on the pre-build snapshot so an edit saved mid-build is
+        # not lost. A build that rewrites its own input (page-date
+        # injection) costs one extra round, which finds nothing stale.
+        before = after
@@ -1,156 +1,233 @@
-import re
-
-from htmlnode import LeafNode, ParentNode, text_node_to_html_node
-from markdown_to_blocks import markdown_to_blocks
+from block_types import BlockType, lex_block
+from htmlnode import LeafNode, ParentNode, text_node_to_html, text_node_to_html_node
+from inline_cache import InlineCache
+from markdown_to_blocks import iter_blocks, markdown_to_blocks
 from text_to_textnodes import text_to_textnodes
 
 
+# Tokenized inline text, shared by every page this process renders:
+# TextNodes for the tree path, HTML fragments for markdown_to_html(). Both
+# are sized for the build by Gen_Content.parallel_render.
+inline_cache = InlineCache()
+inline_html_cache = InlineCache()
+
+
 def text_to_children(text):
-    nodes = text_to_textnodes(text)
+    """Inline markdown -> a list of new HTML nodes. Identical texts share
+    their TextNodes through inline_cache, but never the HTML nodes built
+    from them, so a caller may change the tree it gets back."""
     children = []
-    for tn in nodes:
+    for tn in inline_cache.get(text, text_to_textnodes):
         html_node = text_node_to_html_node(tn)
         if html_node is None:
             raise ValueError(f"Unexpected None from text_node_to_html_node for {tn}")
         children.append(html_node)
     return children
 
-def _indent_width(whitespace):
-    """Normalize tabs to 4 spaces"""
-    return len(whitespace.replace("\t", "    "))
 
+def _render_inline_html(text):
+    return [text_node_to_html(tn) for tn in text_to_textnodes(text)]
 
-def _is_list_block(block, ordered=False):
-    """
-    Check if block is a list, allowing continuation lines.
-    A valid list block:
-    - Starts with at least one list marker (- or N.)
-    - Can have continuation lines (indented or empty lines)
-    """
-    if ordered:
-        marker_pattern = re.compile(r"^\s*\d+\.\s+")
-    else:
-        marker_pattern = re.compile(r"^\s*-\s+")
-
-    lines = block.splitlines()
-    if not lines:
-        return False
-
-    # Must have at least one line matching list marker
-    has_list_marker = any(marker_pattern.match(l) for l in lines)
-    if not has_list_marker:
-        return False
-
-    # All non-empty lines must either:
-    # - Match list marker (start of item)
-    # - Be indented (continuation of previous item)
-    for line in lines:
-        if not line.strip():  # empty line OK
-            continue
-        if marker_pattern.match(line):  # list marker OK
-            continue
-        if line[0] in (' ', '\t'):  # indented (continuation) OK
-            continue
-        # Non-indented line without marker = not a list
-        return False
 
-    return True
+def text_to_html(text):
+    """text_to_children(text) as HTML fragments (a tuple), from
+    inline_html_cache."""
+    return inline_html_cache.get(text, _render_inline_html)
 
+def _indent_width(whitespace):
+    """Normalize tabs to 4 spaces"""
+    return len(whitespace.replace("\t", "    "))
 
-def _parse_list_items(block, ordered=False):
-    """Parse list items (ordered or unordered) with support for nesting via indentation and continuation lines"""
-    if ordered:
-        pattern = re.compile(r"^(\s*)\d+\.\s+(.*)$")
-        list_tag = "ol"
-    else:
-        pattern = re.compile(r"^(\s*)-\s+(.*)$")
-        list_tag = "ul"
 
-    # Tree structure: [{"text": "...", "children": [ ... ]}, ...]
+def _list_tree(lexed):
+    """Parse list items (ordered or unordered) with support for nesting via
+    indentation and continuation lines.
+
+    Returns (root, items): the top-level items, and every item with its
+    parents before its children. An item is {"parts": ["...", ...],
+    "children": [item, ...]}; its text is its parts joined with spaces.
+    """
+    ordered = lexed.type is BlockType.ORDERED_LIST
     root = []
+    items = []
     stack = [(-1, root)]  # (indent_level, children_list)
     current_node = None  # Track last node for appending continuation lines
 
-    for raw_line in block.splitlines():
+    for raw_line, m in zip(lexed.lines, lexed.items):
         if not raw_line.strip():
             continue
 
-        m = pattern.match(raw_line)
-        if m:
+        # A marker of the other kind (- inside 1. or vice versa) is text
+        if m and (m.group(2) is None) == ordered:
             # This is a list marker line
             indent = _indent_width(m.group(1))
-            item_text = m.group(2).strip()
+            item_text = m.group(3).strip()
 
             # Pop stack until we find the correct parent indent level
             while len(stack) > 1 and indent <= stack[-1][0]:
                 stack.pop()
 
-            current_node = {"text": item_text, "children": []}
+            current_node = {"parts": [item_text], "children": []}
+            items.append(current_node)
             stack[-1][1].append(current_node)
             stack.append((indent, current_node["children"]))
         elif current_node and raw_line[0] in (' ', '\t'):
-            # This is a continuation line (indented, no marker)
-            # Append to current node's text with a space
-            continuation = raw_line.strip()
-            if continuation:
-                current_node["text"] += " " + continuation
-
-    def to_list_node(nodes):
-        """Recursively convert tree structure to HTML nodes"""
-        list_children = []
-        for n in nodes:
-            li_children = text_to_children(n["text"])
-            if n["children"]:
-                li_children.append(to_list_node(n["children"]))
-            list_children.append(ParentNode("li", li_children))
-        return ParentNode(list_tag, list_children)
+            # This is a continuation line (indented, no marker),
+            # joined to the item's text with a space
+            current_node["parts"].append(raw_line.strip())
+    return root, items
+
+
+def _parse_list_items(lexed):
+    list_tag = "ol" if lexed.type is BlockType.ORDERED_LIST else "ul"
+    root, items = _list_tree(lexed)
+    # Fill in each <li> in one flat pass rather than recursing, so a list
+    # can nest deeper than the recursion limit
+    for n in items:
+        n["li"] = ParentNode("li")
+    for n in items:
+        li_children = text_to_children(" ".join(n["parts"]))
+        if n["children"]:
+            li_children.append(ParentNode(list_tag, [c["li"] for c in n["children"]]))
+        n["li"].children = li_children
+    return ParentNode(list_tag, [n["li"] for n in root])
+
+
+def _quote_text(lexed):
+    quote_lines = []
+    for l in lexed.lines:
+        if l == ">":
+            continue
+        if l.startswith("> "):
+            quote_lines.append(l[2:])
+        else:
+            break
+    return "\n".join(quote_lines).strip()
+
+
+def _paragraph_text(lexed):
+    lines = [l.strip() for l in lexed.lines]
+    return " ".join([l for l in lines if l])
+
+
+def _block_to_html_node(block):
+    """One block -> its HTML node, or None for a block that renders to
+    nothing (an empty blockquote)."""
+    lexed = lex_block(block)
+    block_type = lexed.type
+    if block_type is BlockType.CODE:
+        code_text = "\n".join(lexed.lines[1:-1]) + "\n"
+        return ParentNode("pre", [ParentNode("code", [LeafNode(None, code_text)])])
+    if block_type is BlockType.HEADER:
+        return ParentNode(f"h{lexed.level}", text_to_children(lexed.text))
+    if block_type is BlockType.QUOTE:
+        cleaned = _quote_text(lexed)
+        if not cleaned:
+            return None  # skip empty blockquote
+        return ParentNode("blockquote", text_to_children(cleaned))
+    if block_type is BlockType.PARAGRAPH:
+        return ParentNode("p", text_to_children(_paragraph_text(lexed)))
+    # Ordered or unordered list (handles indentation and continuation lines)
+    return _parse_list_items(lexed)
+
+
+def _blocks(markdown):
+    return markdown_to_blocks(markdown) if isinstance(markdown, str) else iter_blocks(markdown)
+
+
+def markdown_to_html_node(markdown, cache=None):
+    """markdown is the whole document as a string, or any iterable of its
+    lines (an open file, say), which is then read a block at a time and
+    never held in memory whole.
+
+    cache, if given, maps blocks to their rendered HTML (get(block) ->
+    str or None, put(block, html); see Gen_Content.block_cache). Only
+    blocks it misses are parsed; each cached block comes back as a raw
+    LeafNode holding its HTML, which renders to the same bytes."""
+    children = []
+    for block in _blocks(markdown):
+        if cache is None:
+            node = _block_to_html_node(block)
+            if node is not None:
+                children.append(node)
+            continue
+        html = cache.get(block)
+        if html is None:
+            node = _block_to_html_node(block)
+            html = "" if node is None else node.to_html()
+            cache.put(block, html)
+        if html:
+            children.append(LeafNode(None, html))
+    return ParentNode("div", children)
 
-    return to_list_node(root)
 
+# --- direct path: the same HTML without building the tree ------------------
 
-def markdown_to_html_node(markdown):
-    blocks = markdown_to_blocks(markdown)
-    children = []
-    for block in blocks:
-        text = block.strip()
-        if text.startswith("```") and text.endswith("```"):
-            code_text = "\n".join(block.splitlines()[1:-1]) + "\n"
-            children.append(ParentNode("pre", [ParentNode("code", [LeafNode(None, code_text)])]))
-            continue
-        elif text.startswith("###### "):
-            children.append(ParentNode("h6", text_to_children(block[7:].strip())))
-        elif text.startswith("##### "):
-            children.append(ParentNode("h5", text_to_children(block[6:].strip())))
-        elif text.startswith("#### "):
-            children.append(ParentNode("h4", text_to_children(block[5:].strip())))
-        elif text.startswith("### "):
-            children.append(ParentNode("h3", text_to_children(block[4:].strip())))
-        elif text.startswith("## "):
-            children.append(ParentNode("h2", text_to_children(block[3:].strip())))
-        elif text.startswith("# "):
-            children.append(ParentNode("h1", text_to_children(block[2:].strip())))
-        elif text.startswith("> "):
-            quote_lines = []
-            for l in block.splitlines():
-                if l == ">":
-                    continue
-                if l.startswith("> "):
-                    quote_lines.append(l[2:])
-                else:
-                    break
-            cleaned = "\n".join(quote_lines).strip()
-            if not cleaned:
-                continue  # skip empty blockquote
-            children.append(ParentNode("blockquote", text_to_children(cleaned)))
-        elif _is_list_block(block, ordered=True):
-            # Ordered list (handles indentation and continuation lines)
-            children.append(_parse_list_items(block, ordered=True))
-        elif _is_list_block(block, ordered=False):
-            # Unordered list (handles indentation and continuation lines)
-            children.append(_parse_list_items(block, ordered=False))
+def _list_html(lexed, out):
+    tag = "ol" if lexed.type is BlockType.ORDERED_LIST else "ul"
+    root, _ = _list_tree(lexed)
+    out.append(f"<{tag}>")
+    # One iterator per open list, as in htmlnode._write_html()
+    stack = [iter(root)]
+    while stack:
+        for n in stack[-1]:
+            out.append("<li>")
+            out.extend(text_to_html(" ".join(n["parts"])))
+            if n["children"]:
+                out.append(f"<{tag}>")
+                stack.append(iter(n["children"]))
+                break
+            out.append("</li>")
         else:
-            lines = [l.strip() for l in block.splitlines()]
-            para_text = " ".join([l for l in lines if l])
-            inlines = text_to_children(para_text)
-            children.append(ParentNode("p", inlines))
-    return ParentNode("div", children)
+            stack.pop()
+            out.append(f"</{tag}>")
+            if stack:
+                out.append("</li>")
+
+
+def block_to_html(block):
+    """_block_to_html_node(block).to_html(), or "" for a block that renders
+    to nothing, built straight from the block's text."""
+    lexed = lex_block(block)
+    block_type = lexed.type
+    if block_type is BlockType.CODE:
+        return "<pre><code>" + "\n".join(lexed.lines[1:-1]) + "\n</code></pre>"
+    if block_type is BlockType.HEADER:
+        tag = f"h{lexed.level}"
+        text = lexed.text
+    elif block_type is BlockType.QUOTE:
+        tag = "blockquote"
+        text = _quote_text(lexed)
+        if not text:
+            return ""  # skip empty blockquote
+    elif block_type is BlockType.PARAGRAPH:
+        tag = "p"
+        text = _paragraph_text(lexed)
+    else:
+        out = []
+        _list_html(lexed, out)
+        return "".join(out)
+    return f"<{tag}>{''.join(text_to_html(text))}</{tag}>"
+
+
+def iter_markdown_html(markdown, cache=None):
+    """markdown_to_html_node(markdown, cache).iter_html(), without building
+    the tree: "<div>", each block's HTML, "</div>". markdown and cache are
+    as for markdown_to_html_node()."""
+    yield "<div>"
+    for block in _blocks(markdown):
+        html = None if cache is None else cache.get(block)
+        if html is None:
+            html = block_to_html(block)
+            if cache is not None:
+                cache.put(block, html)
+        if html:
+            yield html
+    yield "</div>"
+
+
+def markdown_to_html(markdown, cache=None):
+    """markdown_to_html_node(markdown).to_html(), byte for byte, for callers
+    that only want the HTML: no TextNode -> LeafNode/ParentNode tree is
+    built. Use markdown_to_html_node() to inspect or change the nodes."""
+    return "".join(iter_markdown_html(markdown, cache))
@@ -1,5 +1,9 @@
-import re
 from enum import Enum
+from typing import NamedTuple
+
+from md_patterns import LIST_LINE
+
+_list_line = LIST_LINE.match
 
 
 class BlockType(Enum):
@@ -11,17 +15,59 @@ class BlockType(Enum):
     ORDERED_LIST = "ordered_list"
 
 
-def block_to_block_type(block):
+class Block(NamedTuple):
+    type: BlockType
+    lines: list                 # block.splitlines(), split once here
+    level: int = 0              # HEADER: 1-6
+    text: str = ""              # HEADER: the heading text
+    info: str = ""              # CODE: what follows the opening ``` ("python")
+    items: list | None = None   # lists: per line, its LIST_LINE match or None
+
+
+def lex_block(block):
+    """Classify a block (from markdown_to_blocks) and split it into lines,
+    once. These are the rules markdown_to_html_node renders by:
+
+    - CODE: starts and ends with ```
+    - HEADER: 1-6 #s and a space
+    - QUOTE: starts with "> "
+    - ORDERED_LIST / UNORDERED_LIST: at least one "N. " / "- " line, and
+      every other non-blank line indented (a continuation)
+    - PARAGRAPH: anything else
+    """
     text = block.strip()
+    lines = block.splitlines()
 
-    if re.match(r"^#{1,6}\s+", text):
-        return BlockType.HEADER
     if text.startswith("```") and text.endswith("```"):
-        return BlockType.CODE
-    if all(not l.strip() or re.match(r"^\s*>\s?.+", l) for l in block.splitlines()):
-        return BlockType.QUOTE
-    if all(not l.strip() or re.match(r"^\s*-\s+.+", l) for l in block.splitlines()):
-        return BlockType.UNORDERED_LIST
-    if all(not l.strip() or re.match(r"^\s*\d+\.\s+.+", l) for l in block.splitlines()):
-        return BlockType.ORDERED_LIST
-    return BlockType.PARAGRAPH
\ No newline at end of file
+        info = text.split("\n", 1)[0][3:].strip() if len(lines) > 1 else ""
+        return Block(BlockType.CODE, lines, info=info)
+    if text.startswith("#"):
+        level = len(text) - len(text.lstrip("#"))
+        if level <= 6 and text[level:level + 1] == " ":
+            return Block(BlockType.HEADER, lines, level=level, text=block[level + 1:].strip())
+    if text.startswith("> "):
+        return Block(BlockType.QUOTE, lines)
+
+    items = []
+    has = {True: False, False: False}   # ordered -> saw a marker line
+    ok = {True: True, False: True}      # ordered -> no stray line yet
+    for line in lines:
+        m = _list_line(line)
+        items.append(m)
+        if m:
+            ordered = m.group(2) is None
+            has[ordered] = True
+            if line[0] not in (' ', '\t'):
+                ok[not ordered] = False
+        elif line and line[0] not in (' ', '\t') and line.strip():
+            # Non-indented line without marker = not a list
+            return Block(BlockType.PARAGRAPH, lines)
+    if has[True] and ok[True]:
+        return Block(BlockType.ORDERED_LIST, lines, items=items)
+    if has[False] and ok[False]:
+        return Block(BlockType.UNORDERED_LIST, lines, items=items)
+    return Block(BlockType.PARAGRAPH, lines)
+
+
+def block_to_block_type(block):
+    return lex_block(block).type
@@ -1,14 +1,26 @@
-import re
+from md_patterns import IMAGE, LINK
+
+_find_images = IMAGE.findall
+_find_links = LINK.findall
+_iter_images = IMAGE.finditer
+_iter_links = LINK.finditer
 
 
 def extract_markdown_images(text):
-    # takes markdown text and returns a list of tuples
-    pattern = r"!\[([^\[\]]*)\]\(([^\(\)]*)\)"
-    matches = re.findall(pattern, text)
-    return [(alt_text, url) for alt_text, url in matches]
+    # takes markdown text and returns a list of (alt text, url) tuples
+    return _find_images(text)
 
 def extract_markdown_links(text):
     # Same as above but for links
-    pattern = r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)"
-    matches = re.findall(pattern, text)
-    return [(link_text, url) for link_text, url in matches]
+    return _find_links(text)
+
+def extract_markdown_image_spans(text):
+    # (start, end, alt text, url) for each image, in order; text[start:end]
+    # is the whole ![alt](url)
+    for m in _iter_images(text):
+        yield m.start(), m.end(), m.group(1), m.group(2)
+
+def extract_markdown_link_spans(text):
+    # Same as above but for links
+    for m in _iter_links(text):
+        yield m.start(), m.end(), m.group(1), m.group(2)
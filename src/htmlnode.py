@@ -1,16 +1,67 @@
+from types import MappingProxyType
+
 from textnode import TextType
 
+# Shared by every node without children or props: a document has tens of
+# thousands of leaves, and each used to carry its own empty list and dict.
+# Immutable, so no node can change what the others see.
+NO_CHILDREN = ()
+NO_PROPS = MappingProxyType({})
+
+
+def _attrs(props):
+    # props_to_html() without its trailing space, as every tag wants it
+    return "".join([f' {key}="{value}"' for key, value in props.items()]) if props else ""
+
+
+def _write_html(node, out):
+    """Append node's HTML to the list `out`, one fragment at a time.
+
+    Walks the tree with an explicit stack instead of recursing through
+    to_html(), so nesting depth is not limited by the recursion limit and
+    each fragment is copied once, by the caller's final join, rather
+    than once per ancestor.
+    """
+    append = out.append
+    # One iterator per open element; leaves are written straight from the
+    # loop, and only a ParentNode pushes a new level.
+    stack = [iter((node,))]
+    closing = [""]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, LeafNode) and item.value is not None:
+                if item.tag is None:
+                    append(item.value)
+                else:
+                    append(f"<{item.tag}{_attrs(item.props)}>{item.value}</{item.tag}>")
+            elif isinstance(item, ParentNode):
+                append(f"<{item.tag}{_attrs(item.props)}>")
+                closing.append(f"</{item.tag}>")
+                stack.append(iter(item.children))
+                break
+            else:
+                append(item.to_html())  # any other HTMLNode renders itself
+        else:
+            stack.pop()
+            append(closing.pop())
+
 
 class HTMLNode:
+    __slots__ = ("tag", "value", "children", "props")
+
     def __init__(self, tag=None, value=None, children=None, props=None):
         self.tag = tag
         self.value = value
-        self.children = children if children is not None else []
-        self.props = props if props is not None else {}
+        self.children = children if children is not None else NO_CHILDREN
+        self.props = props if props is not None else NO_PROPS
 
 
     def to_html(self):
         raise NotImplementedError("Subclasses should implement this method")
+
+    def iter_html(self):
+        """to_html() in pieces, for writing straight to a file."""
+        yield self.to_html()
     
     def props_to_html(self):
         if not self.props:
@@ -19,10 +70,14 @@ class HTMLNode:
         return " " + props_str + " "
 
     def __repr__(self):
-        return f"HTMLNode(tag={self.tag}, value={self.value}, children={self.children}, props={self.props})"
+        children = [] if self.children is NO_CHILDREN else self.children
+        props = {} if self.props is NO_PROPS else self.props
+        return f"HTMLNode(tag={self.tag}, value={self.value}, children={children}, props={props})"
     
 
 class LeafNode(HTMLNode):
+    __slots__ = ()
+
     def __init__(self, tag, value, props=None):
         if value is None:
             raise ValueError(f"LeafNode must have a value (tag={tag}, props={props})")
@@ -35,18 +90,28 @@ class LeafNode(HTMLNode):
         if self.tag is None:
             return self.value
 
-        attrs = "" if not self.props else self.props_to_html().rstrip()
-        return f"<{self.tag}{attrs}>{self.value}</{self.tag}>"
+        return f"<{self.tag}{_attrs(self.props)}>{self.value}</{self.tag}>"
     
 
 class ParentNode(HTMLNode):
+    __slots__ = ()
+
     def __init__(self, tag, children=None, props=None):
-        super().__init__(tag=tag, value=None, children=children if children is not None else [], props=props)
+        super().__init__(tag=tag, value=None, children=children, props=props)
 
     def to_html(self):
-        attrs = "" if not self.props else self.props_to_html().rstrip()
-        children_html = "".join(child.to_html() for child in self.children)
-        return f"<{self.tag}{attrs}>{children_html}</{self.tag}>"
+        out = []
+        _write_html(self, out)
+        return "".join(out)
+
+    def iter_html(self):
+        """The opening tag, each child's HTML, then the closing tag. For a
+        document root that is one piece per block, so a caller writing the
+        pieces out never holds more than one block's HTML at a time."""
+        yield f"<{self.tag}{_attrs(self.props)}>"
+        for child in self.children:
+            yield child.to_html()
+        yield f"</{self.tag}>"
     
 
 def text_node_to_html_node(text_node):
@@ -59,13 +124,35 @@ def text_node_to_html_node(text_node):
     elif text_node.text_type == TextType.CODE_TEXT:
         return LeafNode("code", text_node.text)
     elif text_node.text_type == TextType.LINKS:
-        if not text_node.url:
+        if text_node.url is None:
             raise ValueError("Link text nodes must have a URL")
         return LeafNode("a", text_node.text, props={"href": text_node.url})
     elif text_node.text_type == TextType.IMAGES:
-        if not text_node.url:
+        if text_node.url is None:
             raise ValueError("Image text nodes must have a URL")
         return LeafNode("img", "", props={"src": text_node.url, "alt": text_node.text})
     else:
         raise ValueError(f"Unknown text type: {text_node.text_type}")
-    
\ No newline at end of file
+    
+
+def text_node_to_html(text_node):
+    """text_node_to_html_node(text_node).to_html(), without the node"""
+    text_type = text_node.text_type
+    if text_type == TextType.PLAIN_TEXT:
+        return text_node.text
+    elif text_type == TextType.BOLD_TEXT:
+        return f"<b>{text_node.text}</b>"
+    elif text_type == TextType.ITALIC_TEXT:
+        return f"<i>{text_node.text}</i>"
+    elif text_type == TextType.CODE_TEXT:
+        return f"<code>{text_node.text}</code>"
+    elif text_type == TextType.LINKS:
+        if text_node.url is None:
+            raise ValueError("Link text nodes must have a URL")
+        return f'<a href="{text_node.url}">{text_node.text}</a>'
+    elif text_type == TextType.IMAGES:
+        if text_node.url is None:
+            raise ValueError("Image text nodes must have a URL")
+        return f'<img src="{text_node.url}" alt="{text_node.text}"></img>'
+    else:
+        raise ValueError(f"Unknown text type: {text_type}")
@@ -0,0 +1,87 @@
+"""Bounded LRU cache in front of inline markdown rendering.
+
+The same short strings -- list items, headings, boilerplate lines -- come
+up again and again across a diary corpus, and each one used to be
+tokenized every time. InlineCache keeps the tokenized result for the most
+recently used texts, as tuples of values nobody modifies (TextNodes, HTML
+fragments), and counts hits, misses and evictions so the build can report
+whether it pays off. Mutable nodes are built fresh from the cached values
+by each caller.
+"""
+from collections import OrderedDict
+from typing import NamedTuple
+
+DEFAULT_SIZE = 2048
+
+
+class CacheStats(NamedTuple):
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @classmethod
+    def total(cls, stats):
+        """Sum of an iterable of CacheStats (one per page, say)."""
+        return cls(*(sum(column) for column in zip(cls(), *stats)))
+
+    def since(self, earlier):
+        """What happened between the `earlier` snapshot and this one."""
+        return CacheStats(*(now - then for now, then in zip(self, earlier)))
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self, name="Inline cache"):
+        return (
+            f"{name}: {self.hits} hit(s), {self.misses} miss(es), "
+            f"{self.evictions} eviction(s), {self.hit_rate:.1%} hit rate"
+        )
+
+
+class InlineCache:
+    """Rendered results keyed on the input text, least recently used
+    dropped first once more than `maxsize` are held. maxsize=0 disables
+    the cache: every call renders and nothing is counted."""
+
+    def __init__(self, maxsize=DEFAULT_SIZE):
+        self._entries = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+
+    def resize(self, maxsize):
+        """Change the bound, evicting the oldest entries if it shrank."""
+        self.maxsize = max(0, maxsize)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, text, render):
+        """render(text) as a tuple, rendered only if `text` is not cached.
+        An exception from render() propagates and nothing is stored."""
+        if not self.maxsize:
+            return tuple(render(text))
+        entries = self._entries
+        result = entries.get(text)
+        if result is not None:
+            entries.move_to_end(text)
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = entries[text] = tuple(render(text))
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def stats(self):
+        return CacheStats(self.hits, self.misses, self.evictions)
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
@@ -1,189 +1,93 @@
-import datetime
+"""Command-line entry point: `python3 src/main.py [options]`.
+
+Only argparse is loaded up front; the build itself (Gen_Content.build) and
+watch mode are imported once the arguments say they are needed.
+"""
+import argparse
 import os
-import shutil
 import sys
 
-from Gen_Content.generate_blog_index import generate_blog_index
-from Gen_Content.generate_landing_page import generate_landing_page
-from Gen_Content.generate_page import generate_page
-
-
-def copy_static_to_docs():
-    """
-    Copies all contents from static directory to docs directory.
-    Deletes existing contents of docs directory first.
-    Logs all operations to log.txt in the workspace root.
-    Also renders all .md files in content/ to docs/*.html and sets index.html.
-    """
-    workspace_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    static_path = os.path.join(workspace_root, "static")
-    content_path = os.path.join(workspace_root, "content")
-    template_path = os.path.join(workspace_root, "template.html")
-    docs_path = os.path.join(workspace_root, "docs")
-    log_path = os.path.join(workspace_root, "log.txt")
-    
-    with open(log_path, "w") as log_file:
-        log_file.write(f"Build Operation - {datetime.datetime.now(datetime.UTC)}\n")
-        log_file.write("=" * 50 + "\n\n")
 
-    def log_message(message):
-        with open(log_path, "a") as log_file:
-            timestamp = datetime.datetime.now(datetime.UTC).strftime('%H:%M:%S')
-            log_file.write(f"{timestamp} - {message}\n")
-        print(message)
-    
-    try:
-        if not os.path.exists(static_path):
-            log_message(f"ERROR: Static directory does not exist at {static_path}")
-            return False
-        if not os.path.exists(content_path):
-            log_message(f"ERROR: Content directory does not exist at {content_path}")
-            return False
-        if not os.path.exists(template_path):
-            log_message(f"ERROR: Template not found at {template_path}")
-            return False
-        
-        log_message(f"Starting build from {static_path} to {docs_path}")
-        
-        # Delete and recreate docs directory
-        if os.path.exists(docs_path):
-            log_message("Deleting existing docs directory...")
-            shutil.rmtree(docs_path)
-        os.makedirs(docs_path)
-        log_message("Created fresh docs directory")
-        
-        # Copy static files
-        def copy_recursive(src_dir, dest_dir, relative_path=""):
-            for item in os.listdir(src_dir):
-                src_item = os.path.join(src_dir, item)
-                dest_item = os.path.join(dest_dir, item)
-                relative_item = os.path.join(relative_path, item) if relative_path else item
-                if os.path.isdir(src_item):
-                    os.makedirs(dest_item, exist_ok=True)
-                    log_message(f"Created directory: {relative_item}")
-                    copy_recursive(src_item, dest_item, relative_item)
-                else:
-                    shutil.copy2(src_item, dest_item)
-                    file_size = os.path.getsize(src_item)
-                    log_message(f"Copied file: {relative_item} ({file_size} bytes)")
-        
-        copy_recursive(static_path, docs_path)
-        # Preserve repository-level CNAME if present (avoid wiping custom domain on rebuild)
-        repo_cname = os.path.join(workspace_root, "CNAME")
-        docs_cname = os.path.join(docs_path, "CNAME")
-        if os.path.exists(repo_cname):
-            shutil.copy2(repo_cname, docs_cname)
-            log_message("Copied repository CNAME to docs/CNAME")
-        
-        # Render all markdown files in content/ -> docs/*.html
-        md_files = [f for f in os.listdir(content_path) if f.lower().endswith(".md")]
-        if not md_files:
-            log_message("WARNING: No markdown files found in content/")
-        had_errors = False
-        for md_name in sorted(md_files):
-            src_md = os.path.join(content_path, md_name)
-            out_html = os.path.join(docs_path, f"{os.path.splitext(md_name)[0]}.html")
-            log_message(f"Generating page: {md_name} -> {os.path.basename(out_html)}")
-            try:
-                generate_page(src_md, template_path, out_html)
-            # Broad on purpose: this is the fault-isolation boundary between
-            # one page's markdown and the rest of the build. Every catch
-            # below logs the message and full traceback, so nothing is lost.
-            except Exception as e:  # noqa: BLE001
-                had_errors = True
-                log_message(f"ERROR building {md_name}: {e}")
-                import traceback
-                log_message(traceback.format_exc())
-                continue
-        
-        # Generate blog posts from content/dev_diary/
-        blog_dir = os.path.join(content_path, "dev_diary")
-        blog_posts_out = os.path.join(docs_path, "dev_diary")
-        if os.path.exists(blog_dir):
-            log_message("Generating blog posts from content/dev_diary/...")
-            os.makedirs(blog_posts_out, exist_ok=True)
-            blog_md_files = [f for f in os.listdir(blog_dir) if f.lower().endswith(".md")]
-            for md_name in sorted(blog_md_files):
-                src_md = os.path.join(blog_dir, md_name)
-                out_html = os.path.join(blog_posts_out, f"{os.path.splitext(md_name)[0]}.html")
-                log_message(f"  Generating blog post: {md_name}")
-                try:
-                    generate_page(src_md, template_path, out_html, is_blog_post=True)
-                except Exception as e:  # noqa: BLE001 -- see fault-isolation note above
-                    had_errors = True
-                    log_message(f"  ERROR building blog post {md_name}: {e}")
-                    import traceback
-                    log_message(traceback.format_exc())
-                    continue
-            
-            # Generate blog index page
-            dev_diary_template = os.path.join(workspace_root, "dev_diary_template.html")
-            dev_diary_index = os.path.join(docs_path, "dev_diary.html")
-            if os.path.exists(dev_diary_template):
-                log_message("Generating blog index page...")
-                try:
-                    generate_blog_index(content_path, dev_diary_template, dev_diary_index)
-                except Exception as e:  # noqa: BLE001 -- see fault-isolation note above
-                    had_errors = True
-                    log_message(f"ERROR generating blog index: {e}")
-                    import traceback
-                    log_message(traceback.format_exc())
-            else:
-                log_message("WARNING: dev_diary_template.html not found")
-        else:
-            log_message("No dev_diary subdirectory found, skipping blog generation")
-        
-        # Generate landing page as index.html
-        titlepage_template = os.path.join(workspace_root, "titlepage.html")
-        index_html = os.path.join(docs_path, "index.html")
-        
-        if os.path.exists(titlepage_template):
-            log_message("Generating landing page...")
-            try:
-                site_config = {
-                    "title": "Home - Portfolio",
-                    "site_title": "Bret Zanotelli",
-                    "site_description": "IT consultant. Linux daily driver. I make things talk to each other properly.",
-                    "site_author": "Bret Zanotelli",
-                    "description": "Personal portfolio featuring development projects, resume, and creative pursuits"
-                }
-                generate_landing_page(content_path, titlepage_template, index_html, site_config)
-                log_message("Landing page generated successfully as index.html")
-            except Exception as e:  # noqa: BLE001 -- see fault-isolation note above
-                had_errors = True
-                log_message(f"ERROR generating landing page: {e}")
-                import traceback
-                log_message(traceback.format_exc())
-        else:
-            log_message(f"WARNING: titlepage.html template not found at {titlepage_template}")
-            # Fallback to old behavior
-            resume_html = os.path.join(docs_path, "resume.html")
-            if os.path.exists(resume_html):
-                shutil.copy2(resume_html, index_html)
-                log_message("Set homepage: index.html copied from resume.html (fallback)")
-            else:
-                generated = [os.path.join(docs_path, f"{os.path.splitext(m)[0]}.html") for m in md_files]
-                generated = [p for p in generated if os.path.exists(p)]
-                if generated:
-                    shutil.copy2(generated[0], index_html)
-                    log_message(f"Set homepage: index.html copied from {os.path.basename(generated[0])} (fallback)")
-                else:
-                    log_message("WARNING: No pages generated to set as index.html")
-        
-        if had_errors:
-            log_message("Build completed with errors (see above).")
-            return False
-        log_message("Build completed successfully!")
-        return True
-        
-    except Exception as e:  # noqa: BLE001 -- last-resort boundary for the whole build
-        log_message(f"ERROR: {e}")
-        import traceback
-        log_message(traceback.format_exc())
-        return False
-
-def main():
+def main(argv=None):
     """Main build function"""
+    parser = argparse.ArgumentParser(description="Build the site from content/ and static/ into docs/.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="keep docs/ and rebuild only outputs whose inputs changed since the last build",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="render pages on N processes (0 = one per CPU); small sites stay serial",
+    )
+    parser.add_argument(
+        "--link-static",
+        action="store_true",
+        help="hardlink static files into docs/ instead of copying them",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="print one summary line per stage instead of one line per file",
+    )
+    parser.add_argument(
+        "--log-json",
+        action="store_true",
+        help="also write log.jsonl: one JSON record per log line with stage, page and elapsed time",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time every stage and page, print the slowest pages and write a Chrome trace to .cache/build_trace.json",
+    )
+    parser.add_argument(
+        "--profile-stats",
+        metavar="FILE",
+        help="also run the build under cProfile and dump pstats data to FILE (implies --profile)",
+    )
+    parser.add_argument(
+        "--read-only-sources",
+        action="store_true",
+        help="never write under content/; keep assigned page dates in page_dates.json instead",
+    )
+    parser.add_argument(
+        "--inline-cache",
+        type=int,
+        metavar="N",
+        help="cache rendered inline markdown for the N most recently used texts (default 2048, 0 disables)",
+    )
+    parser.add_argument(
+        "--block-cache",
+        type=int,
+        metavar="N",
+        help="keep up to N rendered blocks in .cache/block_cache.json so unchanged blocks are not "
+        "re-parsed (default 10000, 0 disables)",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        metavar="TARGET",
+        help="build only TARGET and leave the rest of docs/ untouched: landing, pages, blog, static "
+        "or a markdown file under content/ (repeatable)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="build incrementally, then rebuild only the affected outputs whenever an input changes",
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or a positive integer")
+    if args.inline_cache is not None and args.inline_cache < 0:
+        parser.error("--inline-cache must be 0 or a positive integer")
+    if args.block_cache is not None and args.block_cache < 0:
+        parser.error("--block-cache must be 0 or a positive integer")
+    if args.only and args.watch:
+        parser.error("--only cannot be combined with --watch")
+
     # Windows consoles default to cp1252, which can't encode the status glyphs
     # below (or any non-ASCII page title). Without this the build generates the
     # site correctly and then dies on the final print, exiting non-zero.
@@ -195,7 +99,52 @@ def main():
         except (AttributeError, ValueError):
             pass
 
-    success = copy_static_to_docs()
+    # Shared by the one-off build and every watch rebuild
+    build_options = dict(
+        jobs=args.jobs,
+        link_static=args.link_static,
+        quiet=args.quiet,
+        log_json=args.log_json,
+        read_only_sources=args.read_only_sources,
+        inline_cache_size=args.inline_cache,
+        block_cache_size=args.block_cache,
+    )
+    # Imported only now, so --help and argument errors stay instant.
+    from Gen_Content.build import MANIFEST_FILE, WORKSPACE_ROOT, copy_static_to_docs, select_targets
+
+    targets = None
+    if args.only:
+        try:
+            targets = select_targets(args.only)
+        except ValueError as e:
+            parser.error(f"--only: {e}")
+
+    if args.watch:
+        from Gen_Content.build_manifest import BuildManifest
+        from Gen_Content.watch import watch
+
+        watched = [
+            os.path.join(WORKSPACE_ROOT, name)
+            for name in ("content", "static", "template.html", "dev_diary_template.html", "titlepage.html", "CNAME")
+        ]
+        try:
+            watch(
+                watched,
+                build=lambda targets: copy_static_to_docs(incremental=True, targets=targets, **build_options),
+                load_manifest=lambda: BuildManifest.load(os.path.join(WORKSPACE_ROOT, MANIFEST_FILE), WORKSPACE_ROOT),
+                root=WORKSPACE_ROOT,
+            )
+        except KeyboardInterrupt:
+            print("\nStopped watching.")
+        return
+
+    success = copy_static_to_docs(
+        incremental=args.incremental,
+        targets=targets,
+        profile=args.profile,
+        profile_stats=args.profile_stats,
+        **build_options,
+    )
     if success:
         print("\n✓ Site built successfully!")
         print("✓ Open docs/index.html to preview")
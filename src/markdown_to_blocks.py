@@ -3,11 +3,18 @@ def markdown_to_blocks(markdown_text):
     converts markdown to a list of blocks
     like headers, paragraphs, etc. 
     """
-    blocks = []
+    return list(iter_blocks(markdown_text.split("\n")))
+
+
+def iter_blocks(lines):
+    """
+    Same blocks as markdown_to_blocks(), yielded one at a time from any
+    iterable of lines (an open file, say; trailing newlines are ignored).
+    Only the block being built is held in memory.
+    """
     current_paragraph = []
     in_code_fence = False
 
-    lines = markdown_text.split("\n")
     for raw_line in lines:
         line = raw_line.rstrip()
 
@@ -15,15 +22,13 @@ def markdown_to_blocks(markdown_text):
         if line.lstrip().startswith("```"):
             if not in_code_fence:
                 if current_paragraph:
-                    block = "\n".join(current_paragraph).strip("\n")
-                    blocks.append(block)
+                    yield "\n".join(current_paragraph).strip("\n")
                     current_paragraph = []
                 in_code_fence = True
                 current_paragraph.append(line.lstrip())
             else:
                 current_paragraph.append(line.lstrip())
-                block = "\n".join(current_paragraph).strip("\n")
-                blocks.append(block)
+                yield "\n".join(current_paragraph).strip("\n")
                 current_paragraph = []
                 in_code_fence = False
             continue
@@ -35,8 +40,7 @@ def markdown_to_blocks(markdown_text):
 
         if line.strip() == "":
             if current_paragraph:
-                block = "\n".join(current_paragraph).strip("\n")
-                blocks.append(block)
+                yield "\n".join(current_paragraph).strip("\n")
                 current_paragraph = []
         else:
             stripped = line.strip()
@@ -44,16 +48,12 @@ def markdown_to_blocks(markdown_text):
             # Keep heading behavior for top-level headings
             if line == line.lstrip() and stripped.startswith("#") and " " in stripped:
                 if current_paragraph:
-                    block = "\n".join(current_paragraph).strip("\n")
-                    blocks.append(block)
+                    yield "\n".join(current_paragraph).strip("\n")
                     current_paragraph = []
-                blocks.append(stripped)
+                yield stripped
             else:
                 # Preserve leading spaces for nested list parsing
                 current_paragraph.append(line)
 
     if current_paragraph:
-        block = "\n".join(current_paragraph).strip("\n")
-        blocks.append(block)
-
-    return blocks
\ No newline at end of file
+        yield "\n".join(current_paragraph).strip("\n")
\ No newline at end of file
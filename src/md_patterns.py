@@ -0,0 +1,44 @@
+"""Compiled regular expressions for the markdown pipeline.
+
+Every pattern the parser uses is compiled once, here, when the pipeline is
+imported, instead of being rebuilt inside the functions that use it (or
+looked up again in the re module's cache, which a mixed workload can
+evict). The hot loops bind the compiled `match`/`finditer` methods to
+module-level names so a call costs one lookup.
+"""
+import re
+
+# --- inline ---------------------------------------------------------------
+
+# Every character sequence text_to_textnodes() cares about, found in one
+# left-to-right scan. Images and links exclude backticks so they can never
+# swallow one: code spans win over everything else.
+#
+# None of these patterns can backtrack badly. Each variable-length part is
+# a negated class that excludes the bracket or delimiter it stops at, so an
+# attempt starting at one `[` or `*` scans no further than the next one,
+# and the attempts together read each character a bounded number of times.
+# Keep it that way: scripts/inline_stress.py times them on the inputs that
+# would show it.
+INLINE_TOKEN = re.compile(r"`|(!?)\[([^\[\]`]*)\]\(([^()`]*)\)|\*\*|__")
+
+IMAGE = re.compile(r"!\[([^\[\]]*)\]\(([^\(\)]*)\)")
+LINK = re.compile(r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)")
+
+
+def _emphasis(delimiter):
+    # Only match if delimiter is surrounded by whitespace or punctuation
+    # This prevents matching underscores in variable names
+    d = re.escape(delimiter)
+    return re.compile(rf'(?<!\w){d}([^{d}]+?){d}(?!\w)')
+
+
+# Single-character emphasis delimiters (*italic*, _italic_)
+EMPHASIS = {delimiter: _emphasis(delimiter) for delimiter in ("*", "_")}
+
+# --- blocks ---------------------------------------------------------------
+
+# A list item line: indent, then "-" (group 2) or "N.", then the item text.
+# One match per line tells the block lexer both whether it is a marker
+# line and of which kind.
+LIST_LINE = re.compile(r"^(\s*)(?:\d+\.|(-))\s+(.*)$")
@@ -1,8 +1,11 @@
-from extract_markdown import extract_markdown_images, extract_markdown_links
+from md_patterns import IMAGE, LINK
 from textnode import TextNode, TextType
 
 
-def split_nodes_image(old_nodes):
+def _split_nodes_by_pattern(old_nodes, finditer, text_type):
+    # Slices each plain node at the match offsets of one finditer scan
+    # (the spans extract_markdown_*_spans() report), rather than finding
+    # each (text, url) pair in the node again.
     new_nodes = []
 
     for node in old_nodes:
@@ -10,49 +13,27 @@ def split_nodes_image(old_nodes):
             new_nodes.append(node)
             continue
 
-        parts = extract_markdown_images(node.text)
-
-        if not parts:
-            new_nodes.append(node)
-            continue
-
+        text = node.text
         last_end = 0
-        for alt_text, url in parts:
-            start = node.text.find(f"![{alt_text}]({url})", last_end)
+        for m in finditer(text):
+            start, end = m.span()
             if start > last_end:
-                new_nodes.append(TextNode(node.text[last_end:start], TextType.PLAIN_TEXT))
-            new_nodes.append(TextNode(alt_text, TextType.IMAGES, url))
-            last_end = start + len(f"![{alt_text}]({url})")
-
-        if last_end < len(node.text):
-            new_nodes.append(TextNode(node.text[last_end:], TextType.PLAIN_TEXT))
-
-    return new_nodes
-
-
-def split_nodes_link(old_nodes):
-    new_nodes = []
+                new_nodes.append(TextNode(text[last_end:start], TextType.PLAIN_TEXT))
+            label, url = m.groups()
+            new_nodes.append(TextNode(label, text_type, url))
+            last_end = end
 
-    for node in old_nodes:
-        if node.text_type is not TextType.PLAIN_TEXT:
+        if last_end == 0:  # no match: keep the node as it was
             new_nodes.append(node)
-            continue
+        elif last_end < len(text):
+            new_nodes.append(TextNode(text[last_end:], TextType.PLAIN_TEXT))
 
-        parts = extract_markdown_links(node.text)
+    return new_nodes
 
-        if not parts:
-            new_nodes.append(node)
-            continue
 
-        last_end = 0
-        for link_text, url in parts:
-            start = node.text.find(f"[{link_text}]({url})", last_end)
-            if start > last_end:
-                new_nodes.append(TextNode(node.text[last_end:start], TextType.PLAIN_TEXT))
-            new_nodes.append(TextNode(link_text, TextType.LINKS, url))
-            last_end = start + len(f"[{link_text}]({url})")
+def split_nodes_image(old_nodes):
+    return _split_nodes_by_pattern(old_nodes, IMAGE.finditer, TextType.IMAGES)
 
-        if last_end < len(node.text):
-            new_nodes.append(TextNode(node.text[last_end:], TextType.PLAIN_TEXT))
 
-    return new_nodes
\ No newline at end of file
+def split_nodes_link(old_nodes):
+    return _split_nodes_by_pattern(old_nodes, LINK.finditer, TextType.LINKS)
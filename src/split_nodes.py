@@ -1,5 +1,4 @@
-import re
-
+from md_patterns import EMPHASIS
 from textnode import TextNode, TextType
 
 
@@ -13,16 +12,13 @@ def split_nodes_delimiter(old_nodes, delimiter, text_type):
 
         # For single-character delimiters like _ and *, use smarter regex-based matching
         # to avoid breaking variable names like snake_case or file_names
-        if delimiter in ["_", "*"] and len(delimiter) == 1:
-            # Only match if delimiter is surrounded by whitespace or punctuation
-            # This prevents matching underscores in variable names
-            pattern = rf'(?<!\w){re.escape(delimiter)}([^{re.escape(delimiter)}]+?){re.escape(delimiter)}(?!\w)'
-            
+        pattern = EMPHASIS.get(delimiter)
+        if pattern is not None:
             last_end = 0
             text = node.text
             has_matches = False
             
-            for match in re.finditer(pattern, text):
+            for match in pattern.finditer(text):
                 has_matches = True
                 # Add text before the match as plain text
                 if match.start() > last_end:
@@ -0,0 +1,30 @@
+"""Helpers shared by the tests that work on real files."""
+import os
+import tempfile
+import unittest
+
+
+def write_file(path, data):
+    """Write text (UTF-8) or bytes to `path`, creating its directories."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    with open(path, "wb") as handle:
+        handle.write(data)
+
+
+def read_file(path):
+    with open(path, encoding="utf-8") as handle:
+        return handle.read()
+
+
+def read_bytes(path):
+    with open(path, "rb") as handle:
+        return handle.read()
+
+
+class TempDirTestCase(unittest.TestCase):
+    """self.root is a fresh directory for each test, removed afterwards."""
+
+    def setUp(self):
+        self.root = self.enterContext(tempfile.TemporaryDirectory())
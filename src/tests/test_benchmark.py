@@ -0,0 +1,40 @@
+import unittest
+
+import benchmark
+
+
+class TestCases(unittest.TestCase):
+    def test_every_stage_is_covered(self):
+        stages = {name.split("/")[0] for name in benchmark._cases()}
+        self.assertEqual(stages, {
+            "markdown_to_blocks", "text_to_textnodes", "text_to_textnodes_multipass", "split_nodes_delimiter",
+            "split_nodes_image", "split_nodes_link", "markdown_to_html_node", "to_html", "markdown_to_html",
+            "block_to_block_type", "lex_block", "extract_markdown",
+        })
+
+    def test_every_case_runs(self):
+        for name, func in benchmark._cases().items():
+            with self.subTest(name):
+                self.assertTrue(func())
+
+
+class TestCompare(unittest.TestCase):
+    baseline = {"relative": {"a": 10.0, "b": 10.0, "gone": 1.0}}
+
+    def test_flags_only_cases_beyond_tolerance(self):
+        current = {"results": {}, "relative": {"a": 14.0, "b": 16.0, "new": 99.0}}
+        regressions = benchmark.compare(current, self.baseline, tolerance=0.5)
+        self.assertEqual([name for name, _ in regressions], ["b"])
+        self.assertAlmostEqual(regressions[0][1], 1.6)
+
+    def test_speedups_never_fail(self):
+        current = {"results": {}, "relative": {"a": 1.0, "b": 5.0}}
+        self.assertEqual(benchmark.compare(current, self.baseline), [])
+
+    def test_table_shows_change_against_baseline(self):
+        current = {"results": {"a": 0.001}, "relative": {"a": 12.0}}
+        self.assertIn("+20.0%", benchmark.format_table(current, self.baseline))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from block_to_html import markdown_to_html_node
+from Gen_Content.block_cache import BlockCache
+from Gen_Content.build import BLOCK_CACHE_FILE, copy_static_to_docs
+from Gen_Content.parallel_render import MIN_PAGES_PER_WORKER
+from synthetic_site import generate
+
+DOC = "# Title\n\nFirst *para*.\n\n- a\n  - b\n\n> \n\n```py\nx = 1\n```\n\nLast [link](url)."
+
+
+class RecordingCache(BlockCache):
+    def __init__(self, path):
+        super().__init__(path, version="test")
+        self.rendered = []
+
+    def put(self, block, html):
+        self.rendered.append(block)
+        super().put(block, html)
+
+
+class TestBlockCache(unittest.TestCase):
+    def setUp(self):
+        tmp = self.enterContext(tempfile.TemporaryDirectory())
+        self.path = os.path.join(tmp, ".cache", "blocks.json")
+
+    def test_cached_render_is_identical(self):
+        cache = RecordingCache(self.path)
+        expected = markdown_to_html_node(DOC).to_html()
+        self.assertEqual(markdown_to_html_node(DOC, cache=cache).to_html(), expected)
+        self.assertEqual(markdown_to_html_node(DOC, cache=cache).to_html(), expected)
+        self.assertEqual(cache.stats().hits, len(cache.rendered))
+
+    def test_only_changed_blocks_are_rendered(self):
+        cache = RecordingCache(self.path)
+        markdown_to_html_node(DOC, cache=cache)
+        cache.rendered.clear()
+        edited = DOC.replace("First", "Frist")
+        self.assertEqual(markdown_to_html_node(edited, cache=cache).to_html(), markdown_to_html_node(edited).to_html())
+        self.assertEqual(cache.rendered, ["Frist *para*."])
+
+    def test_round_trip_and_lru_cap(self):
+        cache = BlockCache(self.path, maxsize=2, version="v1")
+        for block in ("a", "b"):
+            cache.put(block, f"<p>{block}</p>")
+        cache.get("a")  # b is now the oldest
+        cache.put("c", "<p>c</p>")
+        self.assertEqual((len(cache), cache.stats().evictions), (2, 1))
+        cache.update({cache.key("d"): "<p>d</p>"})
+        self.assertEqual((len(cache), cache.stats().evictions), (2, 2))
+        cache.save()
+        loaded = BlockCache.load(self.path, version="v1")
+        self.assertEqual((loaded.get("a"), loaded.get("c"), loaded.get("d")), (None, "<p>c</p>", "<p>d</p>"))
+
+    def test_loading_into_a_smaller_cache_evicts_the_oldest(self):
+        cache = BlockCache(self.path, version="v1")
+        for block in "abc":
+            cache.put(block, block)
+        cache.save()
+        loaded = BlockCache.load(self.path, maxsize=1, version="v1")
+        self.assertEqual((len(loaded), loaded.stats().evictions, loaded.get("c")), (1, 2, "c"))
+
+    def test_hits_alone_do_not_rewrite_the_file(self):
+        cache = BlockCache(self.path, version="v1")
+        cache.put("a", "<p>a</p>")
+        cache.save()
+        loaded = BlockCache.load(self.path, version="v1")
+        os.remove(self.path)
+        self.assertEqual(loaded.get("a"), "<p>a</p>")
+        loaded.save()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_other_version_starts_empty(self):
+        cache = BlockCache(self.path, version="v1")
+        cache.put("a", "<p>a</p>")
+        cache.save()
+        self.assertNotEqual(cache.key("a"), BlockCache(self.path, version="v2").key("a"))
+        self.assertEqual(len(BlockCache.load(self.path, version="v2")), 0)
+
+    def test_corrupt_file_starts_empty(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w", encoding="utf-8") as handle:
+            handle.write("{not json")
+        self.assertEqual(len(BlockCache.load(self.path)), 0)
+
+    def test_unchanged_cache_is_not_rewritten(self):
+        BlockCache(self.path).save()
+        self.assertFalse(os.path.exists(self.path))
+
+
+class TestBuildUsesBlockCache(unittest.TestCase):
+    def setUp(self):
+        self.root = os.path.join(self.enterContext(tempfile.TemporaryDirectory()), "site")
+        generate(self.root, posts=MIN_PAGES_PER_WORKER * 2, pages=1)
+
+    def build(self, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(copy_static_to_docs(quiet=True, workspace_root=self.root, **kwargs))
+        with open(os.path.join(self.root, "log.txt"), encoding="utf-8") as handle:
+            return handle.read()
+
+    def docs(self):
+        pages = {}
+        for dirpath, _, files in os.walk(os.path.join(self.root, "docs")):
+            for name in files:
+                with open(os.path.join(dirpath, name), "rb") as handle:
+                    pages[os.path.join(dirpath, name)] = handle.read()
+        return pages
+
+    def test_pool_workers_fill_the_cache_and_rebuilds_reuse_it(self):
+        self.build(jobs=2)
+        with open(os.path.join(self.root, BLOCK_CACHE_FILE), encoding="utf-8") as handle:
+            self.assertTrue(json.load(handle)["entries"])
+        cold = self.docs()
+        log = self.build()
+        self.assertIn("Block cache: ", log)
+        self.assertIn("0 miss(es)", log)
+        self.assertEqual(self.docs(), cold)
+
+    def test_evictions_are_counted_as_blocks_are_added(self):
+        log = self.build(block_cache_size=5)
+        self.assertNotIn("0 eviction(s)", log.split("Block cache: ")[1].splitlines()[0])
+        with open(os.path.join(self.root, BLOCK_CACHE_FILE), encoding="utf-8") as handle:
+            self.assertEqual(len(json.load(handle)["entries"]), 5)
+
+    def test_zero_disables(self):
+        self.build(block_cache_size=0)
+        self.assertFalse(os.path.exists(os.path.join(self.root, BLOCK_CACHE_FILE)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+from block_to_html import markdown_to_html_node
+from block_types import BlockType, block_to_block_type, lex_block
+
+
+class TestLexBlock(unittest.TestCase):
+    def test_heading_level_and_text(self):
+        block = lex_block("### Some *title*")
+        self.assertEqual((block.type, block.level, block.text), (BlockType.HEADER, 3, "Some *title*"))
+        self.assertIs(lex_block("####### seven").type, BlockType.PARAGRAPH)
+        self.assertIs(lex_block("#no space").type, BlockType.PARAGRAPH)
+
+    def test_code_fence_info_string(self):
+        block = lex_block("```python\nx = 1\n```")
+        self.assertEqual((block.type, block.info, block.lines), (BlockType.CODE, "python", ["```python", "x = 1", "```"]))
+        self.assertEqual(lex_block("```code block```").info, "")
+
+    def test_quote(self):
+        self.assertIs(lex_block("> a\n> b").type, BlockType.QUOTE)
+
+    def test_lists_allow_indented_continuations(self):
+        self.assertIs(lex_block("- a\n  more\n- b").type, BlockType.UNORDERED_LIST)
+        self.assertIs(lex_block("1. a\n  - sub\n2. b").type, BlockType.ORDERED_LIST)
+        self.assertIs(lex_block("1. a\n- b").type, BlockType.PARAGRAPH)
+        self.assertIs(lex_block("- a\nstray").type, BlockType.PARAGRAPH)
+        self.assertIs(lex_block("  more").type, BlockType.PARAGRAPH)
+
+    def test_lines_are_split_once(self):
+        block = lex_block("- a\n\n- b")
+        self.assertEqual(block.lines, ["- a", "", "- b"])
+        self.assertEqual(len(block.items), 3)
+        self.assertIsNone(block.items[1])
+
+    def test_block_to_block_type_agrees(self):
+        for block in ("# h", "```x```", "> q", "- a", "1. a", "text"):
+            with self.subTest(block):
+                self.assertIs(block_to_block_type(block), lex_block(block).type)
+
+
+class TestListRendering(unittest.TestCase):
+    def test_continuation_lines_join_with_spaces(self):
+        html = markdown_to_html_node("- first\n  second\n  third\n- next").to_html()
+        self.assertEqual(html, "<div><ul><li>first second third</li><li>next</li></ul></div>")
+
+    def test_other_kind_of_marker_is_continuation_text(self):
+        html = markdown_to_html_node("1. one\n  - dash\n2. two").to_html()
+        self.assertEqual(html, "<div><ol><li>one - dash</li><li>two</li></ol></div>")
+
+    def test_nesting(self):
+        html = markdown_to_html_node("- a\n  - b\n- c").to_html()
+        self.assertEqual(html, "<div><ul><li>a<ul><li>b</li></ul></li><li>c</li></ul></div>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import contextlib
+import io
+import json
+import os
+import unittest
+
+from Gen_Content.build_log import BuildLog
+from support import TempDirTestCase, read_file
+
+
+class LogCase(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.root, "log.txt")
+        self.json_path = os.path.join(self.root, "log.jsonl")
+        self.console = io.StringIO()
+
+    def read(self, path=None):
+        return read_file(path or self.path)
+
+    def records(self):
+        return [json.loads(line) for line in self.read(self.json_path).splitlines()]
+
+
+class TestTextLog(LogCase):
+    def test_header_and_timestamped_lines(self):
+        with BuildLog(self.path, stream=self.console) as log:
+            log.info("Starting build")
+        text = self.read()
+        self.assertTrue(text.startswith("Build Operation - "))
+        self.assertRegex(text, r"\d\d:\d\d:\d\d - Starting build\n")
+
+    def test_every_kind_of_line_reaches_console_by_default(self):
+        with BuildLog(self.path, stream=self.console) as log:
+            log.info("one")
+            log.detail("two")
+            log.error("three")
+        self.assertEqual(self.console.getvalue(), "one\ntwo\nthree\n")
+
+    def test_error_is_on_disk_before_close(self):
+        log = BuildLog(self.path, stream=self.console)
+        try:
+            log.detail("buffered")
+            log.error("ERROR: boom")
+            self.assertIn("ERROR: boom", self.read())
+        finally:
+            log.close()
+
+    def test_close_is_idempotent(self):
+        log = BuildLog(self.path, stream=self.console)
+        log.close()
+        log.close()
+
+
+class TestQuietMode(LogCase):
+    def test_details_stay_in_the_file(self):
+        with BuildLog(self.path, quiet=True, stream=self.console) as log:
+            log.stage("static")
+            log.detail("Copied file: a.css")
+        self.assertNotIn("Copied file", self.console.getvalue())
+        self.assertIn("Copied file: a.css", self.read())
+
+    def test_prints_one_summary_per_stage(self):
+        with BuildLog(self.path, quiet=True, stream=self.console) as log:
+            log.stage("static")
+            log.detail("a")
+            log.detail("b")
+            log.stage("pages")
+            log.detail("c")
+        lines = self.console.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith("static: 2 line(s) in "))
+        self.assertTrue(lines[1].startswith("pages: 1 line(s) in "))
+
+    def test_errors_and_warnings_still_print(self):
+        with BuildLog(self.path, quiet=True, stream=self.console) as log:
+            log.stage("pages")
+            log.info("WARNING: No markdown files found")
+            log.error("ERROR building x.md: bad")
+        out = self.console.getvalue()
+        self.assertIn("WARNING: No markdown files found", out)
+        self.assertIn("ERROR building x.md: bad", out)
+        self.assertIn("pages: 2 line(s), 1 error(s)", out)
+
+    def test_capture_files_printed_lines_as_details(self):
+        with BuildLog(self.path, quiet=True, stream=self.console) as log:
+            log.stage("pages")
+            with contextlib.redirect_stdout(log.capture()):
+                print("Page written to docs/a.html")
+                print("partial", end="")
+                print(" line")
+        self.assertIn("Page written to docs/a.html", self.read())
+        self.assertIn("partial line", self.read())
+        self.assertNotIn("Page written", self.console.getvalue())
+
+
+class TestJsonLines(LogCase):
+    def test_records_carry_stage_page_and_elapsed(self):
+        with BuildLog(self.path, json_path=self.json_path, stream=self.console) as log:
+            log.stage("pages")
+            log.detail("Generating page: a.md", page="content/a.md")
+            log.error("ERROR building a.md", page="content/a.md")
+        records = self.records()
+        self.assertEqual([r["level"] for r in records], ["detail", "error"])
+        self.assertEqual({r["stage"] for r in records}, {"pages"})
+        self.assertEqual(records[0]["page"], "content/a.md")
+        self.assertLessEqual(records[0]["elapsed_ms"], records[1]["elapsed_ms"])
+
+    def test_warning_level_is_distinguished(self):
+        with BuildLog(self.path, json_path=self.json_path, stream=self.console) as log:
+            log.info("WARNING: template not found")
+        self.assertEqual(self.records()[0]["level"], "warning")
+
+    def test_unicode_survives(self):
+        with BuildLog(self.path, json_path=self.json_path, stream=self.console) as log:
+            log.info("Lööps")
+        self.assertEqual(self.records()[0]["message"], "Lööps")
+
+
+if __name__ == "__main__":
+    unittest.main()
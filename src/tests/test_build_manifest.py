@@ -0,0 +1,175 @@
+import json
+import os
+import tempfile
+import unittest
+
+from Gen_Content.build_manifest import BuildManifest
+from support import TempDirTestCase, write_file
+
+
+class ManifestCase(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.manifest_path = os.path.join(self.root, ".cache", "build_manifest.json")
+        self.src = os.path.join(self.root, "content", "post.md")
+        self.out = os.path.join(self.root, "docs", "post.html")
+        write_file(self.src, "# Post\n")
+        write_file(self.out, "<h1>Post</h1>")
+
+    def reload(self, keep_targets=True):
+        return BuildManifest.load(self.manifest_path, self.root, keep_targets=keep_targets)
+
+
+class TestFreshness(ManifestCase):
+    def test_unknown_target_is_not_current(self):
+        self.assertFalse(self.reload().is_current("post", [self.src]))
+
+    def test_recorded_target_is_current_after_reload(self):
+        manifest = self.reload()
+        manifest.record("post", [self.src], [self.out])
+        manifest.save()
+        self.assertTrue(self.reload().is_current("post", [self.src]))
+
+    def test_changed_input_is_not_current(self):
+        manifest = self.reload()
+        manifest.record("post", [self.src], [self.out])
+        manifest.save()
+        write_file(self.src, "# Post, edited\n")
+        self.assertFalse(self.reload().is_current("post", [self.src]))
+
+    def test_changed_param_is_not_current(self):
+        manifest = self.reload()
+        manifest.record("post", [self.src], [self.out], {"year": 2026})
+        self.assertTrue(manifest.is_current("post", [self.src], {"year": 2026}))
+        self.assertFalse(manifest.is_current("post", [self.src], {"year": 2027}))
+
+    def test_added_input_is_not_current(self):
+        template = os.path.join(self.root, "template.html")
+        write_file(template, "{{ Content }}")
+        manifest = self.reload()
+        manifest.record("post", [self.src], [self.out])
+        self.assertFalse(manifest.is_current("post", [self.src, template]))
+
+    def test_missing_output_is_not_current(self):
+        manifest = self.reload()
+        manifest.record("post", [self.src], [self.out])
+        os.remove(self.out)
+        self.assertFalse(manifest.is_current("post", [self.src]))
+
+    def test_full_build_load_ignores_recorded_targets(self):
+        manifest = self.reload()
+        manifest.record("post", [self.src], [self.out])
+        manifest.save()
+        self.assertFalse(self.reload(keep_targets=False).is_current("post", [self.src]))
+
+    def test_forget_makes_target_stale(self):
+        manifest = self.reload()
+        manifest.record("post", [self.src], [self.out])
+        manifest.forget("post")
+        self.assertFalse(manifest.is_current("post", [self.src]))
+
+
+class TestCorruptManifest(ManifestCase):
+    def test_garbage_file_means_nothing_is_current(self):
+        write_file(self.manifest_path, "{not json")
+        self.assertFalse(self.reload().is_current("post", [self.src]))
+
+    def test_other_version_means_nothing_is_current(self):
+        manifest = self.reload()
+        manifest.record("post", [self.src], [self.out])
+        manifest.save()
+        with open(self.manifest_path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        data["version"] = -1
+        write_file(self.manifest_path, json.dumps(data))
+        self.assertFalse(self.reload().is_current("post", [self.src]))
+
+
+class TestStaleOutputs(ManifestCase):
+    def test_prune_deletes_outputs_of_vanished_targets(self):
+        manifest = self.reload()
+        manifest.record("post", [self.src], [self.out])
+        manifest.save()
+
+        manifest = self.reload()
+        removed = manifest.prune()
+        self.assertEqual(removed, ["docs/post.html"])
+        self.assertFalse(os.path.exists(self.out))
+
+    def test_prune_keeps_targets_seen_this_build(self):
+        manifest = self.reload()
+        manifest.record("post", [self.src], [self.out])
+        manifest.save()
+
+        manifest = self.reload()
+        manifest.is_current("post", [self.src])
+        self.assertEqual(manifest.prune(), [])
+        self.assertTrue(os.path.exists(self.out))
+
+    def test_record_deletes_outputs_no_longer_produced(self):
+        page_two = os.path.join(self.root, "docs", "index-page-2.html")
+        write_file(page_two, "old")
+        manifest = self.reload()
+        manifest.record("index", [self.src], [self.out, page_two])
+        manifest.record("index", [self.src], [self.out])
+        self.assertFalse(os.path.exists(page_two))
+        self.assertTrue(os.path.exists(self.out))
+
+    def test_prune_never_deletes_outside_root(self):
+        with tempfile.TemporaryDirectory() as elsewhere:
+            victim = os.path.join(elsewhere, "keep.txt")
+            write_file(victim, "precious")
+            manifest = self.reload()
+            manifest.targets["evil"] = {
+                "inputs": {},
+                "outputs": [os.path.relpath(victim, self.root).replace(os.sep, "/")],
+            }
+            manifest.prune()
+            self.assertTrue(os.path.exists(victim))
+
+
+class TestDigestCache(ManifestCase):
+    def test_partial_build_keeps_digests_of_skipped_targets(self):
+        other = os.path.join(self.root, "content", "other.md")
+        write_file(other, "# Other\n")
+        manifest = self.reload()
+        manifest.record("post", [self.src], [self.out])
+        manifest.record("other", [other], [])
+        manifest.save()
+
+        manifest = self.reload()  # an --only build that touches "post" alone
+        manifest.record("post", [self.src], [self.out])
+        manifest.save()
+        self.assertIn("content/other.md", self.reload().files)
+
+    def test_digests_of_files_nothing_reads_are_dropped(self):
+        gone = os.path.join(self.root, "content", "gone.md")
+        write_file(gone, "# Gone\n")
+        manifest = self.reload()
+        manifest.file_hash(gone)
+        manifest.save()
+        self.assertIn("content/gone.md", self.reload().files)
+
+        manifest = self.reload()
+        manifest.record("post", [self.src], [self.out])
+        manifest.save()
+        self.assertNotIn("content/gone.md", self.reload().files)
+
+
+class TestFingerprint(ManifestCase):
+    def test_fingerprint_tracks_any_file_change(self):
+        manifest = self.reload()
+        before = manifest.fingerprint([self.src, self.out])
+        write_file(self.out, "<h1>Changed</h1>")
+        self.assertNotEqual(before, manifest.fingerprint([self.src, self.out]))
+
+    def test_fingerprint_ignores_argument_order(self):
+        manifest = self.reload()
+        self.assertEqual(
+            manifest.fingerprint([self.src, self.out]),
+            manifest.fingerprint([self.out, self.src]),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import json
+import os
+import pstats
+import unittest
+
+from Gen_Content.build_profile import BuildProfiler
+from support import TempDirTestCase
+
+
+class ProfileCase(TempDirTestCase):
+    def profiler(self, **kwargs):
+        profiler = BuildProfiler(**kwargs)
+        start = profiler.origin
+        with profiler:
+            profiler.stage("static")
+            profiler.stage("pages")
+            profiler.page("page:a.md", start + 0.001, start + 0.003, profiler.pid)
+            profiler.page("post:b.md", start + 0.001, start + 0.011, 4242)
+            profiler.page("post:c.md", start + 0.002, start + 0.007, 4243)
+        return profiler
+
+
+class TestReport(ProfileCase):
+    def test_stages_in_order_and_pages_slowest_first(self):
+        lines = self.profiler().report().splitlines()
+        self.assertEqual(lines[0], "Stage timings:")
+        self.assertTrue(lines[1].lstrip().startswith("static"))
+        self.assertTrue(lines[2].lstrip().startswith("pages"))
+        self.assertEqual(lines[3], "Slowest pages (3 of 3):")
+        self.assertEqual([line.split()[2] for line in lines[4:]], ["post:b.md", "post:c.md", "page:a.md"])
+        self.assertIn("[worker 4242]", lines[4])
+        self.assertNotIn("worker", lines[6])
+
+    def test_top_limits_the_page_list(self):
+        self.assertIn("Slowest pages (1 of 3):", self.profiler().report(top=1))
+
+
+class TestTrace(ProfileCase):
+    def test_one_lane_per_worker(self):
+        profiler = self.profiler()
+        path = os.path.join(self.root, "trace.json")
+        profiler.write_trace(path)
+        with open(path, encoding="utf-8") as handle:
+            events = json.load(handle)["traceEvents"]
+        lanes = {e["args"]["name"]: e["tid"] for e in events if e["name"] == "thread_name"}
+        self.assertEqual(lanes, {"main": profiler.pid, "worker 4242": 4242, "worker 4243": 4243})
+        spans = {e["name"]: e for e in events if e["ph"] == "X"}
+        self.assertEqual(spans["page:a.md"]["tid"], profiler.pid)
+        self.assertEqual(spans["post:b.md"]["ts"], 1000.0)
+        self.assertEqual(spans["post:b.md"]["dur"], 10000.0)
+        self.assertEqual(spans["static"]["cat"], "stage")
+
+
+class TestStatsDump(ProfileCase):
+    def test_cprofile_dump_is_loadable(self):
+        path = os.path.join(self.root, "stats", "build.pstats")
+        self.profiler(stats_path=path)
+        self.assertGreater(pstats.Stats(path).total_calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
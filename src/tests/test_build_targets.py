@@ -0,0 +1,104 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from Gen_Content.build import copy_static_to_docs, select_targets
+from synthetic_site import generate
+
+
+def _mtimes(root):
+    return {
+        os.path.join(dirpath, name): os.stat(os.path.join(dirpath, name)).st_mtime_ns
+        for dirpath, _, files in os.walk(root)
+        for name in files
+    }
+
+
+class TestSelectTargets(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.root = os.path.join(cls.enterClassContext(tempfile.TemporaryDirectory()), "site")
+        generate(cls.root, posts=3, pages=2)
+        cls.posts = sorted(os.listdir(os.path.join(cls.root, "content", "dev_diary")))
+
+    def test_groups(self):
+        self.assertEqual(select_targets(["landing"], self.root), {"landing"})
+        self.assertEqual(select_targets(["pages"], self.root), {"page:page000.md", "page:page001.md"})
+        self.assertEqual(
+            select_targets(["blog"], self.root), {f"post:{m}" for m in self.posts} | {"blog-index"}
+        )
+        static = select_targets(["static"], self.root)
+        self.assertIn("cname", static)
+        self.assertTrue(any(t.startswith("static:") for t in static))
+
+    def test_content_paths(self):
+        post = os.path.join("content", "dev_diary", self.posts[0])
+        self.assertEqual(select_targets([post], self.root), {f"post:{self.posts[0]}"})
+        page = os.path.join(self.root, "content", "page001.md")
+        self.assertEqual(select_targets([page, "landing"], self.root), {"page:page001.md", "landing"})
+
+    def test_unknown_selector(self):
+        with self.assertRaises(ValueError):
+            select_targets(["everything"], self.root)
+        with self.assertRaises(ValueError):
+            select_targets([os.path.join(self.root, "template.html")], self.root)
+
+
+class TestTargetedBuild(unittest.TestCase):
+    def setUp(self):
+        self.root = os.path.join(self.enterContext(tempfile.TemporaryDirectory()), "site")
+        generate(self.root, posts=4, pages=2)
+        self.build()
+        self.docs = os.path.join(self.root, "docs")
+        self.index = os.path.join(self.docs, "index.html")
+
+    def build(self, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(copy_static_to_docs(quiet=True, workspace_root=self.root, **kwargs))
+
+    def test_landing_only_leaves_other_outputs_untouched(self):
+        with open(os.path.join(self.root, "content", "listening.json"), "w", encoding="utf-8") as handle:
+            handle.write('{"tracks": [{"artist": "Somebody", "title": "New Song"}]}')
+        # A stray file a full build would delete.
+        stray = os.path.join(self.docs, "stray.html")
+        with open(stray, "w", encoding="utf-8") as handle:
+            handle.write("stray")
+        before = _mtimes(self.docs)
+        self.build(targets={"landing"})
+        after = _mtimes(self.docs)
+        self.assertEqual({p for p in before if before[p] != after.get(p)}, {self.index})
+        with open(self.index, encoding="utf-8") as handle:
+            self.assertIn("New Song", handle.read())
+
+    def test_landing_only_never_writes_under_content(self):
+        page = os.path.join(self.root, "content", "page000.md")
+        with open(page, encoding="utf-8") as handle:
+            undated = "".join(line for line in handle if "page-date" not in line)
+        with open(page, "w", encoding="utf-8") as handle:
+            handle.write(undated)
+        content = os.path.join(self.root, "content")
+        before = _mtimes(content)
+        self.build(targets={"landing"})
+        self.assertEqual(_mtimes(content), before)
+        with open(page, encoding="utf-8") as handle:
+            self.assertEqual(handle.read(), undated)
+
+    def test_only_without_incremental_rebuilds_current_targets(self):
+        page = os.path.join(self.docs, "page000.html")
+        with open(page, encoding="utf-8") as handle:
+            rendered = handle.read()
+        # The manifest still calls the page current: same inputs, output exists.
+        with open(page, "w", encoding="utf-8") as handle:
+            handle.write("hand-edited")
+        self.build(targets={"page:page000.md"}, incremental=True)
+        with open(page, encoding="utf-8") as handle:
+            self.assertEqual(handle.read(), "hand-edited")
+        self.build(targets={"page:page000.md"})
+        with open(page, encoding="utf-8") as handle:
+            self.assertEqual(handle.read(), rendered)
+
+
+if __name__ == "__main__":
+    unittest.main()
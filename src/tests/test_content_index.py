@@ -0,0 +1,94 @@
+import contextlib
+import io
+import os
+import unittest
+from unittest import mock
+
+from Gen_Content import content_index
+from Gen_Content.content_index import ContentIndex, scan_markdown
+from support import TempDirTestCase, read_file, write_file
+
+
+class IndexCase(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+
+    def scan(self, name, text):
+        path = os.path.join(self.root, name)
+        write_file(path, text)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return scan_markdown(path)
+
+    def scan_unstamped(self, name, text):
+        path = os.path.join(self.root, name)
+        write_file(path, text)
+        return scan_markdown(path, stamp=False)
+
+
+class TestScan(IndexCase):
+    def test_title_date_and_first_paragraph(self):
+        entry = self.scan("a.md", "<!-- page-date: 2026-01-02 -->\n# Hello\n\n- list\n\nFirst   words here.\n")
+        self.assertEqual(entry.title, "Hello")
+        self.assertEqual(entry.date, "2026-01-02")
+        self.assertEqual(entry.description, "First words here.")
+        self.assertEqual(entry.excerpt, "First words here.")
+        self.assertNotIn("page-date", entry.markdown)
+
+    def test_description_and_excerpt_truncate_differently(self):
+        entry = self.scan("a.md", "<!-- page-date: 2026-01-02 -->\n# T\n\n" + "x" * 300 + "\n")
+        self.assertEqual(entry.description, "x" * 180 + "…")
+        self.assertEqual(entry.excerpt, "x" * 200 + "…")
+
+    def test_defaults_without_title_or_prose(self):
+        entry = self.scan("a.md", "<!-- page-date: 2026-01-02 -->\n## Only a subheading\n")
+        self.assertIsNone(entry.title)
+        self.assertEqual(entry.description, "Professional resume and portfolio")
+        self.assertEqual(entry.excerpt, "Read more...")
+
+    def test_landing_title_override(self):
+        entry = self.scan("a.md", "<!-- landing-title: Resume -->\n<!-- page-date: 2026-01-02 -->\n# Long Title\n")
+        self.assertEqual(entry.landing_title, "Resume")
+        self.assertEqual(entry.title, "Long Title")
+
+    def test_missing_date_comes_from_filename_and_is_written_back(self):
+        entry = self.scan("2025-11-11-post.md", "# Post\n\nBody\n")
+        self.assertEqual(entry.date, "2025-11-11")
+        self.assertIn("<!-- page-date: 2025-11-11 -->", read_file(os.path.join(self.root, "2025-11-11-post.md")))
+
+
+    def test_without_stamp_nothing_is_written(self):
+        entry = self.scan_unstamped("2025-11-11-post.md", "# Post\n\nBody\n")
+        self.assertEqual(entry.date, "2025-11-11")
+        self.assertFalse(entry.dated)
+        self.assertEqual(read_file(os.path.join(self.root, "2025-11-11-post.md")), "# Post\n\nBody\n")
+
+
+class TestIndex(IndexCase):
+    def test_each_file_is_read_once(self):
+        path = os.path.join(self.root, "a.md")
+        write_file(path, "<!-- page-date: 2026-01-02 -->\n# A\n")
+        index = ContentIndex()
+        with mock.patch.object(content_index, "scan_markdown", wraps=scan_markdown) as scan:
+            first = index.get(path)
+            second = index.get(os.path.join(self.root, ".", "a.md"))
+        self.assertIs(first, second)
+        self.assertEqual(scan.call_count, 1)
+        self.assertEqual(len(index), 1)
+
+    def test_peek_never_writes_and_get_stamps_later(self):
+        path = os.path.join(self.root, "2025-11-11-post.md")
+        write_file(path, "# Post\n")
+        index = ContentIndex()
+        self.assertFalse(index.peek(path).dated)
+        self.assertEqual(read_file(path), "# Post\n")
+        with contextlib.redirect_stdout(io.StringIO()), \
+                mock.patch.object(content_index, "scan_markdown", wraps=scan_markdown) as scan:
+            entry = index.get(path)
+        self.assertTrue(entry.dated)
+        self.assertEqual(scan.call_count, 0)
+        self.assertIn("<!-- page-date: 2025-11-11 -->", read_file(path))
+        self.assertIs(index.peek(path), entry)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,11 @@
 import unittest
 
-from src.extract_markdown import extract_markdown_images, extract_markdown_links
+from src.extract_markdown import (
+    extract_markdown_image_spans,
+    extract_markdown_images,
+    extract_markdown_link_spans,
+    extract_markdown_links,
+)
 
 
 class TestExtractMarkdown(unittest.TestCase):
@@ -14,6 +19,19 @@ class TestExtractMarkdown(unittest.TestCase):
             matches = extract_markdown_images(text)
             self.assertListEqual([("image", "https://i.imgur.com/image.png")], matches)
 
+        def test_link_spans_locate_repeated_links(self):
+            text = "[a](u) and [a](u) but not ![a](u)"
+            spans = list(extract_markdown_link_spans(text))
+            self.assertListEqual([(0, 6, "a", "u"), (11, 17, "a", "u")], spans)
+            for start, end, _, _ in spans:
+                self.assertEqual("[a](u)", text[start:end])
+
+        def test_image_spans_match_extract_markdown_images(self):
+            text = "![x](1.png) text ![](2.png) ![y](3.png)"
+            spans = list(extract_markdown_image_spans(text))
+            self.assertListEqual(extract_markdown_images(text), [(alt, url) for _, _, alt, url in spans])
+            self.assertEqual("![](2.png)", text[spans[1][0]:spans[1][1]])
+
 
 
 if __name__ == "__main__":
@@ -91,8 +91,19 @@ class TestHTMLNode(unittest.TestCase):
         text_node = TextNode("Link Text", TextType.LINKS)
         with self.assertRaises(ValueError):
             text_node_to_html_node(text_node)
-   
-    
+
+    def test_iter_html_pieces_join_to_to_html(self):
+        node = ParentNode("div", [
+            ParentNode("p", [LeafNode(None, "Hello "), LeafNode("b", "World")]),
+            LeafNode("img", "", {"src": "./a.png", "alt": "a"}),
+        ], props={"class": "page"})
+        pieces = list(node.iter_html())
+        self.assertEqual(pieces[0], '<div class="page">')
+        self.assertEqual(pieces[1], "<p>Hello <b>World</b></p>")
+        self.assertEqual("".join(pieces), node.to_html())
+        self.assertEqual(list(LeafNode("b", "x").iter_html()), ["<b>x</b>"])
+
+
 if __name__ == "__main__":
     unittest.main()
     
@@ -0,0 +1,34 @@
+import unittest
+
+import import_budget
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       300 |        300 |   re._parser
+import time:       500 |        800 | re
+import time:       100 |        100 |   Gen_Content.build_log
+import time:       200 |        300 | Gen_Content
+"""
+
+
+class TestParse(unittest.TestCase):
+    def test_totals_only_top_level_imports(self):
+        modules = import_budget.parse_importtime(SAMPLE)
+        self.assertEqual(modules[None], 1100)
+        self.assertEqual(modules["re._parser"], 300)
+
+    def test_submodules_of_forbidden_packages_count(self):
+        modules = {None: 0, "multiprocessing.context": 1}
+        self.assertIn("multiprocessing", import_budget.violations("help", modules))
+
+
+class TestColdStart(unittest.TestCase):
+    def test_help_loads_no_build_machinery(self):
+        self.assertEqual(import_budget.violations("help", import_budget.measure("help")), [])
+
+    def test_landing_only_build_skips_markdown_pipeline_and_pool(self):
+        self.assertEqual(import_budget.violations("landing", import_budget.measure("landing")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import block_to_html
+from Gen_Content.build import copy_static_to_docs
+from Gen_Content.parallel_render import PageJob, render_pages
+from inline_cache import DEFAULT_SIZE, CacheStats, InlineCache
+from synthetic_site import generate
+
+
+class TestInlineCache(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+    def render(self, text):
+        self.calls.append(text)
+        return [text.upper()]
+
+    def test_hit_returns_the_stored_tuple(self):
+        cache = InlineCache(4)
+        first = cache.get("a", self.render)
+        self.assertEqual(first, ("A",))
+        self.assertIs(cache.get("a", self.render), first)
+        self.assertEqual(self.calls, ["a"])
+        self.assertEqual(cache.stats(), CacheStats(hits=1, misses=1, evictions=0))
+
+    def test_least_recently_used_is_evicted(self):
+        cache = InlineCache(2)
+        cache.get("a", self.render)
+        cache.get("b", self.render)
+        cache.get("a", self.render)  # b is now the oldest
+        cache.get("c", self.render)
+        self.assertEqual(cache.stats().evictions, 1)
+        cache.get("a", self.render)
+        cache.get("b", self.render)
+        self.assertEqual(self.calls, ["a", "b", "c", "b"])
+
+    def test_zero_size_disables(self):
+        cache = InlineCache(0)
+        cache.get("a", self.render)
+        cache.get("a", self.render)
+        self.assertEqual(self.calls, ["a", "a"])
+        self.assertEqual((len(cache), cache.stats()), (0, CacheStats()))
+
+    def test_resize_evicts_oldest(self):
+        cache = InlineCache(3)
+        for text in "abc":
+            cache.get(text, self.render)
+        cache.resize(1)
+        self.assertEqual((len(cache), cache.stats().evictions), (1, 2))
+        cache.get("c", self.render)
+        self.assertEqual(self.calls, ["a", "b", "c"])
+
+    def test_errors_are_not_cached(self):
+        cache = InlineCache(2)
+
+        def fail(text):
+            raise ValueError(text)
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                cache.get("x", fail)
+        self.assertEqual(len(cache), 0)
+
+
+class TestCacheStats(unittest.TestCase):
+    def test_total_since_and_hit_rate(self):
+        total = CacheStats.total([CacheStats(1, 3, 0), CacheStats(2, 2, 1)])
+        self.assertEqual(total, CacheStats(3, 5, 1))
+        self.assertEqual(total.since(CacheStats(1, 1, 1)), CacheStats(2, 4, 0))
+        self.assertEqual(CacheStats(1, 3).hit_rate, 0.25)
+        self.assertEqual(CacheStats().hit_rate, 0.0)
+        self.assertEqual(CacheStats.total([]), CacheStats())
+        self.assertIn("25.0% hit rate", CacheStats(1, 3).summary())
+
+
+class TestTextToChildren(unittest.TestCase):
+    def setUp(self):
+        block_to_html.inline_cache.resize(DEFAULT_SIZE)
+        block_to_html.inline_cache.clear()
+
+    def test_repeats_hit_the_cache_but_get_new_nodes(self):
+        first = block_to_html.text_to_children("a **b** c")
+        second = block_to_html.text_to_children("a **b** c")
+        self.assertEqual([n.to_html() for n in first], ["a ", "<b>b</b>", " c"])
+        self.assertEqual([n.to_html() for n in second], ["a ", "<b>b</b>", " c"])
+        self.assertFalse(any(a is b for a, b in zip(first, second)))
+        self.assertEqual(block_to_html.inline_cache.stats().hits, 1)
+
+    def test_changing_a_returned_tree_does_not_reach_the_cache(self):
+        tree = block_to_html.markdown_to_html_node("- same item\n- other")
+        tree.children[0].children[0].children[0].value = "MUTATED"
+        html = block_to_html.markdown_to_html_node("Intro\n\n- same item").to_html()
+        self.assertEqual(html, "<div><p>Intro</p><ul><li>same item</li></ul></div>")
+        self.assertEqual(block_to_html.inline_cache.stats().hits, 1)
+
+
+class TestBuildReport(unittest.TestCase):
+    def setUp(self):
+        self.root = self.enterContext(tempfile.TemporaryDirectory())
+
+    def tearDown(self):
+        block_to_html.inline_cache.resize(DEFAULT_SIZE)
+
+    def test_page_results_carry_their_lookups(self):
+        template = os.path.join(self.root, "template.html")
+        with open(template, "w", encoding="utf-8") as handle:
+            handle.write("{{ Title }}{{ Content }}")
+        src = os.path.join(self.root, "page.md")
+        with open(src, "w", encoding="utf-8") as handle:
+            handle.write("<!-- page-date: 2026-01-01 -->\n# Title\n\n- same\n- same\n- other\n")
+        job = PageJob("page:page.md", "page.md", src, template, os.path.join(self.root, "page.html"))
+        with contextlib.redirect_stdout(io.StringIO()):
+            [result] = render_pages([job], inline_cache_size=16)
+        self.assertEqual(result.inline_cache.hits, 1)
+        with contextlib.redirect_stdout(io.StringIO()):
+            [result] = render_pages([job], inline_cache_size=0)
+        self.assertEqual(result.inline_cache, CacheStats())
+
+    def test_hit_rate_is_in_the_build_summary(self):
+        site = os.path.join(self.root, "site")
+        generate(site, posts=2, pages=1)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(copy_static_to_docs(quiet=True, workspace_root=site))
+        with open(os.path.join(site, "log.txt"), encoding="utf-8") as handle:
+            self.assertIn("% hit rate", handle.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+import inline_stress
+
+from block_to_html import markdown_to_html
+
+
+class TestCases(unittest.TestCase):
+    def test_cases_are_about_the_requested_size(self):
+        for name, build in inline_stress.CASES.items():
+            with self.subTest(name):
+                self.assertLessEqual(abs(len(build(1200)) - 1200), 4)
+
+    def test_every_case_parses_with_every_target(self):
+        for target in inline_stress.TARGETS:
+            func = inline_stress._target(target)
+            for name, build in inline_stress.CASES.items():
+                with self.subTest(target=target, case=name):
+                    func(build(2000))
+
+
+class TestFuzz(unittest.TestCase):
+    def test_random_markup_never_aborts_a_page(self):
+        self.assertEqual(inline_stress.fuzz(seed=1, count=100), [])
+
+    def test_empty_urls_render(self):
+        self.assertEqual(
+            markdown_to_html("[a]() ![b]()"), '<div><p><a href="">a</a> <img src="" alt="b"></img></p></div>'
+        )
+
+
+class TestMeasure(unittest.TestCase):
+    def test_reports_throughput_and_scaling(self):
+        row = inline_stress.measure("brackets", "text_to_textnodes", size=2000)
+        self.assertFalse(row["stalled"])
+        self.assertEqual(row["bytes"], 8000)
+        self.assertGreater(row["mb_per_s"], 0)
+        self.assertGreater(row["scaling"], 0)
+
+    def test_a_child_past_its_timeout_is_a_stall(self):
+        row = inline_stress.measure("stars", "text_to_textnodes", size=2000, timeout=0.001)
+        self.assertTrue(row["stalled"])
+        self.assertEqual(inline_stress.problems(row), ["text_to_textnodes/stars stalled"])
+
+    def test_slow_or_superlinear_rows_are_problems(self):
+        row = {"case": "c", "target": "t", "stalled": False, "mb_per_s": 0.1, "scaling": 4.0}
+        self.assertEqual(len(inline_stress.problems(row)), 2)
+        self.assertEqual(inline_stress.problems(row, min_mb_per_s=0.05, max_scaling=5), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
+import io
 import unittest
 
-from markdown_to_blocks import markdown_to_blocks
+from block_to_html import markdown_to_html_node
+from markdown_to_blocks import iter_blocks, markdown_to_blocks
 
 
 class TestMarkdownToBlocks(unittest.TestCase):
@@ -22,4 +24,36 @@ class TestMarkdownToBlocks(unittest.TestCase):
                         "This is another paragraph with _italic_ text and `code` here\nThis is the same paragraph on a new line",
                         "- This is a list\n- with items",
                     ],
-                )
\ No newline at end of file
+                )
+        def test_iter_blocks_reads_lines_from_a_file(self):
+            md = (
+                "# Title\n\nSome text\nmore text\n   \n"
+                "- a\n  - b\n\n"
+                "  ```python\nx = 1\n\n  y = 2   \n```\n"
+                "## Sub\r\ntext\r\n\n```\nunterminated\n\n\n"
+            )
+            self.assertEqual(list(iter_blocks(io.StringIO(md, newline=""))), markdown_to_blocks(md))
+            self.assertEqual(list(iter_blocks(io.StringIO(md))), markdown_to_blocks(md.replace("\r\n", "\n")))
+
+        def test_iter_blocks_is_lazy(self):
+            read = []
+
+            def lines():
+                for i in range(1000):
+                    read.append(i)
+                    yield f"paragraph {i}\n"
+                    yield "\n"
+
+            blocks = iter_blocks(lines())
+            self.assertEqual(next(blocks), "paragraph 0")
+            self.assertEqual(read, [0])
+
+        def test_markdown_to_html_node_accepts_lines(self):
+            md = "# T\n\nA **b** para\n\n- x\n- y\n\n```\ncode\n```\n"
+            self.assertEqual(
+                markdown_to_html_node(io.StringIO(md)).to_html(), markdown_to_html_node(md).to_html()
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
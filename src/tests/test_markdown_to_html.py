@@ -0,0 +1,81 @@
+import glob
+import os
+import random
+import sys
+import unittest
+
+from block_to_html import iter_markdown_html, markdown_to_html, markdown_to_html_node
+
+CONTENT = os.path.join(os.path.dirname(__file__), "..", "..", "content")
+# Line starts and inline markup the fuzzer strings together, so block kinds
+# and inline delimiters collide in every combination.
+LINE_STARTS = (
+    "", "", "- ", "1. ", "2.  ", "  ", "    - ", "\t", "# ", "### ", "####### ", "#", "> ", ">", "  > ",
+    "```", "```py", "-x", " ",
+)
+INLINE = ("a", "b c", "**", "__", "*", "_", "`", "x_y", "[l](u)", "![i](p)", "[e]()", "`c`", "**b**", " ")
+
+
+def _outcome(func, markdown):
+    try:
+        return func(markdown)
+    except ValueError as e:
+        return str(e)
+
+
+def _tree_html(markdown):
+    return markdown_to_html_node(markdown).to_html()
+
+
+def _fuzzed_document(rng):
+    lines = []
+    for _ in range(rng.randint(1, 8)):
+        text = "".join(rng.choice(INLINE) for _ in range(rng.randint(0, 4)))
+        lines.append(rng.choice(LINE_STARTS) + text)
+    return "\n".join(lines)
+
+
+class TestMatchesTreePath(unittest.TestCase):
+    def assertSame(self, markdown):
+        self.assertEqual(_outcome(markdown_to_html, markdown), _outcome(_tree_html, markdown), repr(markdown))
+
+    def test_every_page_of_the_site_content(self):
+        paths = glob.glob(os.path.join(CONTENT, "**", "*.md"), recursive=True)
+        self.assertTrue(paths)
+        for path in paths:
+            with open(path, encoding="utf-8") as handle:
+                markdown = handle.read()
+            with self.subTest(os.path.basename(path)):
+                self.assertSame(markdown)
+                self.assertEqual(list(iter_markdown_html(markdown)), list(markdown_to_html_node(markdown).iter_html()))
+
+    def test_fuzzed_documents(self):
+        rng = random.Random(0)
+        for _ in range(5000):
+            self.assertSame(_fuzzed_document(rng))
+
+    def test_block_cache_gives_the_same_html(self):
+        cache = {}
+
+        class DictCache:
+            get = cache.get
+
+            def put(self, block, html):
+                cache[block] = html
+
+        markdown = "# T\n\n- a\n  - b\n\n> \n\n>\n\n> q\n\ntext"
+        for _ in range(2):
+            self.assertEqual(markdown_to_html(markdown, cache=DictCache()), _tree_html(markdown))
+
+    def test_lines_from_a_file(self):
+        markdown = "# T\n\npara\n\n1. a\n2. b\n"
+        self.assertEqual(markdown_to_html(markdown.splitlines(keepends=True)), _tree_html(markdown))
+
+    def test_nesting_beyond_the_recursion_limit(self):
+        depth = sys.getrecursionlimit() * 2
+        markdown = "\n".join(f"{'  ' * level}- {level}" for level in range(depth))
+        self.assertEqual(markdown_to_html(markdown), _tree_html(markdown))
+
+
+if __name__ == "__main__":
+    unittest.main()
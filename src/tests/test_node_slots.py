@@ -0,0 +1,49 @@
+import unittest
+
+import memory_benchmark
+from htmlnode import NO_CHILDREN, NO_PROPS, HTMLNode, LeafNode, ParentNode
+from textnode import TextNode, TextType
+
+
+class TestCompactNodes(unittest.TestCase):
+    def test_no_instance_dict(self):
+        for node in (
+            TextNode("a", TextType.PLAIN_TEXT), HTMLNode("p"), LeafNode(None, "a"), ParentNode("p", []),
+        ):
+            with self.subTest(type(node).__name__):
+                self.assertFalse(hasattr(node, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    node.extra = 1
+
+    def test_empty_children_and_props_are_shared_and_immutable(self):
+        a, b = LeafNode("b", "x"), LeafNode(None, "y")
+        self.assertIs(a.children, NO_CHILDREN)
+        self.assertIs(a.props, b.props)
+        self.assertIs(ParentNode("div").children, NO_CHILDREN)
+        with self.assertRaises(TypeError):
+            NO_PROPS["class"] = "x"  # type: ignore[index]
+        self.assertEqual(ParentNode("div").to_html(), "<div></div>")
+        self.assertEqual(a.props_to_html(), "")
+
+    def test_repr_and_eq_unchanged(self):
+        self.assertEqual(
+            repr(ParentNode("div", [LeafNode("b", "x")])),
+            "HTMLNode(tag=div, value=None, children=[HTMLNode(tag=b, value=x, children=[], props={})], props={})",
+        )
+        self.assertEqual(repr(TextNode("a", TextType.LINKS, "u")), "TextNode(a, link, u)")
+        self.assertEqual(TextNode("a", TextType.PLAIN_TEXT), TextNode("a", TextType.PLAIN_TEXT))
+        self.assertNotEqual(TextNode("a", TextType.PLAIN_TEXT), TextNode("a", TextType.PLAIN_TEXT, "u"))
+
+
+class TestMemoryBenchmark(unittest.TestCase):
+    def test_reports_per_node_and_peak(self):
+        result = memory_benchmark.measure(repeat=1)
+        self.assertGreater(result["textnodes"], 0)
+        self.assertGreater(result["htmlnodes"], result["textnodes"])
+        for key in ("textnode_bytes", "htmlnode_bytes", "peak_bytes"):
+            self.assertGreater(result[key], 0)
+        self.assertIn("bytes/node", memory_benchmark.format_report(result))
+
+
+if __name__ == "__main__":
+    unittest.main()
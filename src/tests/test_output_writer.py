@@ -0,0 +1,180 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from Gen_Content import generate_page as generate_page_module
+from Gen_Content.generate_page import generate_page
+from Gen_Content.output_writer import (
+    OutputWriter, atomic_write_json, remove_unlisted, stream_if_changed, write_if_changed,
+)
+from support import TempDirTestCase, read_file
+
+
+class WriterCase(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.root, "docs", "page.html")
+
+
+class TestWriteIfChanged(WriterCase):
+    def test_creates_missing_file_and_directories(self):
+        self.assertTrue(write_if_changed(self.path, "<p>hi</p>"))
+        self.assertEqual(read_file(self.path), "<p>hi</p>")
+
+    def test_identical_content_is_not_rewritten(self):
+        write_if_changed(self.path, "<p>hi</p>")
+        os.utime(self.path, ns=(0, 1_000_000_000))
+        self.assertFalse(write_if_changed(self.path, "<p>hi</p>"))
+        self.assertEqual(os.stat(self.path).st_mtime_ns, 1_000_000_000)
+
+    def test_same_size_different_bytes_is_rewritten(self):
+        write_if_changed(self.path, "<p>hi</p>")
+        self.assertTrue(write_if_changed(self.path, "<p>ho</p>"))
+        self.assertEqual(read_file(self.path), "<p>ho</p>")
+
+    def test_unicode_is_compared_as_utf8(self):
+        write_if_changed(self.path, "Lööps →")
+        self.assertFalse(write_if_changed(self.path, "Lööps →"))
+
+    def test_leaves_no_temp_files(self):
+        write_if_changed(self.path, "a")
+        write_if_changed(self.path, "b")
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["page.html"])
+
+
+class TestStreamIfChanged(WriterCase):
+    @staticmethod
+    def pieces(*parts):
+        def render(write):
+            for part in parts:
+                write(part)
+        return render
+
+    def test_writes_pieces_in_order(self):
+        self.assertTrue(stream_if_changed(self.path, self.pieces("<p>", "Lööps →", "</p>\n")))
+        self.assertEqual(read_file(self.path), "<p>Lööps →</p>\n")
+
+    def test_identical_content_is_not_rewritten(self):
+        write_if_changed(self.path, "<p>hi</p>")
+        os.utime(self.path, ns=(0, 1_000_000_000))
+        self.assertFalse(stream_if_changed(self.path, self.pieces("<p>", "hi", "</p>")))
+        self.assertEqual(os.stat(self.path).st_mtime_ns, 1_000_000_000)
+
+    def test_difference_past_the_first_chunk_is_rewritten(self):
+        body = "x" * 200_000
+        write_if_changed(self.path, body + "a")
+        self.assertTrue(stream_if_changed(self.path, self.pieces(body, "b")))
+        self.assertEqual(read_file(self.path)[-1], "b")
+
+    def test_failed_render_leaves_old_file_and_no_temp_files(self):
+        write_if_changed(self.path, "old")
+
+        def render(write):
+            write("new")
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            stream_if_changed(self.path, render)
+        self.assertEqual(read_file(self.path), "old")
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["page.html"])
+
+
+class TestOutputWriter(WriterCase):
+    def test_counts_written_and_skipped(self):
+        writer = OutputWriter()
+        writer.write(self.path, "a")
+        writer.write(self.path, "a")
+        writer.tally(True)
+        self.assertEqual((writer.written, writer.skipped), (2, 1))
+        self.assertEqual(writer.summary(), "Output: wrote 2 file(s), skipped 1 unchanged file(s)")
+
+
+class TestAtomicWriteJson(WriterCase):
+    def test_writes_json_and_leaves_no_temp_files(self):
+        atomic_write_json(self.path, {"b": 1, "a": [2]}, sort_keys=True)
+        self.assertEqual(read_file(self.path), '{"a": [2], "b": 1}\n')
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["page.html"])
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o644)
+
+    def test_failed_dump_leaves_old_file_and_no_temp_files(self):
+        atomic_write_json(self.path, {"ok": True})
+        with self.assertRaises(TypeError):
+            atomic_write_json(self.path, {"bad": object()})
+        self.assertEqual(read_file(self.path), '{"ok": true}\n')
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["page.html"])
+
+    def test_concurrent_writers_use_their_own_temp_files(self):
+        names = []
+        real = tempfile.NamedTemporaryFile
+
+        def recording(*args, **kwargs):
+            handle = real(*args, **kwargs)
+            names.append(handle.name)
+            return handle
+
+        with mock.patch.object(tempfile, "NamedTemporaryFile", recording):
+            atomic_write_json(self.path, 1)
+            atomic_write_json(self.path, 2)
+        self.assertNotEqual(*names)
+        self.assertTrue(all(os.path.dirname(n) == os.path.dirname(self.path) for n in names))
+
+
+class TestRemoveUnlisted(WriterCase):
+    def test_removes_unlisted_files_and_empty_directories(self):
+        docs = os.path.join(self.root, "docs")
+        for rel in ("index.html", "old.html", "dev_diary/a.html", "gone/b.html"):
+            write_if_changed(os.path.join(docs, *rel.split("/")), "x")
+        removed = remove_unlisted(docs, {"index.html", "dev_diary/a.html"})
+        self.assertEqual(removed, ["gone/b.html", "old.html"])
+        self.assertFalse(os.path.exists(os.path.join(docs, "gone")))
+        self.assertTrue(os.path.exists(os.path.join(docs, "dev_diary", "a.html")))
+
+
+class TestGeneratePage(WriterCase):
+    def setUp(self):
+        super().setUp()
+        self.src = os.path.join(self.root, "page.md")
+        write_if_changed(self.src, "<!-- page-date: 2026-01-01 -->\n# Title\n\nOne.\n\nTwo.\n")
+        self.template = os.path.join(self.root, "template.html")
+        write_if_changed(self.template, "{{ Title }}|{{ Content }}|{{ Content }}")
+
+    def test_body_is_written_as_it_is_rendered(self):
+        events = []
+
+        class Recorder(OutputWriter):
+            def stream(self, path, render):
+                render(lambda text: events.append(("write", text)))
+                return True
+
+        def blocks(markdown, cache=None):
+            for html in ("<div>", "<p>One.</p>", "</div>"):
+                events.append(("render", html))
+                yield html
+
+        with mock.patch.object(generate_page_module, "iter_markdown_html", blocks), \
+                contextlib.redirect_stdout(io.StringIO()):
+            generate_page(self.src, self.template, self.path, writer=Recorder())
+        self.assertEqual(events[1:5], [
+            ("render", "<div>"), ("write", "<div>"), ("render", "<p>One.</p>"), ("write", "<p>One.</p>"),
+        ])
+        self.assertEqual(events.count(("render", "<div>")), 2)  # once per {{ Content }}
+
+    def test_parse_error_part_way_leaves_old_page(self):
+        write_if_changed(self.path, "old")
+
+        def blocks(markdown, cache=None):
+            yield "<div>"
+            raise ValueError("bad block")
+
+        with mock.patch.object(generate_page_module, "iter_markdown_html", blocks), \
+                contextlib.redirect_stdout(io.StringIO()), self.assertRaises(ValueError):
+            generate_page(self.src, self.template, self.path)
+        self.assertEqual(read_file(self.path), "old")
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["page.html"])
+
+
+if __name__ == "__main__":
+    unittest.main()
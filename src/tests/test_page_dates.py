@@ -0,0 +1,68 @@
+import contextlib
+import io
+import os
+import unittest
+
+from Gen_Content.content_index import ContentIndex
+from Gen_Content.page_dates import PageDates
+from support import TempDirTestCase, write_file
+
+
+class DatesCase(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.sidecar = os.path.join(self.root, "page_dates.json")
+        self.post = os.path.join(self.root, "content", "dev_diary", "2025-11-11-post.md")
+        write_file(self.post, "# Post\n\nBody\n")
+
+    def scan(self, dates):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return ContentIndex(dates=dates).get(self.post)
+
+
+class TestPageDates(DatesCase):
+    def test_round_trip(self):
+        dates = PageDates.load(self.sidecar, self.root)
+        dates.assign(self.post, "2025-11-11")
+        dates.save()
+        self.assertEqual(PageDates.load(self.sidecar, self.root).lookup(self.post), "2025-11-11")
+
+    def test_keys_are_root_relative(self):
+        dates = PageDates.load(self.sidecar, self.root)
+        dates.assign(self.post, "2025-11-11")
+        self.assertEqual(list(dates.dates), ["content/dev_diary/2025-11-11-post.md"])
+
+    def test_corrupt_sidecar_starts_empty(self):
+        write_file(self.sidecar, "{not json")
+        self.assertIsNone(PageDates.load(self.sidecar, self.root).lookup(self.post))
+
+    def test_save_without_changes_writes_nothing(self):
+        PageDates.load(self.sidecar, self.root).save()
+        self.assertFalse(os.path.exists(self.sidecar))
+
+
+class TestReadOnlyScan(DatesCase):
+    def test_source_is_never_rewritten(self):
+        before = os.stat(self.post).st_mtime_ns
+        dates = PageDates.load(self.sidecar, self.root)
+        entry = self.scan(dates)
+        self.assertEqual(entry.date, "2025-11-11")
+        with open(self.post, encoding="utf-8") as handle:
+            self.assertEqual(handle.read(), "# Post\n\nBody\n")
+        self.assertEqual(os.stat(self.post).st_mtime_ns, before)
+        self.assertEqual(dates.lookup(self.post), "2025-11-11")
+
+    def test_recorded_date_wins_over_filename(self):
+        dates = PageDates.load(self.sidecar, self.root)
+        dates.assign(self.post, "2024-01-01")
+        self.assertEqual(self.scan(dates).date, "2024-01-01")
+
+    def test_date_comment_wins_over_sidecar(self):
+        write_file(self.post, "<!-- page-date: 2023-05-05 -->\n# Post\n")
+        dates = PageDates.load(self.sidecar, self.root)
+        dates.assign(self.post, "2024-01-01")
+        self.assertEqual(self.scan(dates).date, "2023-05-05")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from Gen_Content.parallel_render import (
+    MIN_PAGES_PER_WORKER,
+    PageJob,
+    effective_workers,
+    render_pages,
+)
+
+TEMPLATE = "<title>{{ Title }}</title><main>{{ Content }}</main>"
+
+
+class TestEffectiveWorkers(unittest.TestCase):
+    def test_small_corpus_stays_serial(self):
+        self.assertEqual(effective_workers(8, MIN_PAGES_PER_WORKER - 1), 1)
+
+    def test_workers_scale_with_corpus(self):
+        self.assertEqual(effective_workers(8, MIN_PAGES_PER_WORKER * 3), 3)
+
+    def test_never_exceeds_request(self):
+        self.assertEqual(effective_workers(2, MIN_PAGES_PER_WORKER * 100), 2)
+
+    def test_zero_means_cpu_count(self):
+        expected = max(1, min(os.cpu_count() or 1, 100))
+        self.assertEqual(effective_workers(0, MIN_PAGES_PER_WORKER * 100), expected)
+
+    def test_empty_corpus_is_serial(self):
+        self.assertEqual(effective_workers(4, 0), 1)
+
+
+class TestRenderPages(unittest.TestCase):
+    def setUp(self):
+        self.root = self.enterContext(tempfile.TemporaryDirectory())
+        self.template = os.path.join(self.root, "template.html")
+        with open(self.template, "w", encoding="utf-8") as handle:
+            handle.write(TEMPLATE)
+        os.makedirs(os.path.join(self.root, "content"))
+        os.makedirs(os.path.join(self.root, "docs"))
+
+    def _jobs(self, count, template=None):
+        jobs = []
+        for i in range(count):
+            name = f"page{i:03d}.md"
+            src = os.path.join(self.root, "content", name)
+            with open(src, "w", encoding="utf-8") as handle:
+                handle.write(f"<!-- page-date: 2026-01-01 -->\n# Page {i}\n\nBody {i}\n")
+            out = os.path.join(self.root, "docs", f"page{i:03d}.html")
+            jobs.append(PageJob(f"page:{name}", name, src, template or self.template, out))
+        return jobs
+
+    def _run(self, jobs, workers):
+        started = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = list(render_pages(jobs, workers=workers, on_start=started.append))
+        return results, started
+
+    def test_results_come_back_in_job_order(self):
+        jobs = self._jobs(5)
+        results, started = self._run(jobs, workers=1)
+        self.assertEqual([r.job for r in results], jobs)
+        self.assertEqual(started, jobs)
+
+    def test_failed_page_is_reported_not_raised(self):
+        good = self._jobs(2)
+        bad = good[1]._replace(template_path=os.path.join(self.root, "missing.html"))
+        results, _ = self._run([good[0], bad], workers=1)
+        self.assertIsNone(results[0].error)
+        self.assertIsNotNone(results[1].error)
+        assert results[1].traceback is not None
+        self.assertIn("Traceback", results[1].traceback)
+
+    def test_pool_output_matches_serial(self):
+        jobs = self._jobs(MIN_PAGES_PER_WORKER * 2)
+        self._run(jobs, workers=1)
+        serial = {}
+        for job in jobs:
+            with open(job.out_html, encoding="utf-8") as handle:
+                serial[job.out_html] = handle.read()
+            os.remove(job.out_html)
+
+        results, started = self._run(jobs, workers=2)
+        self.assertEqual(started, jobs)
+        self.assertTrue(all(r.error is None for r in results))
+        for job in jobs:
+            with open(job.out_html, encoding="utf-8") as handle:
+                self.assertEqual(handle.read(), serial[job.out_html])
+
+    def test_pool_captures_each_pages_output_with_its_result(self):
+        jobs = self._jobs(MIN_PAGES_PER_WORKER * 2)
+        results, _ = self._run(jobs, workers=2)
+        for result in results:
+            self.assertIn(result.job.src_md, result.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
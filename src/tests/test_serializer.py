@@ -0,0 +1,59 @@
+import random
+import sys
+import unittest
+
+from block_to_html import markdown_to_html_node
+from htmlnode import HTMLNode, LeafNode, ParentNode
+
+
+def recursive_html(node):
+    """The serializer as it was: recursive, with props_to_html()."""
+    attrs = "" if not node.props else node.props_to_html().rstrip()
+    if isinstance(node, LeafNode):
+        return node.value if node.tag is None else f"<{node.tag}{attrs}>{node.value}</{node.tag}>"
+    return f"<{node.tag}{attrs}>{''.join(recursive_html(c) for c in node.children)}</{node.tag}>"
+
+
+def random_tree(rng, depth=0):
+    props = rng.choice([None, {}, {"class": "x"}, {"href": "u", "title": "t "}])
+    if depth > 5 or rng.random() < 0.4:
+        return LeafNode(rng.choice([None, "b", "a"]), rng.choice(["", "w", "two words"]), props)
+    return ParentNode(rng.choice(["div", "ul", "li"]), [random_tree(rng, depth + 1) for _ in range(rng.randint(0, 4))], props)
+
+
+class TestSerializer(unittest.TestCase):
+    def test_matches_recursive_serializer(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            tree = random_tree(rng)
+            self.assertEqual(tree.to_html(), recursive_html(tree))
+
+    def test_props_on_parent_and_leaf(self):
+        node = ParentNode("p", [LeafNode("a", "x", {"href": "u", "title": "t"})], {"class": "c"})
+        self.assertEqual(node.to_html(), '<p class="c"><a href="u" title="t">x</a></p>')
+
+    def test_nesting_beyond_the_recursion_limit(self):
+        depth = sys.getrecursionlimit() * 3
+        node = LeafNode(None, "x")
+        for _ in range(depth):
+            node = ParentNode("i", [node])
+        self.assertEqual(node.to_html(), "<i>" * depth + "x" + "</i>" * depth)
+
+    def test_deeply_nested_markdown_list(self):
+        depth = sys.getrecursionlimit() * 2
+        markdown = "\n".join(f"{'  ' * level}- {level}" for level in range(depth))
+        html = markdown_to_html_node(markdown).to_html()
+        self.assertTrue(html.startswith("<div><ul><li>0<ul><li>1<ul>"))
+        self.assertEqual(html.count("<li>"), depth)
+
+    def test_errors_are_unchanged(self):
+        with self.assertRaises(NotImplementedError):
+            ParentNode("p", [HTMLNode("b")]).to_html()
+        leaf = LeafNode("b", "x")
+        leaf.value = None
+        with self.assertRaisesRegex(ValueError, "must have a value"):
+            ParentNode("p", [leaf]).to_html()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import unittest
+
+from Gen_Content.static_sync import MIN_FILES_FOR_POOL, StaticSync, is_unchanged
+from support import TempDirTestCase, read_bytes, write_file
+
+
+class SyncCase(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.src = os.path.join(self.root, "static")
+        self.dest = os.path.join(self.root, "docs")
+        write_file(os.path.join(self.src, "a.css"), b"body{}")
+        write_file(os.path.join(self.src, "fonts", "f.woff2"), b"\x00font" * 1000)
+
+
+class TestSyncTree(SyncCase):
+    def test_first_sync_copies_everything(self):
+        sync = StaticSync()
+        results = sync.sync_tree(self.src, self.dest)
+        self.assertEqual(
+            [(r.rel, r.action) for r in results],
+            [("", "mkdir"), ("fonts", "mkdir"), ("a.css", "copied"), ("fonts/f.woff2", "copied")],
+        )
+        self.assertEqual(read_bytes(os.path.join(self.dest, "fonts", "f.woff2")), b"\x00font" * 1000)
+        self.assertEqual(sync.copied_files, 2)
+        self.assertEqual(sync.copied_bytes, 6 + 5000)
+
+    def test_second_sync_skips_everything(self):
+        StaticSync().sync_tree(self.src, self.dest)
+        sync = StaticSync()
+        results = sync.sync_tree(self.src, self.dest)
+        self.assertEqual({r.action for r in results}, {"skipped"})
+        self.assertEqual((sync.copied_files, sync.skipped_files), (0, 2))
+        self.assertEqual(sync.skipped_bytes, 6 + 5000)
+
+    def test_changed_file_is_recopied(self):
+        StaticSync().sync_tree(self.src, self.dest)
+        write_file(os.path.join(self.src, "a.css"), b"body{color:red}")
+        results = {r.rel: r.action for r in StaticSync().sync_tree(self.src, self.dest)}
+        self.assertEqual(results["a.css"], "copied")
+        self.assertEqual(results["fonts/f.woff2"], "skipped")
+        self.assertEqual(read_bytes(os.path.join(self.dest, "a.css")), b"body{color:red}")
+
+    def test_many_files_use_the_pool_and_still_match(self):
+        for i in range(MIN_FILES_FOR_POOL * 2):
+            write_file(os.path.join(self.src, "many", f"{i:02d}.txt"), str(i).encode() * 100)
+        results = StaticSync(workers=4).sync_tree(self.src, self.dest)
+        expected = ["a.css", "fonts/f.woff2"] + [f"many/{i:02d}.txt" for i in range(MIN_FILES_FOR_POOL * 2)]
+        self.assertEqual([r.rel for r in results if r.action == "copied"], expected)
+        for i in range(MIN_FILES_FOR_POOL * 2):
+            self.assertEqual(read_bytes(os.path.join(self.dest, "many", f"{i:02d}.txt")), str(i).encode() * 100)
+
+
+    def test_single_files_count_toward_the_summary(self):
+        sync = StaticSync()
+        os.makedirs(self.dest)
+        sync.sync_file(os.path.join(self.src, "a.css"), os.path.join(self.dest, "a.css"))
+        sync.sync_file(os.path.join(self.src, "a.css"), os.path.join(self.dest, "a.css"))
+        self.assertEqual((sync.copied_files, sync.copied_bytes, sync.skipped_files), (1, 6, 1))
+        self.assertIn("copied 1 file(s) (6 bytes)", sync.summary())
+
+
+class TestUnchangedCheck(SyncCase):
+    def test_same_bytes_new_mtime_is_unchanged_and_restamped(self):
+        StaticSync().sync_tree(self.src, self.dest)
+        src = os.path.join(self.src, "a.css")
+        dest = os.path.join(self.dest, "a.css")
+        os.utime(src, ns=(0, 1_000_000_000))
+        self.assertTrue(is_unchanged(src, dest))
+        self.assertEqual(os.stat(dest).st_mtime_ns, 1_000_000_000)
+
+    def test_same_size_different_bytes_is_changed(self):
+        StaticSync().sync_tree(self.src, self.dest)
+        src = os.path.join(self.src, "a.css")
+        write_file(src, b"BODY{}")
+        self.assertFalse(is_unchanged(src, os.path.join(self.dest, "a.css")))
+
+    def test_missing_destination_is_changed(self):
+        self.assertFalse(is_unchanged(os.path.join(self.src, "a.css"), os.path.join(self.dest, "a.css")))
+
+
+class TestHardlinks(SyncCase):
+    def test_hardlink_mode_links_files(self):
+        results = StaticSync(hardlink=True).sync_tree(self.src, self.dest)
+        methods = {r.method for r in results if r.action == "copied"}
+        # Some filesystems refuse hardlinks; the sync must still succeed.
+        self.assertTrue(methods <= {"hardlink", "reflink", "copy_file_range", "sendfile", "copy"})
+        self.assertEqual(read_bytes(os.path.join(self.dest, "a.css")), b"body{}")
+
+    def test_source_replaced_by_an_editor_is_picked_up(self):
+        StaticSync(hardlink=True).sync_tree(self.src, self.dest)
+        src = os.path.join(self.src, "a.css")
+        dest = os.path.join(self.dest, "a.css")
+        # Editors save by writing a new inode, which leaves docs/ holding
+        # the old one; the next sync must notice and replace it.
+        os.remove(src)
+        write_file(src, b"p{}")
+        results = {r.rel: r.action for r in StaticSync().sync_tree(self.src, self.dest)}
+        self.assertEqual(results["a.css"], "copied")
+        self.assertEqual(read_bytes(dest), b"p{}")
+
+
+if __name__ == "__main__":
+    unittest.main()
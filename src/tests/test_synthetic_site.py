@@ -0,0 +1,54 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from Gen_Content.build import copy_static_to_docs
+from synthetic_site import generate
+
+
+def _tree(root):
+    out = {}
+    for dirpath, _, files in os.walk(root):
+        for name in files:
+            path = os.path.join(dirpath, name)
+            with open(path, encoding="utf-8") as handle:
+                out[os.path.relpath(path, root)] = handle.read()
+    return out
+
+
+class TestGenerate(unittest.TestCase):
+    def setUp(self):
+        self.tmp = self.enterContext(tempfile.TemporaryDirectory())
+        self.root = os.path.join(self.tmp, "site")
+
+    def test_writes_dated_posts_and_pages(self):
+        self.assertEqual(generate(self.root, posts=7, pages=2), 9)
+        posts = sorted(os.listdir(os.path.join(self.root, "content", "dev_diary")))
+        self.assertEqual(len(posts), 7)
+        self.assertTrue(posts[0].startswith("2025-11-11-"))
+        for name in posts:
+            with open(os.path.join(self.root, "content", "dev_diary", name), encoding="utf-8") as handle:
+                self.assertTrue(handle.read().startswith(f"<!-- page-date: {name[:10]} -->\n# "))
+        self.assertTrue(os.path.isdir(os.path.join(self.root, "static")))
+
+    def test_same_seed_same_site(self):
+        other = os.path.join(self.tmp, "other")
+        generate(self.root, posts=5, seed=3)
+        generate(other, posts=5, seed=3)
+        self.assertEqual(_tree(os.path.join(self.root, "content")), _tree(os.path.join(other, "content")))
+
+    def test_synthetic_site_builds_cleanly(self):
+        generate(self.root, posts=12, pages=2)
+        with contextlib.redirect_stdout(io.StringIO()):
+            ok = copy_static_to_docs(quiet=True, workspace_root=self.root)
+        self.assertTrue(ok)
+        docs = os.path.join(self.root, "docs")
+        self.assertEqual(len(os.listdir(os.path.join(docs, "dev_diary"))), 12)
+        # 12 posts at 5 per page
+        self.assertTrue(os.path.exists(os.path.join(docs, "dev_diary-page-3.html")))
+
+
+if __name__ == "__main__":
+    unittest.main()
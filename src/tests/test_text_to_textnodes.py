@@ -0,0 +1,120 @@
+import glob
+import os
+import random
+import unittest
+
+from benchmark import text_to_textnodes_multipass
+from text_to_textnodes import text_to_textnodes
+from textnode import TextNode, TextType
+
+CONTENT = os.path.join(os.path.dirname(__file__), "..", "..", "content")
+# Markup fragments the fuzzer strings together; short, so that delimiters
+# collide with each other in every combination.
+FRAGMENTS = (
+    "*", "_", "`", "[", "]", "(", ")", "!", "**", "__", " ", "a", "b", "x_y",
+    "[l](u_1)", "![i](p)", ".", "é", "1",
+)
+
+
+def _outcome(func, text):
+    try:
+        return func(text)
+    except ValueError as e:
+        return str(e)
+
+
+class TestMatchesMultipass(unittest.TestCase):
+    def assertSame(self, text):
+        # Where the passes reject an unclosed ` or an unmatched ** or __,
+        # the scan keeps it as literal text instead; everywhere else the
+        # two agree exactly.
+        expected = _outcome(text_to_textnodes_multipass, text)
+        got = text_to_textnodes(text)
+        if expected == "unbalanced delimiters: `":
+            outside_code = "".join(n.text for n in got if n.text_type is not TextType.CODE_TEXT)
+            self.assertIn("`", outside_code, repr(text))
+            return
+        for delimiter in ("**", "__"):
+            if expected == f"unbalanced delimiters: {delimiter}":
+                self.assertIn(TextNode(delimiter, TextType.PLAIN_TEXT), got, repr(text))
+                return
+        self.assertEqual(got, expected, repr(text))
+
+    def test_fuzzed_markup(self):
+        rng = random.Random(0)
+        for _ in range(20000):
+            self.assertSame("".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 24))))
+
+    def test_every_line_of_the_site_content(self):
+        paths = glob.glob(os.path.join(CONTENT, "**", "*.md"), recursive=True)
+        self.assertTrue(paths)
+        for path in paths:
+            with open(path, encoding="utf-8") as handle:
+                for line in handle:
+                    self.assertSame(line)
+
+
+class TestTextToTextNodes(unittest.TestCase):
+    def test_everything_at_once(self):
+        text = "**b** _i_ *j* __u__ `c_d` ![img](./a_b.png) [link](https://x.com/a_b)"
+        self.assertEqual(text_to_textnodes(text), [
+            TextNode("b", TextType.BOLD_TEXT),
+            TextNode(" ", TextType.PLAIN_TEXT),
+            TextNode("i", TextType.ITALIC_TEXT),
+            TextNode(" ", TextType.PLAIN_TEXT),
+            TextNode("j", TextType.ITALIC_TEXT),
+            TextNode(" ", TextType.PLAIN_TEXT),
+            TextNode("u", TextType.BOLD_TEXT),
+            TextNode(" ", TextType.PLAIN_TEXT),
+            TextNode("c_d", TextType.CODE_TEXT),
+            TextNode(" ", TextType.PLAIN_TEXT),
+            TextNode("img", TextType.IMAGES, "./a_b.png"),
+            TextNode(" ", TextType.PLAIN_TEXT),
+            TextNode("link", TextType.LINKS, "https://x.com/a_b"),
+        ])
+
+    def test_snake_case_is_left_alone(self):
+        text = "call my_func_name with some_arg"
+        self.assertEqual(text_to_textnodes(text), [TextNode(text, TextType.PLAIN_TEXT)])
+
+    def test_code_wins_over_links_and_bold(self):
+        self.assertEqual(text_to_textnodes("`[a](b) **c**`"), [TextNode("[a](b) **c**", TextType.CODE_TEXT)])
+
+    def test_empty_text(self):
+        self.assertEqual(text_to_textnodes(""), [])
+
+    def test_unclosed_code_span_is_literal(self):
+        plain = TextType.PLAIN_TEXT
+        cases = {
+            "`": [TextNode("`", plain)],
+            "a ``` b": [TextNode("a ", plain), TextNode("` b", plain)],
+            "`c` and `d": [TextNode("c", TextType.CODE_TEXT), TextNode(" and `d", plain)],
+            "**a `b**": [TextNode("a `b", TextType.BOLD_TEXT)],
+            "`[l](u) *i*": [TextNode("`", plain), TextNode("l", TextType.LINKS, "u"), TextNode(" ", plain),
+                            TextNode("i", TextType.ITALIC_TEXT)],
+        }
+        for text, expected in cases.items():
+            with self.subTest(text):
+                self.assertEqual(text_to_textnodes(text), expected)
+
+    def test_unmatched_bold_is_literal(self):
+        plain, bold = TextType.PLAIN_TEXT, TextType.BOLD_TEXT
+        cases = {
+            "__a": [TextNode("__", plain), TextNode("a", plain)],
+            "x **y": [TextNode("x ", plain), TextNode("**", plain), TextNode("y", plain)],
+            "**a __b__ c": [
+                TextNode("**", plain), TextNode("a ", plain), TextNode("b", bold), TextNode(" c", plain),
+            ],
+            "**[a](b)**": [TextNode("**", plain), TextNode("a", TextType.LINKS, "b"), TextNode("**", plain)],
+            "__a **b** _c_": [
+                TextNode("__", plain), TextNode("a ", plain), TextNode("b", bold),
+                TextNode(" ", plain), TextNode("c", TextType.ITALIC_TEXT),
+            ],
+        }
+        for text, expected in cases.items():
+            with self.subTest(text):
+                self.assertEqual(text_to_textnodes(text), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
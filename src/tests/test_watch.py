@@ -0,0 +1,65 @@
+import os
+import unittest
+
+from Gen_Content.build_manifest import BuildManifest
+from Gen_Content.watch import affected_targets, diff, snapshot
+from support import TempDirTestCase, write_file
+
+
+class WatchCase(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.post = os.path.join(self.root, "content", "dev_diary", "a.md")
+        self.template = os.path.join(self.root, "dev_diary_template.html")
+        self.page = os.path.join(self.root, "content", "about.md")
+        for path in (self.post, self.template, self.page):
+            write_file(path, "x")
+        self.manifest = BuildManifest.load(os.path.join(self.root, ".cache", "m.json"), self.root)
+        self.manifest.record("post:a.md", [self.post, self.template], [])
+        self.manifest.record("blog-index", [self.post], [])
+        self.manifest.record("page:about.md", [self.page], [])
+
+
+class TestSnapshot(WatchCase):
+    def test_walks_directories_and_files(self):
+        state = snapshot([os.path.join(self.root, "content"), self.template])
+        self.assertEqual(set(state), {self.post, self.page, self.template})
+
+    def test_missing_paths_are_ignored(self):
+        self.assertEqual(snapshot([os.path.join(self.root, "nope")]), {})
+
+    def test_diff_splits_changed_added_removed(self):
+        before = snapshot([os.path.join(self.root, "content")])
+        os.remove(self.page)
+        write_file(self.post, "longer")
+        new = os.path.join(self.root, "content", "new.md")
+        write_file(new, "y")
+        after = snapshot([os.path.join(self.root, "content")])
+        self.assertEqual(diff(before, after), ({self.post}, {new}, {self.page}))
+
+
+class TestAffectedTargets(WatchCase):
+    def test_post_edit_rebuilds_post_and_index_only(self):
+        self.assertEqual(
+            affected_targets(self.manifest, {self.post}, set(), set()),
+            {"post:a.md", "blog-index"},
+        )
+
+    def test_template_edit_rebuilds_its_readers(self):
+        self.assertEqual(affected_targets(self.manifest, {self.template}, set(), set()), {"post:a.md"})
+
+    def test_new_file_falls_back_to_full_incremental_build(self):
+        self.assertIsNone(affected_targets(self.manifest, set(), {self.post}, set()))
+
+    def test_unknown_file_falls_back_to_full_incremental_build(self):
+        stray = os.path.join(self.root, "content", "failed.md")
+        self.assertIsNone(affected_targets(self.manifest, {stray}, set(), set()))
+
+    def test_page_that_failed_to_build_falls_back_to_full_incremental_build(self):
+        self.manifest.record("landing", [self.page], [])
+        self.manifest.forget("page:about.md")
+        self.assertIsNone(affected_targets(self.manifest, {self.page}, set(), set()))
+
+
+if __name__ == "__main__":
+    unittest.main()
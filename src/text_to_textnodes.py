@@ -1,23 +1,132 @@
-from split_images_and_links import *
-from split_nodes import split_nodes_delimiter
+from md_patterns import EMPHASIS, INLINE_TOKEN
 from textnode import TextNode, TextType
 
+_inline_tokens = INLINE_TOKEN.finditer
+# split_nodes_delimiter's single-character patterns
+_STAR_ITALIC = EMPHASIS["*"]
+_UNDERSCORE_ITALIC = EMPHASIS["_"]
+
+
+def _plain(text, out):
+    out.append(TextNode(text, TextType.PLAIN_TEXT))
+
+
+def _italic(text, pattern, out, rest=_plain):
+    # Matching within the stretch alone makes its ends count as non-word
+    # characters for the lookarounds, as they did for each separate node.
+    pos = 0
+    for m in pattern.finditer(text):
+        if m.start() > pos:
+            rest(text[pos:m.start()], out)
+        out.append(TextNode(m.group(1), TextType.ITALIC_TEXT))
+        pos = m.end()
+    if pos < len(text):
+        rest(text[pos:], out)
+
+
+def _underscores(text, out):
+    if "_" in text:
+        _italic(text, _UNDERSCORE_ITALIC, out)
+    else:
+        _plain(text, out)
+
+
+def _emphasis(text, out):
+    # *italic* first, then _italic_ in what is left, as the passes did
+    if "*" in text:
+        _italic(text, _STAR_ITALIC, out, rest=_underscores)
+    else:
+        _underscores(text, out)
+
 
 def text_to_textnodes(text):
-    nodes = [TextNode(text, TextType.PLAIN_TEXT)]
-    # CODE FIRST - to protect content like Req_bot from delimiter processing
-    nodes = split_nodes_delimiter(nodes, "`", TextType.CODE_TEXT)
-    # images and links NEXT (before delimiters, to avoid processing underscores in URLs)
-    nodes = split_nodes_image(nodes)
-    nodes = split_nodes_link(nodes)
-    # bold next (both ** and __)
-    nodes = split_nodes_delimiter(nodes, "**", TextType.BOLD_TEXT)
-    nodes = split_nodes_delimiter(nodes, "__", TextType.BOLD_TEXT)
-    # italic last (both * and _)
-    nodes = split_nodes_delimiter(nodes, "*", TextType.ITALIC_TEXT)
-    nodes = split_nodes_delimiter(nodes, "_", TextType.ITALIC_TEXT)
-    return nodes
-    
+    """Split inline markdown into TextNodes in one left-to-right scan.
+
+    Produces exactly what the seven split passes produced (kept as
+    text_to_textnodes_multipass in scripts/benchmark.py): backtick code spans win over
+    everything, then images and links (so underscores in URLs stay put),
+    then ** and __ bold, then * and _ italic (so snake_case stays put).
+    One regex scan finds the code, link and bold tokens; each plain
+    stretch between them is checked for italics once, and no
+    intermediate node lists are built, so the cost is linear in the
+    length of the text.
+
+    An unclosed ` and an unmatched ** or __ are kept as literal text, and
+    what follows is parsed as if the delimiter were not there: one stray
+    ** in a post costs its bold, not the page. (The multipass pipeline
+    raises instead; this is the only place the two differ.) Never raises
+    for any text.
+    """
+    out = []
+    in_code = bold = under = False
+    start = 0  # of the open code span, bold run or plain stretch
+    # Every ` is a token (links exclude them) and code spans pair them in
+    # order, so with an odd count the last one is the unclosed one.
+    literal_tick = text.rfind("`") if text.count("`") % 2 else -1
+
+    def end_stretch(pos):
+        # A plain stretch ends at every token
+        nonlocal under
+        if under:
+            # Nothing lies between an unmatched __ and the next token
+            _plain("__", out)
+            under = False
+        if pos > start:
+            _emphasis(text[start:pos], out)
 
+    def end_segment(pos):
+        # ...and ** pairs may not cross code, images or links either
+        nonlocal bold
+        if bold:
+            # Between an unmatched ** and the segment's end there can only
+            # be __ tokens, so the re-parse is one level deep and each
+            # character is scanned at most twice.
+            _plain("**", out)
+            out.extend(text_to_textnodes(text[start:pos]))
+            bold = False
+        else:
+            end_stretch(pos)
 
+    for m in _inline_tokens(text):
+        token = m.group()
+        pos = m.start()
+        if in_code:
+            if token == "`":
+                if pos > start:
+                    out.append(TextNode(text[start:pos], TextType.CODE_TEXT))
+                in_code = False
+                start = pos + 1
+        elif token == "`":
+            if pos == literal_tick:
+                continue  # plain text, part of the stretch around it
+            end_segment(pos)
+            in_code = True
+            start = pos + 1
+        elif token[0] in "![":
+            end_segment(pos)
+            text_type = TextType.IMAGES if m.group(1) else TextType.LINKS
+            out.append(TextNode(m.group(2), text_type, m.group(3)))
+            start = m.end()
+        elif token == "**":
+            if bold:
+                if pos > start:
+                    out.append(TextNode(text[start:pos], TextType.BOLD_TEXT))
+                bold = False
+            else:
+                end_stretch(pos)
+                bold = True
+            start = pos + 2
+        elif bold:
+            continue  # __ inside ** is literal
+        elif under:
+            if pos > start:
+                out.append(TextNode(text[start:pos], TextType.BOLD_TEXT))
+            under = False
+            start = pos + 2
+        else:
+            end_stretch(pos)
+            under = True
+            start = pos + 2
 
+    end_segment(len(text))
+    return out